@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+#
+# Latency probe: pad press -> decode -> callback -> LED write.
+# Works with Pro and Pro Mk3; measures the RGB and the palette path.
+#
+# Without arguments, the attached Launchpad is used and its reply to a SysEx
+# identity request serves as the "press".
+# With a search string as argument, e.g. "through", that MIDI port is opened as
+# a loopback (its output must come back in at its input) and real note-ons are
+# sent around.
+#
+
+import sys
+
+import launchpad_py.launchpad_pro
+import launchpad_py.launchpad_pro_mk3
+from launchpad_py.latency import LatencyProbe
+
+
+def main():
+
+	loopback = len(sys.argv) > 1
+
+	if loopback:
+		lp = launchpad_py.launchpad_pro.LaunchpadPro()
+		if not lp.open(0, sys.argv[1]):
+			print("Meh, could not open loopback port " + sys.argv[1])
+			return
+		print("Loopback " + sys.argv[1])
+
+	elif launchpad_py.launchpad_pro_mk3.LaunchpadProMk3().check(0):
+		lp = launchpad_py.launchpad_pro_mk3.LaunchpadProMk3()
+		if not lp.open(0):
+			return
+		print("Launchpad Pro Mk3")
+
+	elif launchpad_py.launchpad_pro.LaunchpadPro().check(0):
+		lp = launchpad_py.launchpad_pro.LaunchpadPro()
+		if not lp.open(0, "pad pro"):
+			return
+		print("Launchpad Pro")
+
+	else:
+		print("Did not find any Launchpads, meh...")
+		return
+
+	for path in ("rgb", "palette"):
+		probe = LatencyProbe(lp, path=path, loopback=loopback)
+		probe.run(count=200)
+		print(probe.format_report())
+		print("---")
+
+	lp.reset()
+	lp.close()
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+#
+# Effects demo for Pro and Pro Mk3: fire, plasma, ripples and life,
+# rendered by launchpad_py.effects and paced by launchpad_py.animation.
+#
+#  - grid pads           -> ripple (ripple effect) or toggle a cell (life)
+#  - right column, 2nd   -> next effect
+#  - right column, top   -> EXIT
+#
+
+import launchpad_py.launchpad_pro
+import launchpad_py.launchpad_pro_mk3
+from launchpad_py.animation import Animation
+from launchpad_py import effects
+
+from pygame import time
+
+
+def main():
+
+	if launchpad_py.launchpad_pro_mk3.LaunchpadProMk3().check(0):
+		lp = launchpad_py.launchpad_pro_mk3.LaunchpadProMk3()
+		if not lp.open(0):
+			return
+		print("Launchpad Pro Mk3")
+
+	elif launchpad_py.launchpad_pro.LaunchpadPro().check(0):
+		lp = launchpad_py.launchpad_pro.LaunchpadPro()
+		if not lp.open(0, "pad pro"):
+			return
+		print("Launchpad Pro")
+
+	else:
+		print("Did not find any Launchpads, meh...")
+		return
+
+	lp.reset()
+	lp.midi.StartWriter()
+
+	fx = [ effects.Fire(), effects.Plasma(), effects.Ripple(), effects.Life() ]
+	current = [ 0 ]
+
+	anim = Animation( lp, lambda n, t: fx[ current[0] ].step(), fps = 30 )
+	anim.start()
+
+	while True:
+		but = lp.ButtonStateRaw()
+		if but == []:
+			time.wait( 5 )
+			continue
+
+		number, value = but
+		if value == 0:
+			continue
+
+		if number == 89:
+			break
+
+		if number == 79:
+			current[0] = ( current[0] + 1 ) % len( fx )
+			print( type( fx[ current[0] ] ).__name__ )
+			continue
+
+		row = 8 - number // 10
+		col = number % 10 - 1
+		if 0 <= row < 8 and 0 <= col < 8:
+			effect = fx[ current[0] ]
+			if isinstance( effect, effects.Ripple ):
+				effect.press( col, row )
+			elif isinstance( effect, effects.Life ):
+				effect.toggle( col, row )
+
+	anim.stop()
+	print( anim.stats() )
+
+	lp.midi.StopWriter()
+	lp.reset()
+	lp.close()
+
+
+if __name__ == '__main__':
+	main()
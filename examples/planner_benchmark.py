@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+#
+# Update planner benchmark, no Launchpad required.
+#
+# Runs a few typical animations and compares the bytes on the wire of
+#  - "per pad": one LedCtrlRaw() per changed pad (FrameBuffer without planner)
+#  - "planner": the planner's cheapest combination of fill, row/column, palette
+#               and multi-LED RGB messages
+# for the Pro and the Pro Mk3.
+#
+
+import numpy as np
+
+from launchpad_py import effects
+from launchpad_py.charset import render_text
+from launchpad_py.planner import Planner
+
+
+# a few palette entries, assumed to look exactly like these RGB values
+PALETTE = { 0: ( 0, 0, 0 ), 5: ( 63, 0, 0 ), 21: ( 0, 63, 0 ) }
+
+# bytes of one LedCtrlRaw(), including F0/F7
+PER_PAD = { "pro": 12, "promk3": 13 }
+
+FRAMES = 300
+
+
+def trace_effect( effect ):
+	return [ effect.step() for i in range( FRAMES ) ]
+
+
+def trace_ripple():
+	fx = effects.Ripple( seed = 1 )
+	frames = []
+	for i in range( FRAMES ):
+		if i % 20 == 0:
+			fx.press( i % 8, ( i // 8 ) % 8 )
+		frames.append( fx.step() )
+	return frames
+
+
+def trace_ticker():
+	bitmap = render_text( "  HELLO LAUNCHPAD  ", proportional = True )
+	frames = []
+	for i in range( FRAMES ):
+		x = i % max( bitmap.shape[1] - 8, 1 )
+		frame = np.zeros( ( 8, 8, 3 ), dtype = np.uint8 )
+		frame[ bitmap[ :, x:x + 8 ] ] = ( 63, 0, 0 )
+		frames.append( frame )
+	return frames
+
+
+def trace_pages():
+	# switching between two mostly uniform UI pages every 10 frames
+	a = np.zeros( ( 8, 8, 3 ), dtype = np.uint8 )
+	a[:] = ( 0, 63, 0 )
+	a[ 2:4, 2:6 ] = ( 63, 0, 0 )
+	b = np.zeros( ( 8, 8, 3 ), dtype = np.uint8 )
+	b[:] = ( 63, 0, 0 )
+	b[ 6, : ] = ( 10, 20, 30 )
+	return [ a if ( i // 10 ) % 2 else b for i in range( FRAMES ) ]
+
+
+def measure( model, frames ):
+	planner = Planner( model, PALETTE )
+	naive = 0
+	planned = 0
+	old = None
+	for frame in frames:
+		if old is None:
+			naive += 64 * PER_PAD[ model ]
+		else:
+			naive += int( ( frame != old ).any( axis = 2 ).sum() ) * PER_PAD[ model ]
+		planned += planner.plan_grid( old, frame )[1]
+		old = frame
+	return naive, planned
+
+
+def main():
+
+	traces = [
+		( "fire", trace_effect( effects.Fire( seed = 1 ) ) ),
+		( "plasma", trace_effect( effects.Plasma() ) ),
+		( "ripple", trace_ripple() ),
+		( "life", trace_effect( effects.Life( color = ( 0, 63, 0 ), seed = 1 ) ) ),
+		( "ticker", trace_ticker() ),
+		( "pages", trace_pages() ),
+	]
+
+	print( "%-8s %-7s %10s %10s %7s" % ( "trace", "model", "per pad", "planner", "saved" ) )
+	for name, frames in traces:
+		for model in ( "pro", "promk3" ):
+			naive, planned = measure( model, frames )
+			print( "%-8s %-7s %10d %10d %6.1f%%" % ( name, model, naive, planned, 100.0 * ( naive - planned ) / max( naive, 1 ) ) )
+
+
+if __name__ == '__main__':
+	main()
@@ -1,13 +1,61 @@
-from launchpad_py.launchpad import Launchpad
-from launchpad_py.launchpad_pro import LaunchpadPro
-from launchpad_py.launchpad_mk2 import LaunchpadMk2
-from launchpad_py.launch_control_xl import LaunchControlXL
-from launchpad_py.launch_control import LaunchControl
-from launchpad_py.launch_key_mini import LaunchKeyMini
-from launchpad_py.dicer import Dicer
-from launchpad_py.launchpad_mini_mk3 import LaunchpadMiniMk3
-from launchpad_py.launchpad_lpx import LaunchpadLPX
-from launchpad_py.midi_fighter64 import MidiFighter64
-from launchpad_py.midi_fighter_3d import MidiFighter3D
-from launchpad_py.launchpad_pro_mk3 import LaunchpadProMk3
-from launchpad_py import charset
+import importlib
+import importlib.util
+
+# Registry of all device classes. Nothing is imported before a class is accessed for
+# the first time, e.g. via "launchpad_py.LaunchpadPro", so importing the package stays
+# cheap and only the model that's actually used is loaded (with PyGame).
+#   <class name>: {
+#     'module': <module>,
+#     'name':   <default search string>,
+#     'family': <family code of the SysEx identity reply>, see detect.detect()
+#     'skip':   <port name parts of secondary ports; ignored, even if they answer>
+#   }
+DEVICES = {
+    'LaunchpadPro': {
+        'module': 'launchpad_py.launchpad_pro',
+        'name': 'Launchpad Pro',
+        'family': (0x51, 0x00),
+        'skip': (),
+    },
+    'LaunchpadProMk3': {
+        'module': 'launchpad_py.launchpad_pro_mk3',
+        'name': 'ProMk3',
+        'family': (0x23, 0x01),
+        'skip': ('DAW', 'DIN'),
+    },
+}
+
+__all__ = ['DEVICES', 'device_class'] + list(DEVICES)
+
+
+def device_class(name):
+    """
+    Returns the device class registered as <name>, e.g. "LaunchpadPro", importing its
+    module if necessary. Raises KeyError for unknown names.
+    """
+
+    cls = globals().get(name)
+    if cls is None:
+        module = importlib.import_module(DEVICES[name]['module'])
+        cls = getattr(module, name)
+        globals()[name] = cls
+
+    return cls
+
+
+def __getattr__(name):
+    """
+    Loads device classes and submodules (e.g. "launchpad_py.charset") on first access.
+    """
+
+    if name in DEVICES:
+        return device_class(name)
+
+    if not name.startswith('_') and importlib.util.find_spec(__name__ + '.' + name) is not None:
+        return importlib.import_module(__name__ + '.' + name)
+
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,133 @@
+import threading
+import time
+from collections import deque
+
+from launchpad_py.framebuffer import FrameBuffer
+from launchpad_py.latency import percentiles
+from launchpad_py.midi import Midi
+
+__all__ = ['Animation']
+
+
+class Animation(object):
+    """
+    Runs a render callback at a fixed frame rate.
+
+    <render>( <n>, <t> ) is called with the frame number and the time in seconds since
+    start and returns the next frame (see FrameBuffer) or None to end the animation.
+    Frames are scheduled on absolute deadlines, start + n / <fps>, so the render cost
+    doesn't add up as drift. The wait is a sleep until <spin_ms> before the deadline,
+    then a busy wait for the rest, as sleeping alone is only accurate to a few ms.
+    If a frame took so long that the next deadlines already passed, those frames are
+    dropped (counted, not rendered) instead of rushing to catch up.
+
+    <target> is a device, whose grid is then driven by a FrameBuffer on output <lane>,
+    or anything with a submit( <frame> ) method, e.g. a FrameBuffer or a Canvas.
+    """
+
+    def __init__(self, target, render, fps=30, lane=Midi.BULK, spin_ms=2.0, history=1000):
+        if hasattr(target, 'submit'):
+            self.target = target
+        else:
+            self.target = FrameBuffer(target, lane=lane)
+
+        self.render = render
+        self.fps = fps
+        self.spin_ms = spin_ms
+
+        self.frames = 0  # frames rendered and submitted
+        self.dropped = 0  # deadlines skipped because a frame ran late
+        self.frame_ms = deque(maxlen=history)  # render + submit time of the recent frames
+        self.jitter_ms = deque(maxlen=history)  # start of the recent frames after their deadline
+
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _wait_until(self, deadline):
+        spin = int(self.spin_ms * 1000000)
+        while True:
+            left = deadline - time.perf_counter_ns()
+            if left <= 0:
+                return
+            if left > spin:
+                time.sleep((left - spin) / 1e9)
+
+    def run(self, duration_s=None, frames=None):
+        """
+        Runs the animation in the calling thread until render() returns None, stop() is
+        called, <duration_s> passed or <frames> frames were shown.
+        Returns the number of frames shown.
+        """
+
+        self._stop.clear()
+        return self._run(duration_s, frames)
+
+    def _run(self, duration_s, frames):
+        # doesn't clear the stop event: a stop() right after start() must not get lost
+        period = 1000000000 // self.fps
+        start = time.perf_counter_ns()
+        end = start + int(duration_s * 1e9) if duration_s is not None else None
+        shown = 0
+        n = 0
+
+        while not self._stop.is_set():
+            if frames is not None and shown >= frames:
+                break
+
+            deadline = start + n * period
+            if end is not None and deadline >= end:
+                break
+            self._wait_until(deadline)
+
+            began = time.perf_counter_ns()
+            frame = self.render(n, (deadline - start) / 1e9)
+            if frame is None:
+                break
+            self.target.submit(frame)
+            done = time.perf_counter_ns()
+
+            self.frames += 1
+            self.frame_ms.append((done - began) / 1e6)
+            self.jitter_ms.append((began - deadline) / 1e6)
+            shown += 1
+
+            # next deadline that's still ahead; everything in between is dropped
+            late = (done - deadline) // period
+            self.dropped += max(late, 0)
+            n += max(late, 0) + 1
+
+        return shown
+
+    def start(self, duration_s=None, frames=None):
+        """
+        Runs the animation in a background thread, see run().
+        """
+
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, args=(duration_s, frames),
+                                            name="Animation", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """
+        Stops the animation and waits for the background thread, if any.
+        """
+
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def stats(self):
+        """
+        Returns a dict with the frame and drop counters and the percentiles (50, 90, 99, max)
+        of the recent frame times and the jitter (start after deadline), in ms.
+        """
+
+        ret = {'frames': self.frames, 'dropped': self.dropped}
+        for name, values in (('frame', self.frame_ms), ('jitter', self.jitter_ms)):
+            for p, value in percentiles(list(values)).items():
+                ret['%s_%s_ms' % (name, p if p == 'max' else 'p%d' % p)] = value
+
+        return ret
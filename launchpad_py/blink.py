@@ -0,0 +1,228 @@
+import itertools
+import math
+import threading
+import time
+
+from launchpad_py.midi import Midi
+
+__all__ = ['BeatClock', 'Blinker']
+
+
+class BeatClock(object):
+    """
+    Sends MIDI beat clock (248, 24 per beat) to a device at <bpm>, from a background thread.
+
+    The Pro and Pro Mk3 time their pulsing and flashing LEDs by that clock (40..240 BPM).
+    Unlike led_ctrl_bpm(), which only sends a short burst, this keeps them in sync for
+    as long as it runs; ticks are scheduled on absolute deadlines, so they don't drift.
+    The clock costs one byte per tick and is sent via the interactive output lane.
+    """
+
+    PPQ = 24
+
+    def __init__(self, device, bpm=120):
+        self.device = device
+        self._bpm = bpm
+        self._changed = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def bpm(self):
+        return self._bpm
+
+    @bpm.setter
+    def bpm(self, bpm):
+        self._bpm = bpm
+        self._changed.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._changed.clear()
+            period = 60.0 / (self._bpm * self.PPQ)
+            start = time.perf_counter()
+            for n in itertools.count(1):
+                if self._stop.is_set() or self._changed.is_set():
+                    break
+                with self.device.midi.Lane(Midi.INTERACTIVE):
+                    self.device.midi.RawWrite(248, 0, 0)
+                left = start + n * period - time.perf_counter()
+                if left > 0:
+                    self._stop.wait(left)
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="BeatClock", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+
+class Blinker(object):
+    """
+    Blinking and pulsing regions, e.g. cursors or beat indicators, preferably done by
+    the device itself.
+
+    blink() and pulse() take a list of LED numbers, a color and a period in beats at
+    <bpm>. If possible, the device's own flash and pulse modes are used, which cost
+    nothing after the first message per LED. That requires a palette colorcode and,
+    because the device blinks once per clock beat, the same period for all hardware
+    regions: the first one sets the BeatClock to <bpm> / <beats>, which must be within
+    40..240. Everything else, RGB colors ( <r>, <g>, <b> ) and other periods, is
+    animated by a software thread at <fps>, at the same tempo.
+
+    With <clock> set to False, no clock is sent, e.g. because the device gets it from
+    elsewhere (a DAW); hardware regions then blink at that clock with <beats> = 1.
+    """
+
+    MIN_BPM = 40
+    MAX_BPM = 240
+
+    def __init__(self, device, bpm=120, clock=True, fps=30):
+        self.device = device
+        self.bpm = bpm
+        self.fps = fps
+
+        self.clock = BeatClock(device, bpm) if clock else None
+        self.regions = {}  # <id>: <region dict>
+        self.hw_beats = None  # period of the hardware regions, while there are any
+
+        self._ids = itertools.count(1)
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _hardware(self, color, beats):
+        if not isinstance(color, int):
+            return False
+        if self.clock is None:
+            return beats == 1
+        if self.hw_beats is not None:
+            return beats == self.hw_beats
+        return self.MIN_BPM <= self.bpm / beats <= self.MAX_BPM
+
+    def _add(self, kind, pads, color, beats, off):
+        pads = list(pads)
+        region = {'kind': kind, 'pads': pads, 'color': color, 'beats': beats, 'off': off, 'shown': None}
+
+        with self._lock:
+            region['hw'] = self._hardware(color, beats)
+            if region['hw']:
+                if self.hw_beats is None and self.clock is not None:
+                    self.clock.bpm = self.bpm / beats
+                    self.clock.start()
+                self.hw_beats = beats
+                for number in pads:
+                    if kind == 'blink':
+                        # flashing alternates between the static color and the flash color
+                        self._set(number, off)
+                        self.device.LedCtrlFlashByCode(number, color)
+                    else:
+                        self.device.LedCtrlPulseByCode(number, color)
+            else:
+                self._start_thread()
+
+            rid = next(self._ids)
+            self.regions[rid] = region
+
+        return rid
+
+    def blink(self, pads, color, beats=1, off=0):
+        """
+        Blinks LEDs <pads> between <color> and <off> (a colorcode or RGB tuple), one full
+        cycle every <beats> beats. Returns the region's id, for stop().
+        """
+
+        return self._add('blink', pads, color, beats, off)
+
+    def pulse(self, pads, color, beats=1):
+        """
+        Pulses LEDs <pads> in <color>, one cycle every <beats> beats. In software, palette
+        colors can't fade and blink instead. Returns the region's id, for stop().
+        """
+
+        return self._add('pulse', pads, color, beats, 0)
+
+    def stop(self, rid, color=None):
+        """
+        Ends region <rid> and sets its LEDs to <color>; its "off" color, if omitted.
+        """
+
+        with self._lock:
+            region = self.regions.pop(rid)
+            if region['hw'] and not any(r['hw'] for r in self.regions.values()):
+                self.hw_beats = None
+                if self.clock is not None:
+                    self.clock.stop()
+
+            for number in region['pads']:
+                self._set(number, region['off'] if color is None else color)
+
+    def _set(self, number, color):
+        if isinstance(color, int):
+            self.device.LedCtrlRawByCode(number, color)
+        else:
+            self.device.LedCtrlRaw(number, color[0], color[1], color[2])
+
+    def _software(self, region, now):
+        phase = (now * self.bpm / 60.0 / region['beats']) % 1.0
+        color = region['color']
+
+        if region['kind'] == 'pulse' and not isinstance(color, int):
+            level = 0.5 - 0.5 * math.cos(2.0 * math.pi * phase)
+            shown = tuple(int(round(c * level)) for c in color)
+        else:
+            shown = color if phase < 0.5 else region['off']
+
+        if shown != region['shown']:
+            region['shown'] = shown
+            with self.device.midi.Lane(Midi.BULK):
+                for number in region['pads']:
+                    self._set(number, shown)
+
+    def tick(self):
+        """
+        Updates all software regions once; called by the thread.
+        """
+
+        now = time.perf_counter() - self._start
+        with self._lock:
+            for region in self.regions.values():
+                if not region['hw']:
+                    self._software(region, now)
+
+    def _run(self):
+        period = 1.0 / self.fps
+        n = 0
+        while not self._stop.is_set():
+            self.tick()
+            n += 1
+            left = self._start + n * period - time.perf_counter()
+            if left > 0:
+                self._stop.wait(left)
+            else:
+                n = int((time.perf_counter() - self._start) / period)
+
+    def _start_thread(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="Blinker", daemon=True)
+            self._thread.start()
+
+    def close(self):
+        """
+        Stops the threads; LEDs keep their current state.
+        """
+
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        if self.clock is not None:
+            self.clock.stop()
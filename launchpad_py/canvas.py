@@ -0,0 +1,109 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from launchpad_py.framebuffer import FrameBuffer
+
+__all__ = ['Canvas']
+
+
+class Canvas(object):
+    """
+    One virtual RGB surface, tiled from the 8x8 grids of several devices.
+
+    <layout> is a list of ( <device>, <x>, <y> ), with <x>/<y> being the canvas position
+    of each device's top left grid pad, e.g. four Pros as a 16x16 surface:
+      [ ( lp1, 0, 0 ), ( lp2, 8, 0 ), ( lp3, 0, 8 ), ( lp4, 8, 8 ) ]
+    Frames are ( <height>, <width>, 3 ) arrays of RGB intensities 0..63, see FrameBuffer.
+    """
+
+    def __init__(self, layout, concurrent=True):
+        """
+        With <concurrent>, all devices are updated in parallel, one thread each.
+        """
+
+        self.tiles = [(device, x, y, FrameBuffer(device)) for device, x, y in layout]
+        self.width = max(x + FrameBuffer.WIDTH for _, x, _, _ in self.tiles)
+        self.height = max(y + FrameBuffer.HEIGHT for _, _, y, _ in self.tiles)
+
+        self._pool = None
+        if concurrent and len(self.tiles) > 1:
+            self._pool = ThreadPoolExecutor(max_workers=len(self.tiles), thread_name_prefix="Canvas")
+
+        # optional callback( <device>, <event> ) for everything that has no place on the canvas;
+        # outer buttons and pressure, as returned by the device's ButtonStateRaw()
+        self.on_other = None
+
+        self._next = 0  # device to read from first, so no device can starve the others
+
+    def new_frame(self):
+        """
+        Returns an empty (black) frame of the canvas' size.
+        """
+
+        return np.zeros((self.height, self.width, 3), dtype=np.uint8)
+
+    def submit(self, frame):
+        """
+        Splits <frame> into the devices' grids and sends what changed, to all devices at
+        the same time. Returns the number of pads sent.
+        """
+
+        frame = np.asarray(frame)
+        if frame.shape[:2] != (self.height, self.width):
+            raise ValueError("frame must be %dx%d, got %dx%d" % (self.width, self.height, frame.shape[1], frame.shape[0]))
+        jobs = [(fb, frame[y:y + FrameBuffer.HEIGHT, x:x + FrameBuffer.WIDTH]) for _, x, y, fb in self.tiles]
+
+        if self._pool is None:
+            return sum(fb.submit(tile) for fb, tile in jobs)
+
+        futures = [self._pool.submit(fb.submit, tile) for fb, tile in jobs]
+        return sum(f.result() for f in futures)
+
+    def invalidate(self):
+        """
+        Makes the next submit() send all pads of all devices.
+        """
+
+        for _, _, _, fb in self.tiles:
+            fb.invalidate()
+
+    def ButtonStateXY(self, returnPressure=False, returnTimestamp=False):
+        """
+        Returns the next grid button event of any device as [ <x>, <y>, <value> ] in canvas
+        coordinates, or [] if nothing happened. With <returnTimestamp>, the PortMidi
+        timestamp is appended.
+        Outer buttons and pressure events (with <returnPressure>) are passed to the
+        <on_other> callback instead, if set.
+        """
+
+        n = len(self.tiles)
+        for i in range(n):
+            device, x, y, _ = self.tiles[(self._next + i) % n]
+            while True:
+                event = device.ButtonStateRaw(returnPressure=returnPressure, returnTimestamp=True)
+                if event == []:
+                    break
+
+                row = 8 - event[0] // 10
+                col = event[0] % 10 - 1
+                if event[0] != 255 and 0 <= row < 8 and 0 <= col < 8:
+                    self._next = (self._next + i + 1) % n
+                    ret = [x + col, y + row, event[1]]
+                    if returnTimestamp:
+                        ret.append(event[2])
+                    return ret
+
+                if self.on_other is not None:
+                    self.on_other(device, event if returnTimestamp else event[:2])
+
+        return []
+
+    def close(self):
+        """
+        Stops the update threads; the devices stay open.
+        """
+
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
@@ -2,261 +2,347 @@
 #
 # a simple 8x8 font for the Launchpad
 #
+# One byte per row, eight rows per character, MSB is the leftmost pixel.
+# Stored as a single bytes blob; CHARTAB[<char> * 8 + <row>] still works as before.
+#
+
+__all__ = ['CHARTAB', 'glyphs', 'glyph_widths', 'render_text']
+
+CHARTAB = (b'\x00\x00\x00\x00\x00\x00\x00\x00'  # Char 000 (.)
+           b'\x7E\x81\xA5\x81\xBD\x99\x81\x7E'  # Char 001 (.)
+           b'\x7E\xFF\xDB\xFF\xC3\xE7\xFF\x7E'  # Char 002 (.)
+           b'\x6C\xFE\xFE\xFE\x7C\x38\x10\x00'  # Char 003 (.)
+           b'\x10\x38\x7C\xFE\x7C\x38\x10\x00'  # Char 004 (.)
+           b'\x38\x7C\x38\xFE\xFE\x7C\x38\x7C'  # Char 005 (.)
+           b'\x10\x10\x38\x7C\xFE\x7C\x38\x7C'  # Char 006 (.)
+           b'\x00\x00\x18\x3C\x3C\x18\x00\x00'  # Char 007 (.)
+           b'\xFF\xFF\xE7\xC3\xC3\xE7\xFF\xFF'  # Char 008 (.)
+           b'\x00\x3C\x66\x42\x42\x66\x3C\x00'  # Char 009 (.)
+           b'\xFF\xC3\x99\xBD\xBD\x99\xC3\xFF'  # Char 010 (.)
+           b'\x0F\x07\x0F\x7D\xCC\xCC\xCC\x78'  # Char 011 (.)
+           b'\x3C\x66\x66\x66\x3C\x18\x7E\x18'  # Char 012 (.)
+           b'\x3F\x33\x3F\x30\x30\x70\xF0\xE0'  # Char 013 (.)
+           b'\x7F\x63\x7F\x63\x63\x67\xE6\xC0'  # Char 014 (.)
+           b'\x99\x5A\x3C\xE7\xE7\x3C\x5A\x99'  # Char 015 (.)
+           b'\x80\xE0\xF8\xFE\xF8\xE0\x80\x00'  # Char 016 (.)
+           b'\x02\x0E\x3E\xFE\x3E\x0E\x02\x00'  # Char 017 (.)
+           b'\x18\x3C\x7E\x18\x18\x7E\x3C\x18'  # Char 018 (.)
+           b'\x66\x66\x66\x66\x66\x00\x66\x00'  # Char 019 (.)
+           b'\x7F\xDB\xDB\x7B\x1B\x1B\x1B\x00'  # Char 020 (.)
+           b'\x3C\x66\x38\x6C\x6C\x38\xCC\x78'  # Char 021 (.)
+           b'\x00\x00\x00\x00\x7E\x7E\x7E\x00'  # Char 022 (.)
+           b'\x18\x3C\x7E\x18\x7E\x3C\x18\xFF'  # Char 023 (.)
+           b'\x18\x3C\x7E\x18\x18\x18\x18\x00'  # Char 024 (.)
+           b'\x18\x18\x18\x18\x7E\x3C\x18\x00'  # Char 025 (.)
+           b'\x00\x18\x0C\xFE\x0C\x18\x00\x00'  # Char 026 (.)
+           b'\x00\x30\x60\xFE\x60\x30\x00\x00'  # Char 027 (.)
+           b'\x00\x00\xC0\xC0\xC0\xFE\x00\x00'  # Char 028 (.)
+           b'\x00\x24\x66\xFF\x66\x24\x00\x00'  # Char 029 (.)
+           b'\x00\x18\x3C\x7E\xFF\xFF\x00\x00'  # Char 030 (.)
+           b'\x00\xFF\xFF\x7E\x3C\x18\x00\x00'  # Char 031 (.)
+           b'\x00\x00\x00\x00\x00\x00\x00\x00'  # Char 032 ( )
+           b'\x30\x78\x78\x30\x30\x00\x30\x00'  # Char 033 (!)
+           b'\x6C\x6C\x6C\x00\x00\x00\x00\x00'  # Char 034 (")
+           b'\x6C\x6C\xFE\x6C\xFE\x6C\x6C\x00'  # Char 035 (#)
+           b'\x30\x7C\xC0\x78\x0C\xF8\x30\x00'  # Char 036 ($)
+           b'\x00\xC6\xCC\x18\x30\x66\xC6\x00'  # Char 037 (%)
+           b'\x38\x6C\x38\x76\xDC\xCC\x76\x00'  # Char 038 (&)
+           b'\x60\x60\xC0\x00\x00\x00\x00\x00'  # Char 039 (')
+           b'\x18\x30\x60\x60\x60\x30\x18\x00'  # Char 040 (()
+           b'\x60\x30\x18\x18\x18\x30\x60\x00'  # Char 041 ())
+           b'\x00\x66\x3C\xFF\x3C\x66\x00\x00'  # Char 042 (*)
+           b'\x00\x30\x30\xFC\x30\x30\x00\x00'  # Char 043 (#)
+           b'\x00\x00\x00\x00\x00\x30\x30\x60'  # Char 044 (,)
+           b'\x00\x00\x00\xFC\x00\x00\x00\x00'  # Char 045 (-)
+           b'\x00\x00\x00\x00\x00\x30\x30\x00'  # Char 046 (.)
+           b'\x06\x0C\x18\x30\x60\xC0\x80\x00'  # Char 047 (/)
+           b'\x7C\xC6\xCE\xDE\xF6\xE6\x7C\x00'  # Char 048 (0)
+           b'\x30\x70\x30\x30\x30\x30\x30\x00'  # Char 049 (1)
+           b'\x78\xCC\x0C\x38\x60\xC0\xFC\x00'  # Char 050 (2)
+           b'\x78\xCC\x0C\x38\x0C\xCC\x78\x00'  # Char 051 (3)
+           b'\x1C\x3C\x6C\xCC\xFE\x0C\x0C\x00'  # Char 052 (4)
+           b'\xFC\xC0\xF8\x0C\x0C\xCC\x78\x00'  # Char 053 (5)
+           b'\x38\x60\xC0\xF8\xCC\xCC\x78\x00'  # Char 054 (6)
+           b'\xFC\x0C\x0C\x18\x30\x30\x30\x00'  # Char 055 (7)
+           b'\x78\xCC\xCC\x78\xCC\xCC\x78\x00'  # Char 056 (8)
+           b'\x78\xCC\xCC\x7C\x0C\x18\x70\x00'  # Char 057 (9)
+           b'\x00\x30\x30\x00\x00\x30\x30\x00'  # Char 058 (:)
+           b'\x00\x30\x30\x00\x00\x30\x30\x60'  # Char 059 (;)
+           b'\x18\x30\x60\xC0\x60\x30\x18\x00'  # Char 060 (<)
+           b'\x00\x00\xFC\x00\x00\xFC\x00\x00'  # Char 061 (=)
+           b'\x60\x30\x18\x0C\x18\x30\x60\x00'  # Char 062 (>)
+           b'\x78\xCC\x0C\x18\x30\x00\x30\x00'  # Char 063 (?)
+           b'\x7C\xC6\xDE\xDE\xDE\xC0\x78\x00'  # Char 064 (@)
+           b'\x18\x3C\x66\x66\x7E\x66\x66\x00'  # Char 065 (A)
+           b'\x7C\x66\x66\x7C\x66\x66\x7C\x00'  # Char 066 (B)
+           b'\x3C\x66\xC0\xC0\xC0\x66\x3C\x00'  # Char 067 (C)
+           b'\x78\x6C\x66\x66\x66\x6C\x78\x00'  # Char 068 (D)
+           b'\x7E\x60\x60\x78\x60\x60\x7E\x00'  # Char 069 (E)
+           b'\x7E\x60\x60\x78\x60\x60\x60\x00'  # Char 070 (F)
+           b'\x3C\x66\xC0\xC0\xCE\x66\x3E\x00'  # Char 071 (G)
+           b'\x66\x66\x66\x7E\x66\x66\x66\x00'  # Char 072 (H)
+           b'\x18\x18\x18\x18\x18\x18\x18\x00'  # Char 073 (I)
+           b'\x06\x06\x06\x06\x66\x66\x3C\x00'  # Char 074 (J)
+           b'\x66\x66\x6C\x78\x6C\x66\x66\x00'  # Char 075 (K)
+           b'\x60\x60\x60\x60\x60\x60\x7E\x00'  # Char 076 (L)
+           b'\xC6\xEE\xFE\xFE\xD6\xC6\xC6\x00'  # Char 077 (M)
+           b'\xC6\xE6\xF6\xDE\xCE\xC6\xC6\x00'  # Char 078 (N)
+           b'\x3C\x66\x66\x66\x66\x66\x3C\x00'  # Char 079 (O)
+           b'\x7C\x66\x66\x7C\x60\x60\x60\x00'  # Char 080 (P)
+           b'\x3C\x66\x66\x66\x6E\x3C\x0E\x00'  # Char 081 (Q)
+           b'\x7C\x66\x66\x7C\x6C\x66\x66\x00'  # Char 082 (R)
+           b'\x3C\x66\x70\x38\x0E\x66\x3C\x00'  # Char 083 (S)
+           b'\x7E\x18\x18\x18\x18\x18\x18\x00'  # Char 084 (T)
+           b'\x66\x66\x66\x66\x66\x66\x3E\x00'  # Char 085 (U)
+           b'\x66\x66\x66\x66\x66\x3C\x18\x00'  # Char 086 (V)
+           b'\xC6\xC6\xC6\xD6\xFE\xEE\xC6\x00'  # Char 087 (W)
+           b'\x66\x66\x3C\x18\x3C\x66\x66\x00'  # Char 088 (X)
+           b'\x66\x66\x66\x3C\x18\x18\x18\x00'  # Char 089 (Y)
+           b'\xFE\x06\x0C\x18\x30\x60\xFE\x00'  # Char 090 (Z)
+           b'\x78\x60\x60\x60\x60\x60\x78\x00'  # Char 091 ([)
+           b'\xC0\x60\x30\x18\x0C\x06\x02\x00'  # Char 092 (\)
+           b'\x78\x18\x18\x18\x18\x18\x78\x00'  # Char 093 (])
+           b'\x10\x38\x6C\xC6\x00\x00\x00\x00'  # Char 094 (^)
+           b'\x00\x00\x00\x00\x00\x00\x00\xFF'  # Char 095 (_)
+           b'\x30\x30\x18\x00\x00\x00\x00\x00'  # Char 096 (`)
+           b'\x00\x00\x3C\x06\x3E\x66\x3A\x00'  # Char 097 (a)
+           b'\x60\x60\x60\x7C\x66\x66\x5C\x00'  # Char 098 (b)
+           b'\x00\x00\x3C\x66\x60\x66\x3C\x00'  # Char 099 (c)
+           b'\x06\x06\x06\x3E\x66\x66\x3A\x00'  # Char 100 (d)
+           b'\x00\x00\x3C\x66\x7E\x60\x3C\x00'  # Char 101 (e)
+           b'\x1C\x36\x30\x78\x30\x30\x30\x00'  # Char 102 (f)
+           b'\x00\x00\x3A\x66\x66\x3E\x06\x3C'  # Char 103 (g)
+           b'\x60\x60\x6C\x76\x66\x66\x66\x00'  # Char 104 (h)
+           b'\x18\x00\x18\x18\x18\x18\x18\x00'  # Char 105 (i)
+           b'\x0C\x00\x0C\x0C\x0C\xCC\xCC\x78'  # Char 106 (j)
+           b'\x60\x60\x66\x6C\x78\x6C\x66\x00'  # Char 107 (k)
+           b'\x18\x18\x18\x18\x18\x18\x18\x00'  # Char 108 (l)
+           b'\x00\x00\xC6\xEE\xFE\xD6\xC6\x00'  # Char 109 (m)
+           b'\x00\x00\x7C\x66\x66\x66\x66\x00'  # Char 110 (n)
+           b'\x00\x00\x3C\x66\x66\x66\x3C\x00'  # Char 111 (o)
+           b'\x00\x00\x5C\x66\x66\x7C\x60\x60'  # Char 112 (p)
+           b'\x00\x00\x3A\x66\x66\x3E\x06\x06'  # Char 113 (q)
+           b'\x00\x00\x5C\x76\x60\x60\x60\x00'  # Char 114 (r)
+           b'\x00\x00\x3E\x60\x3C\x06\x7C\x00'  # Char 115 (s)
+           b'\x30\x30\x7C\x30\x30\x34\x18\x00'  # Char 116 (t)
+           b'\x00\x00\x66\x66\x66\x66\x3A\x00'  # Char 117 (u)
+           b'\x00\x00\x66\x66\x66\x3C\x18\x00'  # Char 118 (v)
+           b'\x00\x00\xC6\xD6\xFE\xFE\x6C\x00'  # Char 119 (w)
+           b'\x00\x00\xC6\x6C\x38\x6C\xC6\x00'  # Char 120 (x)
+           b'\x00\x00\x66\x66\x66\x3E\x06\x3C'  # Char 121 (y)
+           b'\x00\x00\x7E\x0C\x18\x30\x7E\x00'  # Char 122 (z)
+           b'\x1C\x30\x30\xE0\x30\x30\x1C\x00'  # Char 123 ({)
+           b'\x18\x18\x18\x00\x18\x18\x18\x00'  # Char 124 (|)
+           b'\xE0\x30\x30\x1C\x30\x30\xE0\x00'  # Char 125 (})
+           b'\x76\xDC\x00\x00\x00\x00\x00\x00'  # Char 126 (~)
+           b'\x00\x10\x38\x6C\xC6\xC6\xFE\x00'  # Char 127 (.)
+           b'\x0E\x1E\x36\x66\x7E\x66\x66\x00'  # Char 128 (.)
+           b'\x7C\x60\x60\x7C\x66\x66\x7C\x00'  # Char 129 (.)
+           b'\x7C\x66\x66\x7C\x66\x66\x7C\x00'  # Char 130 (.)
+           b'\x7E\x60\x60\x60\x60\x60\x60\x00'  # Char 131 (.)
+           b'\x1C\x3C\x6C\x6C\x6C\x6C\xFE\xC6'  # Char 132 (.)
+           b'\x7E\x60\x60\x7C\x60\x60\x7E\x00'  # Char 133 (.)
+           b'\xDB\xDB\x7E\x3C\x7E\xDB\xDB\x00'  # Char 134 (.)
+           b'\x3C\x66\x06\x1C\x06\x66\x3C\x00'  # Char 135 (.)
+           b'\x66\x66\x6E\x7E\x76\x66\x66\x00'  # Char 136 (.)
+           b'\x3C\x66\x6E\x7E\x76\x66\x66\x00'  # Char 137 (.)
+           b'\x66\x6C\x78\x70\x78\x6C\x66\x00'  # Char 138 (.)
+           b'\x0E\x1E\x36\x66\x66\x66\x66\x00'  # Char 139 (.)
+           b'\xC6\xEE\xFE\xFE\xD6\xD6\xC6\x00'  # Char 140 (.)
+           b'\x66\x66\x66\x7E\x66\x66\x66\x00'  # Char 141 (.)
+           b'\x3C\x66\x66\x66\x66\x66\x3C\x00'  # Char 142 (.)
+           b'\x7E\x66\x66\x66\x66\x66\x66\x00'  # Char 143 (.)
+           b'\x7C\x66\x66\x66\x7C\x60\x60\x00'  # Char 144 (.)
+           b'\x3C\x66\x60\x60\x60\x66\x3C\x00'  # Char 145 (.)
+           b'\x7E\x18\x18\x18\x18\x18\x18\x00'  # Char 146 (.)
+           b'\x66\x66\x66\x3E\x06\x66\x3C\x00'  # Char 147 (.)
+           b'\x7E\xDB\xDB\xDB\x7E\x18\x18\x00'  # Char 148 (.)
+           b'\x66\x66\x3C\x18\x3C\x66\x66\x00'  # Char 149 (.)
+           b'\x66\x66\x66\x66\x66\x66\x7F\x03'  # Char 150 (.)
+           b'\x66\x66\x66\x3E\x06\x06\x06\x00'  # Char 151 (.)
+           b'\xDB\xDB\xDB\xDB\xDB\xDB\xFF\x00'  # Char 152 (.)
+           b'\xDB\xDB\xDB\xDB\xDB\xDB\xFF\x03'  # Char 153 (.)
+           b'\xE0\x60\x60\x7C\x66\x66\x7C\x00'  # Char 154 (.)
+           b'\xC6\xC6\xC6\xF6\xDE\xDE\xF6\x00'  # Char 155 (.)
+           b'\x60\x60\x60\x7C\x66\x66\x7C\x00'  # Char 156 (.)
+           b'\x78\x8C\x06\x3E\x06\x8C\x78\x00'  # Char 157 (.)
+           b'\xCE\xDB\xDB\xFB\xDB\xDB\xCE\x00'  # Char 158 (.)
+           b'\x3E\x66\x66\x66\x3E\x36\x66\x00'  # Char 159 (.)
+           b'\x00\x00\x3C\x06\x3E\x66\x3A\x00'  # Char 160 (.)
+           b'\x00\x3C\x60\x3C\x66\x66\x3C\x00'  # Char 161 (.)
+           b'\x00\x00\x7C\x66\x7C\x66\x7C\x00'  # Char 162 (.)
+           b'\x00\x00\x7E\x60\x60\x60\x60\x00'  # Char 163 (.)
+           b'\x00\x00\x1C\x3C\x6C\x6C\xFE\x82'  # Char 164 (.)
+           b'\x00\x00\x3C\x66\x7E\x60\x3C\x00'  # Char 165 (.)
+           b'\x00\x00\xDB\x7E\x3C\x7E\xDB\x00'  # Char 166 (.)
+           b'\x00\x00\x3C\x66\x0C\x66\x3C\x00'  # Char 167 (.)
+           b'\x00\x00\x66\x6E\x7E\x76\x66\x00'  # Char 168 (.)
+           b'\x00\x18\x66\x6E\x7E\x76\x66\x00'  # Char 169 (.)
+           b'\x00\x00\x66\x6C\x78\x6C\x66\x00'  # Char 170 (.)
+           b'\x00\x00\x0E\x1E\x36\x66\x66\x00'  # Char 171 (.)
+           b'\x00\x00\xC6\xFE\xFE\xD6\xD6\x00'  # Char 172 (.)
+           b'\x00\x00\x66\x66\x7E\x66\x66\x00'  # Char 173 (.)
+           b'\x00\x00\x3C\x66\x66\x66\x3C\x00'  # Char 174 (.)
+           b'\x00\x00\x7E\x66\x66\x66\x66\x00'  # Char 175 (.)
+           b'\x11\x44\x11\x44\x11\x44\x11\x44'  # Char 176 (.)
+           b'\x55\xAA\x55\xAA\x55\xAA\x55\xAA'  # Char 177 (.)
+           b'\xDD\x77\xDD\x77\xDD\x77\xDD\x77'  # Char 178 (.)
+           b'\x18\x18\x18\x18\x18\x18\x18\x18'  # Char 179 (.)
+           b'\x18\x18\x18\xF8\x18\x18\x18\x18'  # Char 180 (.)
+           b'\x18\xF8\x18\xF8\x18\x18\x18\x18'  # Char 181 (.)
+           b'\x36\x36\x36\xF6\x36\x36\x36\x36'  # Char 182 (.)
+           b'\x00\x00\x00\xFE\x36\x36\x36\x36'  # Char 183 (.)
+           b'\x00\xF8\x18\xF8\x18\x18\x18\x18'  # Char 184 (.)
+           b'\x36\xF6\x06\xF6\x36\x36\x36\x36'  # Char 185 (.)
+           b'\x36\x36\x36\x36\x36\x36\x36\x36'  # Char 186 (.)
+           b'\x00\xFE\x06\xF6\x36\x36\x36\x36'  # Char 187 (.)
+           b'\x36\xF6\x06\xFE\x00\x00\x00\x00'  # Char 188 (.)
+           b'\x36\x36\x36\xFE\x00\x00\x00\x00'  # Char 189 (.)
+           b'\x18\xF8\x18\xF8\x00\x00\x00\x00'  # Char 190 (.)
+           b'\x00\x00\x00\xF8\x18\x18\x18\x18'  # Char 191 (.)
+           b'\x18\x18\x18\x1F\x00\x00\x00\x00'  # Char 192 (.)
+           b'\x18\x18\x18\xFF\x00\x00\x00\x00'  # Char 193 (.)
+           b'\x00\x00\x00\xFF\x18\x18\x18\x18'  # Char 194 (.)
+           b'\x18\x18\x18\x1F\x18\x18\x18\x18'  # Char 195 (.)
+           b'\x00\x00\x00\xFF\x00\x00\x00\x00'  # Char 196 (.)
+           b'\x18\x18\x18\xFF\x18\x18\x18\x18'  # Char 197 (.)
+           b'\x18\x1F\x18\x1F\x18\x18\x18\x18'  # Char 198 (.)
+           b'\x36\x36\x36\x37\x36\x36\x36\x36'  # Char 199 (.)
+           b'\x36\x37\x30\x3F\x00\x00\x00\x00'  # Char 200 (.)
+           b'\x00\x3F\x30\x37\x36\x36\x36\x36'  # Char 201 (.)
+           b'\x36\xF7\x00\xFF\x00\x00\x00\x00'  # Char 202 (.)
+           b'\x00\xFF\x00\xF7\x36\x36\x36\x36'  # Char 203 (.)
+           b'\x36\x37\x30\x37\x36\x36\x36\x36'  # Char 204 (.)
+           b'\x00\xFF\x00\xFF\x00\x00\x00\x00'  # Char 205 (.)
+           b'\x36\xF7\x00\xF7\x36\x36\x36\x36'  # Char 206 (.)
+           b'\x18\xFF\x00\xFF\x00\x00\x00\x00'  # Char 207 (.)
+           b'\x36\x36\x36\xFF\x00\x00\x00\x00'  # Char 208 (.)
+           b'\x00\xFF\x00\xFF\x18\x18\x18\x18'  # Char 209 (.)
+           b'\x00\x00\x00\xFF\x36\x36\x36\x36'  # Char 210 (.)
+           b'\x36\x36\x36\x3F\x00\x00\x00\x00'  # Char 211 (.)
+           b'\x18\x1F\x18\x1F\x00\x00\x00\x00'  # Char 212 (.)
+           b'\x00\x1F\x18\x1F\x18\x18\x18\x18'  # Char 213 (.)
+           b'\x00\x00\x00\x3F\x36\x36\x36\x36'  # Char 214 (.)
+           b'\x36\x36\x36\xFF\x36\x36\x36\x36'  # Char 215 (.)
+           b'\x18\xFF\x18\xFF\x18\x18\x18\x18'  # Char 216 (.)
+           b'\x18\x18\x18\xF8\x00\x00\x00\x00'  # Char 217 (.)
+           b'\x00\x00\x00\x1F\x18\x18\x18\x18'  # Char 218 (.)
+           b'\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF'  # Char 219 (.)
+           b'\x00\x00\x00\xFF\xFF\xFF\xFF\xFF'  # Char 220 (.)
+           b'\xF0\xF0\xF0\xF0\xF0\xF0\xF0\xF0'  # Char 221 (.)
+           b'\x0F\x0F\x0F\x0F\x0F\x0F\x0F\x0F'  # Char 222 (.)
+           b'\xFF\xFF\xFF\x00\x00\x00\x00\x00'  # Char 223 (.)
+           b'\x00\x00\x7C\x66\x66\x7C\x60\x00'  # Char 224 (.)
+           b'\x00\x00\x3C\x66\x60\x66\x3C\x00'  # Char 225 (.)
+           b'\x00\x00\x7E\x18\x18\x18\x18\x00'  # Char 226 (.)
+           b'\x00\x00\x66\x66\x3E\x06\x7C\x00'  # Char 227 (.)
+           b'\x00\x00\x7E\xDB\xDB\x7E\x18\x00'  # Char 228 (.)
+           b'\x00\x00\x66\x3C\x18\x3C\x66\x00'  # Char 229 (.)
+           b'\x00\x00\x66\x66\x66\x66\x7F\x03'  # Char 230 (.)
+           b'\x00\x00\x66\x66\x3E\x06\x06\x00'  # Char 231 (.)
+           b'\x00\x00\xDB\xDB\xDB\xDB\xFF\x00'  # Char 232 (.)
+           b'\x00\x00\xDB\xDB\xDB\xDB\xFF\x03'  # Char 233 (.)
+           b'\x00\x00\xE0\x60\x7C\x66\x7C\x00'  # Char 234 (.)
+           b'\x00\x00\xC6\xC6\xF6\xDE\xF6\x00'  # Char 235 (.)
+           b'\x00\x00\x60\x60\x7C\x66\x7C\x00'  # Char 236 (.)
+           b'\x00\x00\x7C\x06\x3E\x06\x7C\x00'  # Char 237 (.)
+           b'\x00\x00\xCE\xDB\xFB\xDB\xCE\x00'  # Char 238 (.)
+           b'\x00\x00\x3E\x66\x3E\x36\x66\x00'  # Char 239 (.)
+           b'\x00\x00\xFE\x00\xFE\x00\xFE\x00'  # Char 240 (.)
+           b'\x10\x10\x7C\x10\x10\x00\x7C\x00'  # Char 241 (.)
+           b'\x00\x30\x18\x0C\x06\x0C\x18\x30'  # Char 242 (.)
+           b'\x00\x0C\x18\x30\x60\x30\x18\x0C'  # Char 243 (.)
+           b'\x0E\x1B\x1B\x18\x18\x18\x18\x18'  # Char 244 (.)
+           b'\x18\x18\x18\x18\x18\xD8\xD8\x70'  # Char 245 (.)
+           b'\x00\x18\x18\x00\x7E\x00\x18\x18'  # Char 246 (.)
+           b'\x00\x76\xDC\x00\x76\xDC\x00\x00'  # Char 247 (.)
+           b'\x00\x38\x6C\x6C\x38\x00\x00\x00'  # Char 248 (.)
+           b'\x00\x00\x00\x18\x18\x00\x00\x00'  # Char 249 (.)
+           b'\x00\x00\x00\x00\x18\x00\x00\x00'  # Char 250 (.)
+           b'\x03\x02\x06\x04\xCC\x68\x38\x10'  # Char 251 (.)
+           b'\x3C\x42\x99\xA1\xA1\x99\x42\x3C'  # Char 252 (.)
+           b'\x30\x48\x10\x20\x78\x00\x00\x00'  # Char 253 (.)
+           b'\x00\x00\x7C\x7C\x7C\x7C\x00\x00'  # Char 254 (.)
+           b'\x00\x00\x00\x00\x00\x42\x7E\x00')  # Char 255 (.)
+
+
+_glyphs = None
+_widths = None
+
+
+def glyphs():
+    """
+    Returns the whole font as a read-only (256, 8, 8) boolean NumPy array,
+    indexed by [ <char>, <row>, <column> ].
+    Built on first use, so importing the charset neither needs nor pays for NumPy.
+    """
+
+    global _glyphs
+
+    if _glyphs is None:
+        import numpy as np
+
+        g = np.unpackbits(np.frombuffer(CHARTAB, dtype=np.uint8)).reshape(256, 8, 8).astype(bool)
+        g.flags.writeable = False
+        _glyphs = g
+
+    return _glyphs
+
+
+def glyph_widths():
+    """
+    Returns the proportional metrics of all 256 characters as a tuple of two read-only
+    NumPy arrays ( <left>, <width> ): the first occupied column and the number of columns
+    up to the last occupied one. Empty characters (e.g. space) have a width of 0.
+    Computed once from the column occupancy of CHARTAB.
+    """
+
+    global _widths
+
+    if _widths is None:
+        import numpy as np
+
+        used = glyphs().any(axis=1)  # (256, 8), column occupancy
+        left = np.where(used.any(axis=1), used.argmax(axis=1), 0)
+        right = np.where(used.any(axis=1), 8 - used[:, ::-1].argmax(axis=1), 0)
+        width = right - left
+        left.flags.writeable = False
+        width.flags.writeable = False
+        _widths = (left, width)
+
+    return _widths
+
+
+def render_text(text, proportional=False, spacing=1, space_width=3):
+    """
+    Renders string <text> into a boolean NumPy array (8 rows), [ <row>, <column> ].
+    Characters beyond 255 are clamped to 255, like LedCtrlChar() does.
+    By default, each character occupies its full 8 columns.
+    If <proportional> is set, characters are cropped to their used columns and separated
+    by <spacing> empty columns; empty characters, like space, become <space_width> wide.
+    """
+
+    import numpy as np
+
+    codes = np.fromiter((min(ord(c), 255) for c in text), dtype=np.intp, count=len(text))
+
+    if not proportional:
+        return glyphs()[codes].transpose(1, 0, 2).reshape(8, -1)
+
+    g = glyphs()
+    left, width = glyph_widths()
+    gap = np.zeros((8, spacing), dtype=bool)
+
+    parts = []
+    for code in codes:
+        if parts and spacing > 0:
+            parts.append(gap)
+        if width[code] == 0:
+            parts.append(np.zeros((8, space_width), dtype=bool))
+        else:
+            parts.append(g[code, :, left[code]:left[code] + width[code]])
+
+    if not parts:
+        return np.zeros((8, 0), dtype=bool)
 
-CHARTAB = [ 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  # Char 000 (.)
-            0x7E, 0x81, 0xA5, 0x81, 0xBD, 0x99, 0x81, 0x7E,  # Char 001 (.)
-            0x7E, 0xFF, 0xDB, 0xFF, 0xC3, 0xE7, 0xFF, 0x7E,  # Char 002 (.)
-            0x6C, 0xFE, 0xFE, 0xFE, 0x7C, 0x38, 0x10, 0x00,  # Char 003 (.)
-            0x10, 0x38, 0x7C, 0xFE, 0x7C, 0x38, 0x10, 0x00,  # Char 004 (.)
-            0x38, 0x7C, 0x38, 0xFE, 0xFE, 0x7C, 0x38, 0x7C,  # Char 005 (.)
-            0x10, 0x10, 0x38, 0x7C, 0xFE, 0x7C, 0x38, 0x7C,  # Char 006 (.)
-            0x00, 0x00, 0x18, 0x3C, 0x3C, 0x18, 0x00, 0x00,  # Char 007 (.)
-            0xFF, 0xFF, 0xE7, 0xC3, 0xC3, 0xE7, 0xFF, 0xFF,  # Char 008 (.)
-            0x00, 0x3C, 0x66, 0x42, 0x42, 0x66, 0x3C, 0x00,  # Char 009 (.)
-            0xFF, 0xC3, 0x99, 0xBD, 0xBD, 0x99, 0xC3, 0xFF,  # Char 010 (.)
-            0x0F, 0x07, 0x0F, 0x7D, 0xCC, 0xCC, 0xCC, 0x78,  # Char 011 (.)
-            0x3C, 0x66, 0x66, 0x66, 0x3C, 0x18, 0x7E, 0x18,  # Char 012 (.)
-            0x3F, 0x33, 0x3F, 0x30, 0x30, 0x70, 0xF0, 0xE0,  # Char 013 (.)
-            0x7F, 0x63, 0x7F, 0x63, 0x63, 0x67, 0xE6, 0xC0,  # Char 014 (.)
-            0x99, 0x5A, 0x3C, 0xE7, 0xE7, 0x3C, 0x5A, 0x99,  # Char 015 (.)
-            0x80, 0xE0, 0xF8, 0xFE, 0xF8, 0xE0, 0x80, 0x00,  # Char 016 (.)
-            0x02, 0x0E, 0x3E, 0xFE, 0x3E, 0x0E, 0x02, 0x00,  # Char 017 (.)
-            0x18, 0x3C, 0x7E, 0x18, 0x18, 0x7E, 0x3C, 0x18,  # Char 018 (.)
-            0x66, 0x66, 0x66, 0x66, 0x66, 0x00, 0x66, 0x00,  # Char 019 (.)
-            0x7F, 0xDB, 0xDB, 0x7B, 0x1B, 0x1B, 0x1B, 0x00,  # Char 020 (.)
-            0x3C, 0x66, 0x38, 0x6C, 0x6C, 0x38, 0xCC, 0x78,  # Char 021 (.)
-            0x00, 0x00, 0x00, 0x00, 0x7E, 0x7E, 0x7E, 0x00,  # Char 022 (.)
-            0x18, 0x3C, 0x7E, 0x18, 0x7E, 0x3C, 0x18, 0xFF,  # Char 023 (.)
-            0x18, 0x3C, 0x7E, 0x18, 0x18, 0x18, 0x18, 0x00,  # Char 024 (.)
-            0x18, 0x18, 0x18, 0x18, 0x7E, 0x3C, 0x18, 0x00,  # Char 025 (.)
-            0x00, 0x18, 0x0C, 0xFE, 0x0C, 0x18, 0x00, 0x00,  # Char 026 (.)
-            0x00, 0x30, 0x60, 0xFE, 0x60, 0x30, 0x00, 0x00,  # Char 027 (.)
-            0x00, 0x00, 0xC0, 0xC0, 0xC0, 0xFE, 0x00, 0x00,  # Char 028 (.)
-            0x00, 0x24, 0x66, 0xFF, 0x66, 0x24, 0x00, 0x00,  # Char 029 (.)
-            0x00, 0x18, 0x3C, 0x7E, 0xFF, 0xFF, 0x00, 0x00,  # Char 030 (.)
-            0x00, 0xFF, 0xFF, 0x7E, 0x3C, 0x18, 0x00, 0x00,  # Char 031 (.)
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  # Char 032 ( )
-            0x30, 0x78, 0x78, 0x30, 0x30, 0x00, 0x30, 0x00,  # Char 033 (!)
-            0x6C, 0x6C, 0x6C, 0x00, 0x00, 0x00, 0x00, 0x00,  # Char 034 (")
-            0x6C, 0x6C, 0xFE, 0x6C, 0xFE, 0x6C, 0x6C, 0x00,  # Char 035 (#)
-            0x30, 0x7C, 0xC0, 0x78, 0x0C, 0xF8, 0x30, 0x00,  # Char 036 ($)
-            0x00, 0xC6, 0xCC, 0x18, 0x30, 0x66, 0xC6, 0x00,  # Char 037 (%)
-            0x38, 0x6C, 0x38, 0x76, 0xDC, 0xCC, 0x76, 0x00,  # Char 038 (&)
-            0x60, 0x60, 0xC0, 0x00, 0x00, 0x00, 0x00, 0x00,  # Char 039 (')
-            0x18, 0x30, 0x60, 0x60, 0x60, 0x30, 0x18, 0x00,  # Char 040 (()
-            0x60, 0x30, 0x18, 0x18, 0x18, 0x30, 0x60, 0x00,  # Char 041 ())
-            0x00, 0x66, 0x3C, 0xFF, 0x3C, 0x66, 0x00, 0x00,  # Char 042 (*)
-            0x00, 0x30, 0x30, 0xFC, 0x30, 0x30, 0x00, 0x00,  # Char 043 (#)
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x30, 0x30, 0x60,  # Char 044 (,)
-            0x00, 0x00, 0x00, 0xFC, 0x00, 0x00, 0x00, 0x00,  # Char 045 (-)
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x30, 0x30, 0x00,  # Char 046 (.)
-            0x06, 0x0C, 0x18, 0x30, 0x60, 0xC0, 0x80, 0x00,  # Char 047 (/)
-            0x7C, 0xC6, 0xCE, 0xDE, 0xF6, 0xE6, 0x7C, 0x00,  # Char 048 (0)
-            0x30, 0x70, 0x30, 0x30, 0x30, 0x30, 0x30, 0x00,  # Char 049 (1)
-            0x78, 0xCC, 0x0C, 0x38, 0x60, 0xC0, 0xFC, 0x00,  # Char 050 (2)
-            0x78, 0xCC, 0x0C, 0x38, 0x0C, 0xCC, 0x78, 0x00,  # Char 051 (3)
-            0x1C, 0x3C, 0x6C, 0xCC, 0xFE, 0x0C, 0x0C, 0x00,  # Char 052 (4)
-            0xFC, 0xC0, 0xF8, 0x0C, 0x0C, 0xCC, 0x78, 0x00,  # Char 053 (5)
-            0x38, 0x60, 0xC0, 0xF8, 0xCC, 0xCC, 0x78, 0x00,  # Char 054 (6)
-            0xFC, 0x0C, 0x0C, 0x18, 0x30, 0x30, 0x30, 0x00,  # Char 055 (7)
-            0x78, 0xCC, 0xCC, 0x78, 0xCC, 0xCC, 0x78, 0x00,  # Char 056 (8)
-            0x78, 0xCC, 0xCC, 0x7C, 0x0C, 0x18, 0x70, 0x00,  # Char 057 (9)
-            0x00, 0x30, 0x30, 0x00, 0x00, 0x30, 0x30, 0x00,  # Char 058 (:)
-            0x00, 0x30, 0x30, 0x00, 0x00, 0x30, 0x30, 0x60,  # Char 059 (;)
-            0x18, 0x30, 0x60, 0xC0, 0x60, 0x30, 0x18, 0x00,  # Char 060 (<)
-            0x00, 0x00, 0xFC, 0x00, 0x00, 0xFC, 0x00, 0x00,  # Char 061 (=)
-            0x60, 0x30, 0x18, 0x0C, 0x18, 0x30, 0x60, 0x00,  # Char 062 (>)
-            0x78, 0xCC, 0x0C, 0x18, 0x30, 0x00, 0x30, 0x00,  # Char 063 (?)
-            0x7C, 0xC6, 0xDE, 0xDE, 0xDE, 0xC0, 0x78, 0x00,  # Char 064 (@)
-            0x18, 0x3C, 0x66, 0x66, 0x7E, 0x66, 0x66, 0x00,  # Char 065 (A)
-            0x7C, 0x66, 0x66, 0x7C, 0x66, 0x66, 0x7C, 0x00,  # Char 066 (B)
-            0x3C, 0x66, 0xC0, 0xC0, 0xC0, 0x66, 0x3C, 0x00,  # Char 067 (C)
-            0x78, 0x6C, 0x66, 0x66, 0x66, 0x6C, 0x78, 0x00,  # Char 068 (D)
-            0x7E, 0x60, 0x60, 0x78, 0x60, 0x60, 0x7E, 0x00,  # Char 069 (E)
-            0x7E, 0x60, 0x60, 0x78, 0x60, 0x60, 0x60, 0x00,  # Char 070 (F)
-            0x3C, 0x66, 0xC0, 0xC0, 0xCE, 0x66, 0x3E, 0x00,  # Char 071 (G)
-            0x66, 0x66, 0x66, 0x7E, 0x66, 0x66, 0x66, 0x00,  # Char 072 (H)
-            0x18, 0x18, 0x18, 0x18, 0x18, 0x18, 0x18, 0x00,  # Char 073 (I)
-            0x06, 0x06, 0x06, 0x06, 0x66, 0x66, 0x3C, 0x00,  # Char 074 (J)
-            0x66, 0x66, 0x6C, 0x78, 0x6C, 0x66, 0x66, 0x00,  # Char 075 (K)
-            0x60, 0x60, 0x60, 0x60, 0x60, 0x60, 0x7E, 0x00,  # Char 076 (L)
-            0xC6, 0xEE, 0xFE, 0xFE, 0xD6, 0xC6, 0xC6, 0x00,  # Char 077 (M)
-            0xC6, 0xE6, 0xF6, 0xDE, 0xCE, 0xC6, 0xC6, 0x00,  # Char 078 (N)
-            0x3C, 0x66, 0x66, 0x66, 0x66, 0x66, 0x3C, 0x00,  # Char 079 (O)
-            0x7C, 0x66, 0x66, 0x7C, 0x60, 0x60, 0x60, 0x00,  # Char 080 (P)
-            0x3C, 0x66, 0x66, 0x66, 0x6E, 0x3C, 0x0E, 0x00,  # Char 081 (Q)
-            0x7C, 0x66, 0x66, 0x7C, 0x6C, 0x66, 0x66, 0x00,  # Char 082 (R)
-            0x3C, 0x66, 0x70, 0x38, 0x0E, 0x66, 0x3C, 0x00,  # Char 083 (S)
-            0x7E, 0x18, 0x18, 0x18, 0x18, 0x18, 0x18, 0x00,  # Char 084 (T)
-            0x66, 0x66, 0x66, 0x66, 0x66, 0x66, 0x3E, 0x00,  # Char 085 (U)
-            0x66, 0x66, 0x66, 0x66, 0x66, 0x3C, 0x18, 0x00,  # Char 086 (V)
-            0xC6, 0xC6, 0xC6, 0xD6, 0xFE, 0xEE, 0xC6, 0x00,  # Char 087 (W)
-            0x66, 0x66, 0x3C, 0x18, 0x3C, 0x66, 0x66, 0x00,  # Char 088 (X)
-            0x66, 0x66, 0x66, 0x3C, 0x18, 0x18, 0x18, 0x00,  # Char 089 (Y)
-            0xFE, 0x06, 0x0C, 0x18, 0x30, 0x60, 0xFE, 0x00,  # Char 090 (Z)
-            0x78, 0x60, 0x60, 0x60, 0x60, 0x60, 0x78, 0x00,  # Char 091 ([)
-            0xC0, 0x60, 0x30, 0x18, 0x0C, 0x06, 0x02, 0x00,  # Char 092 (\)
-            0x78, 0x18, 0x18, 0x18, 0x18, 0x18, 0x78, 0x00,  # Char 093 (])
-            0x10, 0x38, 0x6C, 0xC6, 0x00, 0x00, 0x00, 0x00,  # Char 094 (^)
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xFF,  # Char 095 (_)
-            0x30, 0x30, 0x18, 0x00, 0x00, 0x00, 0x00, 0x00,  # Char 096 (`)
-            0x00, 0x00, 0x3C, 0x06, 0x3E, 0x66, 0x3A, 0x00,  # Char 097 (a)
-            0x60, 0x60, 0x60, 0x7C, 0x66, 0x66, 0x5C, 0x00,  # Char 098 (b)
-            0x00, 0x00, 0x3C, 0x66, 0x60, 0x66, 0x3C, 0x00,  # Char 099 (c)
-            0x06, 0x06, 0x06, 0x3E, 0x66, 0x66, 0x3A, 0x00,  # Char 100 (d)
-            0x00, 0x00, 0x3C, 0x66, 0x7E, 0x60, 0x3C, 0x00,  # Char 101 (e)
-            0x1C, 0x36, 0x30, 0x78, 0x30, 0x30, 0x30, 0x00,  # Char 102 (f)
-            0x00, 0x00, 0x3A, 0x66, 0x66, 0x3E, 0x06, 0x3C,  # Char 103 (g)
-            0x60, 0x60, 0x6C, 0x76, 0x66, 0x66, 0x66, 0x00,  # Char 104 (h)
-            0x18, 0x00, 0x18, 0x18, 0x18, 0x18, 0x18, 0x00,  # Char 105 (i)
-            0x0C, 0x00, 0x0C, 0x0C, 0x0C, 0xCC, 0xCC, 0x78,  # Char 106 (j)
-            0x60, 0x60, 0x66, 0x6C, 0x78, 0x6C, 0x66, 0x00,  # Char 107 (k)
-            0x18, 0x18, 0x18, 0x18, 0x18, 0x18, 0x18, 0x00,  # Char 108 (l)
-            0x00, 0x00, 0xC6, 0xEE, 0xFE, 0xD6, 0xC6, 0x00,  # Char 109 (m)
-            0x00, 0x00, 0x7C, 0x66, 0x66, 0x66, 0x66, 0x00,  # Char 110 (n)
-            0x00, 0x00, 0x3C, 0x66, 0x66, 0x66, 0x3C, 0x00,  # Char 111 (o)
-            0x00, 0x00, 0x5C, 0x66, 0x66, 0x7C, 0x60, 0x60,  # Char 112 (p)
-            0x00, 0x00, 0x3A, 0x66, 0x66, 0x3E, 0x06, 0x06,  # Char 113 (q)
-            0x00, 0x00, 0x5C, 0x76, 0x60, 0x60, 0x60, 0x00,  # Char 114 (r)
-            0x00, 0x00, 0x3E, 0x60, 0x3C, 0x06, 0x7C, 0x00,  # Char 115 (s)
-            0x30, 0x30, 0x7C, 0x30, 0x30, 0x34, 0x18, 0x00,  # Char 116 (t)
-            0x00, 0x00, 0x66, 0x66, 0x66, 0x66, 0x3A, 0x00,  # Char 117 (u)
-            0x00, 0x00, 0x66, 0x66, 0x66, 0x3C, 0x18, 0x00,  # Char 118 (v)
-            0x00, 0x00, 0xC6, 0xD6, 0xFE, 0xFE, 0x6C, 0x00,  # Char 119 (w)
-            0x00, 0x00, 0xC6, 0x6C, 0x38, 0x6C, 0xC6, 0x00,  # Char 120 (x)
-            0x00, 0x00, 0x66, 0x66, 0x66, 0x3E, 0x06, 0x3C,  # Char 121 (y)
-            0x00, 0x00, 0x7E, 0x0C, 0x18, 0x30, 0x7E, 0x00,  # Char 122 (z)
-            0x1C, 0x30, 0x30, 0xE0, 0x30, 0x30, 0x1C, 0x00,  # Char 123 ({)
-            0x18, 0x18, 0x18, 0x00, 0x18, 0x18, 0x18, 0x00,  # Char 124 (|)
-            0xE0, 0x30, 0x30, 0x1C, 0x30, 0x30, 0xE0, 0x00,  # Char 125 (})
-            0x76, 0xDC, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,  # Char 126 (~)
-            0x00, 0x10, 0x38, 0x6C, 0xC6, 0xC6, 0xFE, 0x00,  # Char 127 (.)
-            0x0E, 0x1E, 0x36, 0x66, 0x7E, 0x66, 0x66, 0x00,  # Char 128 (.)
-            0x7C, 0x60, 0x60, 0x7C, 0x66, 0x66, 0x7C, 0x00,  # Char 129 (.)
-            0x7C, 0x66, 0x66, 0x7C, 0x66, 0x66, 0x7C, 0x00,  # Char 130 (.)
-            0x7E, 0x60, 0x60, 0x60, 0x60, 0x60, 0x60, 0x00,  # Char 131 (.)
-            0x1C, 0x3C, 0x6C, 0x6C, 0x6C, 0x6C, 0xFE, 0xC6,  # Char 132 (.)
-            0x7E, 0x60, 0x60, 0x7C, 0x60, 0x60, 0x7E, 0x00,  # Char 133 (.)
-            0xDB, 0xDB, 0x7E, 0x3C, 0x7E, 0xDB, 0xDB, 0x00,  # Char 134 (.)
-            0x3C, 0x66, 0x06, 0x1C, 0x06, 0x66, 0x3C, 0x00,  # Char 135 (.)
-            0x66, 0x66, 0x6E, 0x7E, 0x76, 0x66, 0x66, 0x00,  # Char 136 (.)
-            0x3C, 0x66, 0x6E, 0x7E, 0x76, 0x66, 0x66, 0x00,  # Char 137 (.)
-            0x66, 0x6C, 0x78, 0x70, 0x78, 0x6C, 0x66, 0x00,  # Char 138 (.)
-            0x0E, 0x1E, 0x36, 0x66, 0x66, 0x66, 0x66, 0x00,  # Char 139 (.)
-            0xC6, 0xEE, 0xFE, 0xFE, 0xD6, 0xD6, 0xC6, 0x00,  # Char 140 (.)
-            0x66, 0x66, 0x66, 0x7E, 0x66, 0x66, 0x66, 0x00,  # Char 141 (.)
-            0x3C, 0x66, 0x66, 0x66, 0x66, 0x66, 0x3C, 0x00,  # Char 142 (.)
-            0x7E, 0x66, 0x66, 0x66, 0x66, 0x66, 0x66, 0x00,  # Char 143 (.)
-            0x7C, 0x66, 0x66, 0x66, 0x7C, 0x60, 0x60, 0x00,  # Char 144 (.)
-            0x3C, 0x66, 0x60, 0x60, 0x60, 0x66, 0x3C, 0x00,  # Char 145 (.)
-            0x7E, 0x18, 0x18, 0x18, 0x18, 0x18, 0x18, 0x00,  # Char 146 (.)
-            0x66, 0x66, 0x66, 0x3E, 0x06, 0x66, 0x3C, 0x00,  # Char 147 (.)
-            0x7E, 0xDB, 0xDB, 0xDB, 0x7E, 0x18, 0x18, 0x00,  # Char 148 (.)
-            0x66, 0x66, 0x3C, 0x18, 0x3C, 0x66, 0x66, 0x00,  # Char 149 (.)
-            0x66, 0x66, 0x66, 0x66, 0x66, 0x66, 0x7F, 0x03,  # Char 150 (.)
-            0x66, 0x66, 0x66, 0x3E, 0x06, 0x06, 0x06, 0x00,  # Char 151 (.)
-            0xDB, 0xDB, 0xDB, 0xDB, 0xDB, 0xDB, 0xFF, 0x00,  # Char 152 (.)
-            0xDB, 0xDB, 0xDB, 0xDB, 0xDB, 0xDB, 0xFF, 0x03,  # Char 153 (.)
-            0xE0, 0x60, 0x60, 0x7C, 0x66, 0x66, 0x7C, 0x00,  # Char 154 (.)
-            0xC6, 0xC6, 0xC6, 0xF6, 0xDE, 0xDE, 0xF6, 0x00,  # Char 155 (.)
-            0x60, 0x60, 0x60, 0x7C, 0x66, 0x66, 0x7C, 0x00,  # Char 156 (.)
-            0x78, 0x8C, 0x06, 0x3E, 0x06, 0x8C, 0x78, 0x00,  # Char 157 (.)
-            0xCE, 0xDB, 0xDB, 0xFB, 0xDB, 0xDB, 0xCE, 0x00,  # Char 158 (.)
-            0x3E, 0x66, 0x66, 0x66, 0x3E, 0x36, 0x66, 0x00,  # Char 159 (.)
-            0x00, 0x00, 0x3C, 0x06, 0x3E, 0x66, 0x3A, 0x00,  # Char 160 (.)
-            0x00, 0x3C, 0x60, 0x3C, 0x66, 0x66, 0x3C, 0x00,  # Char 161 (.)
-            0x00, 0x00, 0x7C, 0x66, 0x7C, 0x66, 0x7C, 0x00,  # Char 162 (.)
-            0x00, 0x00, 0x7E, 0x60, 0x60, 0x60, 0x60, 0x00,  # Char 163 (.)
-            0x00, 0x00, 0x1C, 0x3C, 0x6C, 0x6C, 0xFE, 0x82,  # Char 164 (.)
-            0x00, 0x00, 0x3C, 0x66, 0x7E, 0x60, 0x3C, 0x00,  # Char 165 (.)
-            0x00, 0x00, 0xDB, 0x7E, 0x3C, 0x7E, 0xDB, 0x00,  # Char 166 (.)
-            0x00, 0x00, 0x3C, 0x66, 0x0C, 0x66, 0x3C, 0x00,  # Char 167 (.)
-            0x00, 0x00, 0x66, 0x6E, 0x7E, 0x76, 0x66, 0x00,  # Char 168 (.)
-            0x00, 0x18, 0x66, 0x6E, 0x7E, 0x76, 0x66, 0x00,  # Char 169 (.)
-            0x00, 0x00, 0x66, 0x6C, 0x78, 0x6C, 0x66, 0x00,  # Char 170 (.)
-            0x00, 0x00, 0x0E, 0x1E, 0x36, 0x66, 0x66, 0x00,  # Char 171 (.)
-            0x00, 0x00, 0xC6, 0xFE, 0xFE, 0xD6, 0xD6, 0x00,  # Char 172 (.)
-            0x00, 0x00, 0x66, 0x66, 0x7E, 0x66, 0x66, 0x00,  # Char 173 (.)
-            0x00, 0x00, 0x3C, 0x66, 0x66, 0x66, 0x3C, 0x00,  # Char 174 (.)
-            0x00, 0x00, 0x7E, 0x66, 0x66, 0x66, 0x66, 0x00,  # Char 175 (.)
-            0x11, 0x44, 0x11, 0x44, 0x11, 0x44, 0x11, 0x44,  # Char 176 (.)
-            0x55, 0xAA, 0x55, 0xAA, 0x55, 0xAA, 0x55, 0xAA,  # Char 177 (.)
-            0xDD, 0x77, 0xDD, 0x77, 0xDD, 0x77, 0xDD, 0x77,  # Char 178 (.)
-            0x18, 0x18, 0x18, 0x18, 0x18, 0x18, 0x18, 0x18,  # Char 179 (.)
-            0x18, 0x18, 0x18, 0xF8, 0x18, 0x18, 0x18, 0x18,  # Char 180 (.)
-            0x18, 0xF8, 0x18, 0xF8, 0x18, 0x18, 0x18, 0x18,  # Char 181 (.)
-            0x36, 0x36, 0x36, 0xF6, 0x36, 0x36, 0x36, 0x36,  # Char 182 (.)
-            0x00, 0x00, 0x00, 0xFE, 0x36, 0x36, 0x36, 0x36,  # Char 183 (.)
-            0x00, 0xF8, 0x18, 0xF8, 0x18, 0x18, 0x18, 0x18,  # Char 184 (.)
-            0x36, 0xF6, 0x06, 0xF6, 0x36, 0x36, 0x36, 0x36,  # Char 185 (.)
-            0x36, 0x36, 0x36, 0x36, 0x36, 0x36, 0x36, 0x36,  # Char 186 (.)
-            0x00, 0xFE, 0x06, 0xF6, 0x36, 0x36, 0x36, 0x36,  # Char 187 (.)
-            0x36, 0xF6, 0x06, 0xFE, 0x00, 0x00, 0x00, 0x00,  # Char 188 (.)
-            0x36, 0x36, 0x36, 0xFE, 0x00, 0x00, 0x00, 0x00,  # Char 189 (.)
-            0x18, 0xF8, 0x18, 0xF8, 0x00, 0x00, 0x00, 0x00,  # Char 190 (.)
-            0x00, 0x00, 0x00, 0xF8, 0x18, 0x18, 0x18, 0x18,  # Char 191 (.)
-            0x18, 0x18, 0x18, 0x1F, 0x00, 0x00, 0x00, 0x00,  # Char 192 (.)
-            0x18, 0x18, 0x18, 0xFF, 0x00, 0x00, 0x00, 0x00,  # Char 193 (.)
-            0x00, 0x00, 0x00, 0xFF, 0x18, 0x18, 0x18, 0x18,  # Char 194 (.)
-            0x18, 0x18, 0x18, 0x1F, 0x18, 0x18, 0x18, 0x18,  # Char 195 (.)
-            0x00, 0x00, 0x00, 0xFF, 0x00, 0x00, 0x00, 0x00,  # Char 196 (.)
-            0x18, 0x18, 0x18, 0xFF, 0x18, 0x18, 0x18, 0x18,  # Char 197 (.)
-            0x18, 0x1F, 0x18, 0x1F, 0x18, 0x18, 0x18, 0x18,  # Char 198 (.)
-            0x36, 0x36, 0x36, 0x37, 0x36, 0x36, 0x36, 0x36,  # Char 199 (.)
-            0x36, 0x37, 0x30, 0x3F, 0x00, 0x00, 0x00, 0x00,  # Char 200 (.)
-            0x00, 0x3F, 0x30, 0x37, 0x36, 0x36, 0x36, 0x36,  # Char 201 (.)
-            0x36, 0xF7, 0x00, 0xFF, 0x00, 0x00, 0x00, 0x00,  # Char 202 (.)
-            0x00, 0xFF, 0x00, 0xF7, 0x36, 0x36, 0x36, 0x36,  # Char 203 (.)
-            0x36, 0x37, 0x30, 0x37, 0x36, 0x36, 0x36, 0x36,  # Char 204 (.)
-            0x00, 0xFF, 0x00, 0xFF, 0x00, 0x00, 0x00, 0x00,  # Char 205 (.)
-            0x36, 0xF7, 0x00, 0xF7, 0x36, 0x36, 0x36, 0x36,  # Char 206 (.)
-            0x18, 0xFF, 0x00, 0xFF, 0x00, 0x00, 0x00, 0x00,  # Char 207 (.)
-            0x36, 0x36, 0x36, 0xFF, 0x00, 0x00, 0x00, 0x00,  # Char 208 (.)
-            0x00, 0xFF, 0x00, 0xFF, 0x18, 0x18, 0x18, 0x18,  # Char 209 (.)
-            0x00, 0x00, 0x00, 0xFF, 0x36, 0x36, 0x36, 0x36,  # Char 210 (.)
-            0x36, 0x36, 0x36, 0x3F, 0x00, 0x00, 0x00, 0x00,  # Char 211 (.)
-            0x18, 0x1F, 0x18, 0x1F, 0x00, 0x00, 0x00, 0x00,  # Char 212 (.)
-            0x00, 0x1F, 0x18, 0x1F, 0x18, 0x18, 0x18, 0x18,  # Char 213 (.)
-            0x00, 0x00, 0x00, 0x3F, 0x36, 0x36, 0x36, 0x36,  # Char 214 (.)
-            0x36, 0x36, 0x36, 0xFF, 0x36, 0x36, 0x36, 0x36,  # Char 215 (.)
-            0x18, 0xFF, 0x18, 0xFF, 0x18, 0x18, 0x18, 0x18,  # Char 216 (.)
-            0x18, 0x18, 0x18, 0xF8, 0x00, 0x00, 0x00, 0x00,  # Char 217 (.)
-            0x00, 0x00, 0x00, 0x1F, 0x18, 0x18, 0x18, 0x18,  # Char 218 (.)
-            0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF,  # Char 219 (.)
-            0x00, 0x00, 0x00, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF,  # Char 220 (.)
-            0xF0, 0xF0, 0xF0, 0xF0, 0xF0, 0xF0, 0xF0, 0xF0,  # Char 221 (.)
-            0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F,  # Char 222 (.)
-            0xFF, 0xFF, 0xFF, 0x00, 0x00, 0x00, 0x00, 0x00,  # Char 223 (.)
-            0x00, 0x00, 0x7C, 0x66, 0x66, 0x7C, 0x60, 0x00,  # Char 224 (.)
-            0x00, 0x00, 0x3C, 0x66, 0x60, 0x66, 0x3C, 0x00,  # Char 225 (.)
-            0x00, 0x00, 0x7E, 0x18, 0x18, 0x18, 0x18, 0x00,  # Char 226 (.)
-            0x00, 0x00, 0x66, 0x66, 0x3E, 0x06, 0x7C, 0x00,  # Char 227 (.)
-            0x00, 0x00, 0x7E, 0xDB, 0xDB, 0x7E, 0x18, 0x00,  # Char 228 (.)
-            0x00, 0x00, 0x66, 0x3C, 0x18, 0x3C, 0x66, 0x00,  # Char 229 (.)
-            0x00, 0x00, 0x66, 0x66, 0x66, 0x66, 0x7F, 0x03,  # Char 230 (.)
-            0x00, 0x00, 0x66, 0x66, 0x3E, 0x06, 0x06, 0x00,  # Char 231 (.)
-            0x00, 0x00, 0xDB, 0xDB, 0xDB, 0xDB, 0xFF, 0x00,  # Char 232 (.)
-            0x00, 0x00, 0xDB, 0xDB, 0xDB, 0xDB, 0xFF, 0x03,  # Char 233 (.)
-            0x00, 0x00, 0xE0, 0x60, 0x7C, 0x66, 0x7C, 0x00,  # Char 234 (.)
-            0x00, 0x00, 0xC6, 0xC6, 0xF6, 0xDE, 0xF6, 0x00,  # Char 235 (.)
-            0x00, 0x00, 0x60, 0x60, 0x7C, 0x66, 0x7C, 0x00,  # Char 236 (.)
-            0x00, 0x00, 0x7C, 0x06, 0x3E, 0x06, 0x7C, 0x00,  # Char 237 (.)
-            0x00, 0x00, 0xCE, 0xDB, 0xFB, 0xDB, 0xCE, 0x00,  # Char 238 (.)
-            0x00, 0x00, 0x3E, 0x66, 0x3E, 0x36, 0x66, 0x00,  # Char 239 (.)
-            0x00, 0x00, 0xFE, 0x00, 0xFE, 0x00, 0xFE, 0x00,  # Char 240 (.)
-            0x10, 0x10, 0x7C, 0x10, 0x10, 0x00, 0x7C, 0x00,  # Char 241 (.)
-            0x00, 0x30, 0x18, 0x0C, 0x06, 0x0C, 0x18, 0x30,  # Char 242 (.)
-            0x00, 0x0C, 0x18, 0x30, 0x60, 0x30, 0x18, 0x0C,  # Char 243 (.)
-            0x0E, 0x1B, 0x1B, 0x18, 0x18, 0x18, 0x18, 0x18,  # Char 244 (.)
-            0x18, 0x18, 0x18, 0x18, 0x18, 0xD8, 0xD8, 0x70,  # Char 245 (.)
-            0x00, 0x18, 0x18, 0x00, 0x7E, 0x00, 0x18, 0x18,  # Char 246 (.)
-            0x00, 0x76, 0xDC, 0x00, 0x76, 0xDC, 0x00, 0x00,  # Char 247 (.)
-            0x00, 0x38, 0x6C, 0x6C, 0x38, 0x00, 0x00, 0x00,  # Char 248 (.)
-            0x00, 0x00, 0x00, 0x18, 0x18, 0x00, 0x00, 0x00,  # Char 249 (.)
-            0x00, 0x00, 0x00, 0x00, 0x18, 0x00, 0x00, 0x00,  # Char 250 (.)
-            0x03, 0x02, 0x06, 0x04, 0xCC, 0x68, 0x38, 0x10,  # Char 251 (.)
-            0x3C, 0x42, 0x99, 0xA1, 0xA1, 0x99, 0x42, 0x3C,  # Char 252 (.)
-            0x30, 0x48, 0x10, 0x20, 0x78, 0x00, 0x00, 0x00,  # Char 253 (.)
-            0x00, 0x00, 0x7C, 0x7C, 0x7C, 0x7C, 0x00, 0x00,  # Char 254 (.)
-            0x00, 0x00, 0x00, 0x00, 0x00, 0x42, 0x7E, 0x00 ]
-  
\ No newline at end of file
+    return np.concatenate(parts, axis=1)
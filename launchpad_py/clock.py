@@ -0,0 +1,153 @@
+from collections import deque
+
+__all__ = ['ClockFollower']
+
+
+class ClockFollower(object):
+    """
+    Follows an external MIDI beat clock, e.g. from a DAW, so that LED animations can
+    stay phase-locked to its tempo.
+
+    The clock sends 24 ticks (msg 248) per beat, plus start (250), continue (251) and
+    stop (252) messages. The arrival times of these ticks are jittery (USB, drivers,
+    the sender's own scheduling...), so tempo and phase are not taken from the last
+    tick interval, but from a least squares fit over the last <window> ticks.
+
+    Feed it via LaunchpadBase.attach_clock() or by calling feed() with the status byte
+    and the PortMidi timestamp (ms) of each message.
+    Callbacks (all optional, called from the thread that feeds the messages):
+      on_beat(beat)  - at the first tick of every beat, <beat> counts from 0 after start
+      on_bar(bar)    - at the first tick of every bar, <bar> counts from 0 after start
+      on_start()     - start or continue received
+      on_stop()      - stop received
+    """
+
+    CLOCK = 248
+    START = 250
+    CONTINUE = 251
+    STOP = 252
+
+    TICKS_PER_BEAT = 24
+
+    def __init__(self, window=48, beats_per_bar=4, time_func=None):
+        """
+        <window>        number of ticks used for the tempo fit (48 = two beats)
+        <beats_per_bar> for the bar callback and bar_phase()
+        <time_func>     returns the current time in ms, in the same time base as the
+                        timestamps fed in; LaunchpadBase.attach_clock() sets this
+                        to Midi.GetTime(), if omitted
+        """
+
+        self.window = max(int(window), 2)
+        self.beats_per_bar = beats_per_bar
+        self.time_func = time_func
+
+        self.on_beat = None
+        self.on_bar = None
+        self.on_start = None
+        self.on_stop = None
+
+        self.running = False
+        self.position = -1  # ticks since start; the first tick after start is tick 0
+
+        self._count = 0  # ticks ever received, never reset; the x-axis of the fit
+        self._ticks = deque(maxlen=self.window)  # (count, timestamp)
+        # last fit result as one tuple, so readers from other threads never
+        # see a half updated state: (count, fitted time, ms per tick, position)
+        self._fit = None
+
+    def feed(self, status, timestamp):
+        """
+        Processes a single system real-time message <status> received at <timestamp> (ms).
+        Returns True if the message was a clock message, False otherwise.
+        """
+
+        if status == self.CLOCK:
+            self._tick(timestamp)
+        elif status == self.START:
+            self.position = -1
+            self.running = True
+            if self.on_start is not None:
+                self.on_start()
+        elif status == self.CONTINUE:
+            self.running = True
+            if self.on_start is not None:
+                self.on_start()
+        elif status == self.STOP:
+            self.running = False
+            if self.on_stop is not None:
+                self.on_stop()
+        else:
+            return False
+
+        return True
+
+    def _tick(self, timestamp):
+        self._count += 1
+        self._ticks.append((self._count, timestamp))
+
+        if self.running:
+            self.position += 1
+
+        n = len(self._ticks)
+        if n >= 2:
+            mean_x = sum(c for c, _ in self._ticks) / n
+            mean_y = sum(t for _, t in self._ticks) / n
+            sxx = sum((c - mean_x) ** 2 for c, _ in self._ticks)
+            sxy = sum((c - mean_x) * (t - mean_y) for c, t in self._ticks)
+            slope = sxy / sxx
+            if slope > 0:
+                fitted = mean_y + slope * (self._count - mean_x)
+                self._fit = (self._count, fitted, slope, self.position)
+
+        if self.running and self.position % self.TICKS_PER_BEAT == 0:
+            beat = self.position // self.TICKS_PER_BEAT
+            if beat % self.beats_per_bar == 0 and self.on_bar is not None:
+                self.on_bar(beat // self.beats_per_bar)
+            if self.on_beat is not None:
+                self.on_beat(beat)
+
+    def tempo(self):
+        """
+        Returns the estimated tempo in BPM or None, if not enough ticks were received yet.
+        """
+
+        fit = self._fit
+        if fit is None:
+            return None
+
+        return 60000.0 / (fit[2] * self.TICKS_PER_BEAT)
+
+    def _ticks_at(self, now):
+        fit = self._fit
+        if fit is None:
+            return float(max(self.position, 0))
+
+        _, fitted, slope, position = fit
+        if not self.running:
+            return float(max(position, 0))
+
+        if now is None:
+            if self.time_func is None:
+                return float(max(position, 0))
+            now = self.time_func()
+
+        # do not run away more than one beat if the clock vanished
+        ahead = min(max((now - fitted) / slope, 0.0), float(self.TICKS_PER_BEAT))
+        return max(position, 0) + ahead
+
+    def beat_phase(self, now=None):
+        """
+        Returns the position within the current beat as a float in 0..1 at time <now> (ms),
+        interpolated between the ticks. If <now> is omitted, <time_func> is used.
+        While stopped, the phase of the last tick is returned.
+        """
+
+        return (self._ticks_at(now) / self.TICKS_PER_BEAT) % 1.0
+
+    def bar_phase(self, now=None):
+        """
+        Same as beat_phase(), but for the position within the current bar.
+        """
+
+        return (self._ticks_at(now) / (self.TICKS_PER_BEAT * self.beats_per_bar)) % 1.0
@@ -0,0 +1,223 @@
+import threading
+
+import numpy as np
+
+from launchpad_py.framebuffer import FrameBuffer
+
+__all__ = ['Compositor', 'Layer']
+
+
+class Layer(object):
+    """
+    One layer of a Compositor; create them with Compositor.add_layer().
+
+    <pixels> is a ( <height>, <width>, 4 ) float array, RGB 0..63 plus alpha 0.0..1.0,
+    placed with its top left corner at <x>, <y> of the compositor's surface.
+    All methods mark what they change as dirty. After writing into <pixels> directly,
+    call touch() to do so.
+    """
+
+    def __init__(self, compositor, name, shape, x, y, z, opacity, visible):
+        self._compositor = compositor
+        self.name = name
+        self.pixels = np.zeros(tuple(shape) + (4,), dtype=np.float32)
+        self._x = x
+        self._y = y
+        self._z = z
+        self._opacity = opacity
+        self._visible = visible
+
+    @property
+    def height(self):
+        return self.pixels.shape[0]
+
+    @property
+    def width(self):
+        return self.pixels.shape[1]
+
+    def touch(self, x=0, y=0, width=None, height=None):
+        """
+        Marks a region of the layer (layer coordinates) as changed; all of it by default.
+        """
+
+        width = self.width if width is None else width
+        height = self.height if height is None else height
+        self._compositor._touch(self._x + x, self._y + y, width, height)
+
+    def draw(self, image, x=0, y=0, alpha=1.0):
+        """
+        Copies <image> into the layer at <x>, <y> (layer coordinates). <image> is RGB,
+        ( <h>, <w>, 3 ) with alpha <alpha>, or RGBA, ( <h>, <w>, 4 ). Clipped at the edges.
+        """
+
+        image = np.asarray(image, dtype=np.float32)
+
+        # source ( <sx>, <sy> ) and destination ( <dx>, <dy> ) of the visible part
+        sx, sy = max(0, -x), max(0, -y)
+        dx, dy = max(0, x), max(0, y)
+        h = min(image.shape[0] - sy, self.height - dy)
+        w = min(image.shape[1] - sx, self.width - dx)
+        if h <= 0 or w <= 0:
+            return
+
+        source = image[sy:sy + h, sx:sx + w]
+        with self._compositor._lock:
+            target = self.pixels[dy:dy + h, dx:dx + w]
+            target[..., :3] = source[..., :3]
+            target[..., 3] = source[..., 3] if image.shape[2] > 3 else alpha
+            self.touch(dx, dy, w, h)
+
+    def set(self, x, y, rgb, alpha=1.0):
+        """
+        Sets the pixel at <x>, <y> (layer coordinates) to the color <rgb>, ( <r>, <g>, <b> ).
+        """
+
+        if 0 <= x < self.width and 0 <= y < self.height:
+            with self._compositor._lock:
+                self.pixels[y, x] = (rgb[0], rgb[1], rgb[2], alpha)
+                self.touch(x, y, 1, 1)
+
+    def fill(self, rgb, alpha=1.0):
+        with self._compositor._lock:
+            self.pixels[:] = (rgb[0], rgb[1], rgb[2], alpha)
+            self.touch()
+
+    def clear(self):
+        """
+        Makes the whole layer transparent.
+        """
+
+        with self._compositor._lock:
+            self.pixels[:] = 0.0
+            self.touch()
+
+    def move(self, x, y):
+        """
+        Moves the layer's top left corner to <x>, <y> of the surface.
+        """
+
+        with self._compositor._lock:
+            self.touch()
+            self._x = x
+            self._y = y
+            self.touch()
+
+    def _set_property(self, attr, value):
+        with self._compositor._lock:
+            if getattr(self, attr) != value:
+                setattr(self, attr, value)
+                self.touch()
+
+    x = property(lambda self: self._x)
+    y = property(lambda self: self._y)
+    z = property(lambda self: self._z, lambda self, value: self._set_property('_z', value))
+    opacity = property(lambda self: self._opacity, lambda self, value: self._set_property('_opacity', value))
+    visible = property(lambda self: self._visible, lambda self, value: self._set_property('_visible', value))
+
+
+class Compositor(object):
+    """
+    A stack of named RGBA layers, blended into one frame.
+
+    Layers are drawn in the order of their <z>, lowest first, each with its alpha times
+    its <opacity> ("over" blending) onto black. Invisible layers are skipped.
+    Only the regions changed since the last compose() are blended again, and the result
+    goes through a diffing FrameBuffer, so a small layer update only sends the pads
+    that actually changed.
+
+    <target> is a device or anything with a submit( <frame> ) method, e.g. a FrameBuffer
+    or a Canvas. <shape> is the surface's ( <height>, <width> ); the target's size or
+    a single grid if omitted.
+    """
+
+    def __init__(self, target, shape=None, lane=None):
+        if hasattr(target, 'submit'):
+            self.target = target
+        else:
+            self.target = FrameBuffer(target, lane=lane)
+
+        if shape is None:
+            shape = (getattr(self.target, 'height', FrameBuffer.HEIGHT), getattr(self.target, 'width', FrameBuffer.WIDTH))
+        self.height, self.width = shape
+
+        self.layers = {}
+        self.frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+
+        self._dirty = np.ones((self.height, self.width), dtype=bool)
+        self._lock = threading.RLock()
+
+    def add_layer(self, name, shape=None, x=0, y=0, z=0, opacity=1.0, visible=True):
+        """
+        Creates and returns a new, transparent layer <name>, covering the whole surface
+        unless a <shape> is given. Replaces an existing layer of the same name.
+        """
+
+        if shape is None:
+            shape = (self.height, self.width)
+
+        with self._lock:
+            if name in self.layers:
+                self.remove_layer(name)
+            layer = Layer(self, name, shape, x, y, z, opacity, visible)
+            self.layers[name] = layer
+
+        return layer
+
+    def remove_layer(self, name):
+        with self._lock:
+            layer = self.layers.pop(name)
+            layer.touch()
+
+    def __getitem__(self, name):
+        return self.layers[name]
+
+    def _touch(self, x, y, width, height):
+        self._dirty[max(y, 0):max(y + height, 0), max(x, 0):max(x + width, 0)] = True
+
+    def invalidate(self):
+        """
+        Makes the next compose() blend and send everything.
+        """
+
+        with self._lock:
+            self._dirty[:] = True
+            if hasattr(self.target, 'invalidate'):
+                self.target.invalidate()
+
+    def compose(self):
+        """
+        Blends the dirty regions and submits the frame. Returns the number of pads sent,
+        or 0 without a submit if nothing changed.
+        """
+
+        with self._lock:
+            rows = np.flatnonzero(self._dirty.any(axis=1))
+            if len(rows) == 0:
+                return 0
+            cols = np.flatnonzero(self._dirty.any(axis=0))
+            y0, y1 = rows[0], rows[-1] + 1
+            x0, x1 = cols[0], cols[-1] + 1
+
+            out = np.zeros((y1 - y0, x1 - x0, 3), dtype=np.float32)
+            for layer in sorted(self.layers.values(), key=lambda l: l.z):
+                if not layer.visible or layer.opacity <= 0.0:
+                    continue
+
+                # overlap of the layer with the dirty box, in surface coordinates
+                ly0 = max(y0, layer.y)
+                ly1 = min(y1, layer.y + layer.height)
+                lx0 = max(x0, layer.x)
+                lx1 = min(x1, layer.x + layer.width)
+                if ly0 >= ly1 or lx0 >= lx1:
+                    continue
+
+                src = layer.pixels[ly0 - layer.y:ly1 - layer.y, lx0 - layer.x:lx1 - layer.x]
+                dst = out[ly0 - y0:ly1 - y0, lx0 - x0:lx1 - x0]
+                alpha = src[..., 3:] * layer.opacity
+                dst += (src[..., :3] - dst) * alpha
+
+            box = self._dirty[y0:y1, x0:x1]
+            self.frame[y0:y1, x0:x1][box] = (np.clip(out, 0, 63) + 0.5).astype(np.uint8)[box]
+            self._dirty[:] = False
+
+            return self.target.submit(self.frame)
@@ -0,0 +1,340 @@
+import os
+import selectors
+import socket
+import stat
+import struct
+import threading
+
+import numpy as np
+
+from launchpad_py.compositor import Compositor
+from launchpad_py.reader import InputReader
+
+__all__ = ['Daemon', 'Client']
+
+# Every message is a header ( <type>, <payload length> ) followed by the payload:
+#   client -> daemon
+#     FRAME      <z:int8> <opacity:uint8> <x> <y> <width> <height>, then width * height
+#                RGBA pixels, 4 bytes each: RGB 0..63, alpha 0..255. Draws into the
+#                client's layer; opacity 0..255.
+#     CLEAR      (empty) makes the client's layer transparent
+#     SUBSCRIBE  <mask:uint8> EVENT_BUTTONS | EVENT_PRESSURE; 0 unsubscribes
+#   daemon -> client
+#     EVENT      <button:uint8> <value:uint8> <timestamp:uint32>, button 255 for pressure
+HEADER = struct.Struct('<BI')
+FRAME_HEAD = struct.Struct('<bBBBBB')
+EVENT = struct.Struct('<BBI')
+
+# largest valid payload, a 255x255 frame; clients announcing more are disconnected
+MAX_PAYLOAD = FRAME_HEAD.size + 4 * 255 * 255
+
+FRAME = 1
+CLEAR = 2
+SUBSCRIBE = 3
+EVENT_MSG = 16
+
+EVENT_BUTTONS = 1
+EVENT_PRESSURE = 2
+
+
+class _Connection(object):
+
+    def __init__(self, sock, layer):
+        self.sock = sock
+        self.layer = layer
+        self.mask = 0
+        self.inbuf = bytearray()
+        self.outbuf = bytearray()
+        self.dropped = 0  # events not delivered because the client didn't read
+
+
+class Daemon(object):
+    """
+    Shares one opened device between processes.
+
+    Only one process can open a MIDI port, so the daemon owns the device and serves
+    clients on the Unix domain socket <path>. Every client draws into its own layer
+    of a Compositor; all layers are blended and sent at most <fps> times per second.
+    Input events are read by an InputReader (with optional press <feedback>, see
+    reader.PressFeedback) and sent to all subscribed clients; each event is packed
+    once and the same bytes go to everyone.
+    Clients that don't read their events fast enough lose events beyond <max_backlog>
+    bytes, instead of stalling the daemon. See Client for the other end.
+    """
+
+    def __init__(self, device, path, fps=60, feedback=None, max_backlog=65536):
+        self.device = device
+        self.path = path
+        self.fps = fps
+        self.max_backlog = max_backlog
+
+        self.compositor = Compositor(device)
+        self.reader = InputReader(device, feedback=feedback)
+        self.reader.on_event = self._on_event
+
+        self.clients = {}  # <socket>: _Connection
+
+        self._selector = selectors.DefaultSelector()
+        self._server = None
+        self._stop = threading.Event()
+        self._thread = None
+        self._n = 0
+
+    def open(self):
+        """
+        Creates the socket; called by serve_forever() and start().
+        """
+
+        if self._server is not None:
+            return
+
+        try:
+            mode = os.lstat(self.path).st_mode
+        except FileNotFoundError:
+            pass
+        else:
+            # most likely left over from a daemon that didn't exit cleanly
+            if not stat.S_ISSOCK(mode):
+                raise FileExistsError("%s exists and is not a socket" % self.path)
+            os.unlink(self.path)
+
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(self.path)
+        self._server.listen()
+        self._server.setblocking(False)
+        self._selector.register(self._server, selectors.EVENT_READ)
+
+    def close(self):
+        """
+        Disconnects all clients and removes the socket; the device stays open.
+        """
+
+        for sock in list(self.clients):
+            self._drop(sock)
+        if self._server is not None:
+            self._selector.unregister(self._server)
+            self._server.close()
+            self._server = None
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+    def _accept(self):
+        sock, _ = self._server.accept()
+        sock.setblocking(False)
+        self._n += 1
+        layer = self.compositor.add_layer("client%d" % self._n)
+        self.clients[sock] = _Connection(sock, layer)
+        self._selector.register(sock, selectors.EVENT_READ)
+
+    def _drop(self, sock):
+        conn = self.clients.pop(sock)
+        self._selector.unregister(sock)
+        sock.close()
+        self.compositor.remove_layer(conn.layer.name)
+
+    def _on_event(self, event):
+        number, value, timestamp = event
+        wanted = EVENT_PRESSURE if number == 255 else EVENT_BUTTONS
+        msg = None
+
+        for conn in self.clients.values():
+            if not conn.mask & wanted:
+                continue
+            if msg is None:
+                msg = HEADER.pack(EVENT_MSG, EVENT.size) + EVENT.pack(number, min(value, 255), timestamp & 0xffffffff)
+            if len(conn.outbuf) + len(msg) > self.max_backlog:
+                conn.dropped += 1
+                continue
+            if not conn.outbuf:
+                self._selector.modify(conn.sock, selectors.EVENT_READ | selectors.EVENT_WRITE)
+            conn.outbuf += msg
+
+    def _read(self, conn):
+        try:
+            data = conn.sock.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            data = b''
+        if not data:
+            self._drop(conn.sock)
+            return
+
+        buf = conn.inbuf
+        buf += data
+        view = memoryview(buf)
+        pos = 0
+        while len(buf) - pos >= HEADER.size:
+            kind, size = HEADER.unpack_from(buf, pos)
+            if size > MAX_PAYLOAD:
+                view.release()
+                self._drop(conn.sock)
+                return
+            if len(buf) - pos - HEADER.size < size:
+                break
+            start = pos + HEADER.size
+            self._handle(conn, kind, view[start:start + size])
+            pos = start + size
+        view.release()
+        del buf[:pos]
+
+    def _handle(self, conn, kind, payload):
+        if kind == FRAME and len(payload) >= FRAME_HEAD.size:
+            z, opacity, x, y, width, height = FRAME_HEAD.unpack_from(payload)
+            if len(payload) != FRAME_HEAD.size + 4 * width * height:
+                return
+            pixels = np.frombuffer(payload, dtype=np.uint8, offset=FRAME_HEAD.size).reshape(height, width, 4)
+            layer = conn.layer
+            layer.z = z
+            layer.opacity = opacity / 255.0
+            rgba = pixels.astype(np.float32)
+            rgba[..., 3] /= 255.0
+            layer.draw(rgba, x, y)
+        elif kind == CLEAR:
+            conn.layer.clear()
+        elif kind == SUBSCRIBE and len(payload) >= 1:
+            conn.mask = payload[0]
+
+    def _write(self, conn):
+        try:
+            sent = conn.sock.send(conn.outbuf)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            self._drop(conn.sock)
+            return
+        del conn.outbuf[:sent]
+        if not conn.outbuf:
+            self._selector.modify(conn.sock, selectors.EVENT_READ)
+
+    def step(self, timeout=0.0):
+        """
+        Handles everything that's pending: new clients, their messages, input events,
+        queued event bytes. Returns after at most <timeout> seconds.
+        """
+
+        for key, events in self._selector.select(timeout):
+            sock = key.fileobj
+            if sock is self._server:
+                self._accept()
+                continue
+            conn = self.clients.get(sock)
+            if conn is not None and events & selectors.EVENT_READ:
+                self._read(conn)
+            conn = self.clients.get(sock)
+            if conn is not None and events & selectors.EVENT_WRITE:
+                self._write(conn)
+
+        self.reader.poll()
+
+    def serve_forever(self):
+        """
+        Serves until stop() is called; composes and sends the layers <fps> times a second.
+        """
+
+        self.open()
+        self._stop.clear()
+        period = 1.0 / self.fps
+        try:
+            while not self._stop.is_set():
+                self.step(period / 4)
+                self.compositor.compose()
+        finally:
+            self.close()
+
+    def start(self):
+        """
+        Runs serve_forever() in a background thread.
+        """
+
+        if self._thread is None:
+            self.open()
+            self._thread = threading.Thread(target=self.serve_forever, name="Daemon", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+class Client(object):
+    """
+    Connects to a Daemon at <path>, e.g.
+      c = Client("/tmp/launchpad.sock")
+      c.frame(frame, z=1)              # ( <h>, <w>, 3 ) RGB or ( <h>, <w>, 4 ) RGBA
+      c.subscribe()
+      for button, value, timestamp in c.events(timeout=1.0): ...
+    """
+
+    def __init__(self, path):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(path)
+        self._inbuf = bytearray()
+
+    def _send(self, kind, payload=b''):
+        self.sock.sendall(HEADER.pack(kind, len(payload)) + payload)
+
+    def frame(self, frame, z=0, opacity=1.0, x=0, y=0):
+        """
+        Draws <frame> into this client's layer at <x>, <y>. RGB frames are opaque;
+        the alpha of RGBA frames is 0..255.
+        """
+
+        frame = np.asarray(frame)
+        height, width = frame.shape[:2]
+        if width > 255 or height > 255:
+            raise ValueError("frames can be 255x255 at most, got %dx%d" % (width, height))
+        if not -128 <= z <= 127:
+            raise ValueError("z must be within -128..127, got %d" % z)
+        if not (0 <= x <= 255 and 0 <= y <= 255):
+            raise ValueError("x and y must be within 0..255, got %d, %d" % (x, y))
+        if frame.shape[2] == 3:
+            pixels = np.empty((height, width, 4), dtype=np.uint8)
+            pixels[..., :3] = np.clip(frame, 0, 63)
+            pixels[..., 3] = 255
+        else:
+            pixels = np.clip(frame, 0, 255).astype(np.uint8)
+            pixels[..., :3] = np.minimum(pixels[..., :3], 63)
+
+        head = FRAME_HEAD.pack(z, int(round(opacity * 255)), x, y, width, height)
+        self._send(FRAME, head + pixels.tobytes())
+
+    def clear(self):
+        self._send(CLEAR)
+
+    def subscribe(self, buttons=True, pressure=False):
+        self._send(SUBSCRIBE, bytes([(EVENT_BUTTONS if buttons else 0) | (EVENT_PRESSURE if pressure else 0)]))
+
+    def events(self, timeout=0.0):
+        """
+        Returns the events received so far as a list of ( <button>, <value>, <timestamp> ),
+        waiting up to <timeout> seconds for the first one (None: forever).
+        """
+
+        self.sock.settimeout(timeout)
+        try:
+            data = self.sock.recv(65536)
+            if not data:
+                raise ConnectionError("daemon closed the connection")
+            self._inbuf += data
+        except (socket.timeout, BlockingIOError):
+            pass
+
+        ret = []
+        pos = 0
+        buf = self._inbuf
+        while len(buf) - pos >= HEADER.size:
+            kind, size = HEADER.unpack_from(buf, pos)
+            if len(buf) - pos - HEADER.size < size:
+                break
+            if kind == EVENT_MSG:
+                ret.append(EVENT.unpack_from(buf, pos + HEADER.size))
+            pos += HEADER.size + size
+        del buf[:pos]
+
+        return ret
+
+    def close(self):
+        self.sock.close()
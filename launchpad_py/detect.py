@@ -0,0 +1,111 @@
+import launchpad_py
+from launchpad_py.launchpad_base import LaunchpadBase
+from launchpad_py.midi import Midi
+
+__all__ = ['detect', 'IDENTITIES']
+
+# Results of all identity requests so far, so ports are only probed once:
+#   <port key>: ( <class name or None>, <firmware version> )
+# with <port key> being ( <port name>, <n-th port of that name> ).
+IDENTITIES = {}
+
+# Novation's SysEx manufacturer id
+NOVATION = [0, 32, 41]
+
+
+def _port_pairs():
+    """
+    Returns all ports that have an in- and an output as list of ( <port key>, <id in>, <id out> ).
+    The n-th input of a name is paired with the n-th output of the same name.
+    """
+
+    inputs = {}
+    outputs = {}
+    for i, name, is_input, is_output in Midi().ListDevices():
+        if is_input:
+            inputs.setdefault(name, []).append(i)
+        if is_output:
+            outputs.setdefault(name, []).append(i)
+
+    ret = []
+    for name, ids_in in inputs.items():
+        for n, (id_in, id_out) in enumerate(zip(ids_in, outputs.get(name, []))):
+            ret.append(((name, n), id_in, id_out))
+
+    return ret
+
+
+def _identify(reply):
+    """
+    Returns ( <class name or None>, <firmware version> ) for an identity <reply>.
+    """
+
+    if reply is None or len(reply) < 15 or reply[4:7] != NOVATION:
+        return None, None
+
+    family = (reply[7], reply[8])
+    firmware = tuple(reply[11:15])
+    for name, entry in launchpad_py.DEVICES.items():
+        if entry['family'] == family:
+            return name, firmware
+
+    return None, firmware
+
+
+def detect(timeout_ms=300, refresh=False):
+    """
+    Finds all attached (and supported) Launchpads and returns them as a list of opened
+    instances of the correct class, e.g. [ <LaunchpadProMk3>, <LaunchpadPro> ].
+    The MIDI ports are enumerated once and all ports not identified yet are probed
+    with a universal SysEx identity request at the same time, waiting at most
+    <timeout_ms> for the replies. Results are kept in IDENTITIES, per port;
+    <refresh> forgets them and probes everything again.
+    Unlike the name based search in open(), this can't mix up a Pro with a Pro Mk3.
+    """
+
+    if refresh:
+        IDENTITIES.clear()
+
+    pairs = _port_pairs()
+
+    probes = []
+    for key, id_in, id_out in pairs:
+        if key in IDENTITIES:
+            continue
+        probe = LaunchpadBase()
+        if not probe.open_ids(id_in, id_out):
+            # most likely in use by another application; try again next time
+            probe.close()
+            continue
+        probe.midi.RawWriteSysEx(LaunchpadBase.IDENTITY_REQUEST)
+        probes.append((key, probe))
+
+    if probes:
+        deadline = probes[0][1].midi.GetTime() + timeout_ms
+        for key, probe in probes:
+            reply = None
+            while True:
+                data = probe.read_sysex(max(deadline - probe.midi.GetTime(), 0))
+                if data is None:
+                    break
+                if probe.is_identity_reply(data):
+                    reply = data
+                    break
+            probe.close()
+            IDENTITIES[key] = _identify(reply)
+
+    ret = []
+    for key, id_in, id_out in pairs:
+        name = IDENTITIES.get(key, (None, None))[0]
+        if name is None:
+            continue
+        entry = launchpad_py.DEVICES[name]
+        if any(part.lower() in key[0].lower() for part in entry['skip']):
+            continue
+
+        lp = launchpad_py.device_class(name)()
+        if lp.open_ids(id_in, id_out):
+            lp.firmware = IDENTITIES[key][1]
+            ret.append(lp)
+
+    return ret
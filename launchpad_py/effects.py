@@ -0,0 +1,176 @@
+import abc
+
+import numpy as np
+
+__all__ = ['Effect', 'Fire', 'Plasma', 'Ripple', 'Life']
+
+
+class Effect(abc.ABC):
+    """
+    Base class of all effects. Every call of step() advances the effect by one frame and
+    returns it as ( <height>, <width>, 3 ) uint8 array of RGB intensities 0..63, ready
+    for FrameBuffer.submit(), Canvas.submit() or as the render callback of an Animation.
+    The default <shape> is one 8x8 grid; for a Canvas, use its ( <height>, <width> ).
+    """
+
+    def __init__(self, shape=(8, 8), seed=None):
+        self.height, self.width = shape
+        self.rng = np.random.default_rng(seed)
+
+    @abc.abstractmethod
+    def step(self):
+        pass
+
+    def __call__(self, n=None, t=None):
+        # so an effect can directly be used as Animation( <target>, <effect> )
+        return self.step()
+
+    @staticmethod
+    def _rgb(red, green, blue):
+        return (np.clip(np.stack((red, green, blue), axis=-1), 0, 63) + 0.5).astype(np.uint8)
+
+
+class Fire(Effect):
+    """
+    Fire, from examples/launchpad_rgb-fire.py: each cell's heat becomes the mean of itself
+    and the three cells below it, minus some cooling. The bottom row is the seed, which
+    flickers by up to <flicker> per step.
+    Heat is kept in <heat>, 0.0..1.0 with row 0 at the top, and mapped onto a black, red,
+    yellow, white gradient. Set the <seed> row to stoke or suffocate it.
+    """
+
+    def __init__(self, shape=(8, 8), flicker=0.2, cooling=0.07, seed=None):
+        super().__init__(shape, seed)
+        self.flicker = flicker
+        self.cooling = cooling
+
+        self.heat = np.zeros((self.height, self.width))
+        self.seed = self.rng.uniform(0.2, 0.8, self.width)
+
+    def step(self):
+        heat = self.heat
+        heat[-1] = self.seed
+
+        # the three cells below each cell, with zeros beyond the left/right edges
+        below = np.pad(heat[1:], ((0, 0), (1, 1)))
+        below = (below[:, :-2] + below[:, 1:-1] + below[:, 2:]) / 3.0
+        below -= self.cooling + 0.02 * self.rng.random(below.shape)
+        heat[:-1] = np.clip((heat[:-1] + below) / 2.0, 0.0, 1.0)
+
+        self.seed = np.clip(self.seed + (0.5 - self.rng.random(self.width)) * self.flicker, 0.0, 1.0)
+
+        # 150 out of 3 * 63 makes the top end yellowish rather than white
+        g = heat * 150.0
+        return self._rgb(g, g - 63.0, g - 126.0)
+
+
+class Plasma(Effect):
+    """
+    Classic plasma: a sum of sine waves over x, y and the distance from a moving center,
+    mapped onto a color wheel. <speed> is the time advanced per step, <scale> the size
+    of the structures in pads.
+    """
+
+    def __init__(self, shape=(8, 8), speed=0.08, scale=4.0, seed=None):
+        super().__init__(shape, seed)
+        self.speed = speed
+        self.scale = scale
+        self.t = 0.0
+
+        self._y, self._x = np.mgrid[0:self.height, 0:self.width] / float(scale)
+
+    def step(self):
+        t = self.t
+        x = self._x
+        y = self._y
+        cx = x - self.width / self.scale * (0.5 + 0.5 * np.sin(t / 3.0))
+        cy = y - self.height / self.scale * (0.5 + 0.5 * np.cos(t / 2.0))
+
+        v = np.sin(x + t) + np.sin((y + t) / 2.0) + np.sin((x + y + t) / 2.0) + np.sin(np.hypot(cx, cy) + t)
+        phase = v * np.pi / 2.0
+
+        self.t += self.speed
+        return self._rgb(31.5 + 31.5 * np.sin(phase),
+                         31.5 + 31.5 * np.sin(phase + 2.0 * np.pi / 3.0),
+                         31.5 + 31.5 * np.sin(phase + 4.0 * np.pi / 3.0))
+
+
+class Ripple(Effect):
+    """
+    Water ripples: press( <x>, <y> ) drops a stone at the pad, the waves spread with the
+    2D wave equation and fade by <damping> per step. Shown in <color> (RGB 0..63),
+    brighter with the wave height.
+    """
+
+    def __init__(self, shape=(8, 8), damping=0.9, color=(0, 32, 63), seed=None):
+        super().__init__(shape, seed)
+        self.damping = damping
+        self.color = np.asarray(color, dtype=float)
+
+        self._now = np.zeros((self.height, self.width))
+        self._prev = np.zeros((self.height, self.width))
+
+    def press(self, x, y, strength=4.0):
+        """
+        Starts a ripple at column <x>, row <y> (row 0 at the top).
+        """
+
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self._now[y, x] += strength
+
+    def step(self):
+        p = np.pad(self._now, 1)
+        neighbours = p[:-2, 1:-1] + p[2:, 1:-1] + p[1:-1, :-2] + p[1:-1, 2:]
+        new = (neighbours / 2.0 - self._prev) * self.damping
+
+        self._prev = self._now
+        self._now = new
+
+        level = np.clip(np.abs(new), 0.0, 1.0)[..., np.newaxis]
+        return (level * self.color + 0.5).astype(np.uint8)
+
+
+class Life(Effect):
+    """
+    Conway's Game of Life. <cells> is a bool array; <wrap> makes the edges wrap around.
+    Living cells are shown in <color>, cells that just died fade out in one step.
+    A dead (or static) world is re-seeded randomly with <density>, if <reseed> is set.
+    """
+
+    def __init__(self, shape=(8, 8), density=0.35, wrap=True, color=(0, 63, 16), reseed=True, seed=None):
+        super().__init__(shape, seed)
+        self.density = density
+        self.wrap = wrap
+        self.reseed = reseed
+        self.color = np.asarray(color, dtype=float)
+
+        self.cells = np.zeros((self.height, self.width), dtype=bool)
+        self.randomize()
+
+    def randomize(self, density=None):
+        self.cells = self.rng.random((self.height, self.width)) < (self.density if density is None else density)
+
+    def toggle(self, x, y):
+        """
+        Flips the cell at column <x>, row <y>.
+        """
+
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.cells[y, x] = not self.cells[y, x]
+
+    def step(self):
+        c = self.cells.astype(np.uint8)
+        if self.wrap:
+            p = np.pad(c, 1, mode='wrap')
+        else:
+            p = np.pad(c, 1)
+        h, w = c.shape
+        n = sum(p[dy:dy + h, dx:dx + w] for dy in range(3) for dx in range(3)) - c
+
+        old = self.cells
+        self.cells = (n == 3) | (old & (n == 2))
+        if self.reseed and (not self.cells.any() or np.array_equal(self.cells, old)):
+            self.randomize()
+
+        level = self.cells + 0.25 * (old & ~self.cells)
+        return (level[..., np.newaxis] * self.color + 0.5).astype(np.uint8)
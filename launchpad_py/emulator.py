@@ -0,0 +1,363 @@
+import math
+import random
+import threading
+import time
+from collections import deque
+
+import numpy as np
+from pygame import midi
+
+from launchpad_py.palette import PALETTE
+
+__all__ = ['Emulator']
+
+
+class Emulator(object):
+    """
+    A software Pro or Pro Mk3 on the MIDI wire, for tests and benchmarks without hardware.
+
+    It behaves like a pygame.midi Input and Output at once (write_short(), write(),
+    write_sys_ex(), poll(), read()), so it can replace the ports of an opened, or even
+    unopened, device; see attach(). Everything the library sends is decoded into the
+    LED state of all 100 LED numbers:
+      <rgb>    ( 100, 3 ) static colors, RGB 0..63 (palette codes via palette.PALETTE)
+      <codes>  ( 100, ) palette code of each LED, -1 if it was set to RGB
+      <modes>  ( 100, ) STATIC, FLASH or PULSE
+      <flash>  ( 100, ) the second color of flashing and the color of pulsing LEDs
+    render() turns that into what the LEDs show at a moment, using the tempo of the
+    MIDI clock received. Identity requests and mode/layout queries are answered on the
+    input side, and start_traffic() generates synthetic presses and pressure.
+
+    <model> is "pro" or "promk3".
+    """
+
+    STATIC = 0
+    FLASH = 1
+    PULSE = 2
+
+    IDENTITY = {'pro': [0x51, 0x00], 'promk3': [0x23, 0x01]}
+    HEADER = {'pro': [0, 32, 41, 2, 16], 'promk3': [0, 32, 41, 2, 14]}
+
+    def __init__(self, model="pro", firmware=(0, 1, 0, 0), time_func=None):
+        self.model = model.lower()
+        self.firmware = list(firmware)
+        self.time_func = midi.time if time_func is None else time_func
+
+        self.rgb = np.zeros((100, 3), dtype=np.int16)
+        self.codes = np.zeros(100, dtype=np.int16)
+        self.modes = np.zeros(100, dtype=np.int8)
+        self.flash = np.zeros(100, dtype=np.int16)
+
+        self.mode = 0  # Pro: live (0) / standalone (1); Mk3: live (0) / programmer (1)
+        self.layout = 0
+
+        self.messages = 0  # messages received
+        self.bytes = 0  # bytes received
+        self.unknown = []  # messages that couldn't be decoded
+        self.clock_ticks = deque(maxlen=48)
+
+        self._input = deque()
+        self._input_lock = threading.Lock()
+        self._traffic = None
+        self._traffic_stop = threading.Event()
+
+    # -------------------------------------------------------------------------------------
+    # -- output side (library -> device)
+    # -------------------------------------------------------------------------------------
+    def write_short(self, status, data1=0, data2=0):
+        self.messages += 1
+        self.bytes += 1 if status >= 248 else 3
+        self._short(status, data1, data2)
+
+    def write(self, data):
+        """
+        [ [ [ <status>, <data1>, <data2> ], <timestamp> ], ... ]
+        """
+
+        for msg, _ in data:
+            msg = list(msg) + [0, 0]
+            self.write_short(msg[0], msg[1], msg[2])
+
+    def write_sys_ex(self, when, msg):
+        data = list(msg)
+        self.messages += 1
+        self.bytes += len(data)
+        if data[:1] == [240]:
+            data = data[1:]
+        if data[-1:] == [247]:
+            data = data[:-1]
+        self._sysex(data)
+
+    def close(self):
+        self.stop_traffic()
+
+    def _set_code(self, number, code, mode=STATIC):
+        if not 0 <= number < 100:
+            return
+        code = min(max(code, 0), 127)
+        if mode == Emulator.STATIC:
+            self.codes[number] = code
+            self.rgb[number] = PALETTE[code]
+            self.modes[number] = Emulator.STATIC
+        else:
+            self.flash[number] = code
+            self.modes[number] = mode
+
+    def _set_rgb(self, number, red, green, blue):
+        if not 0 <= number < 100:
+            return
+        self.codes[number] = -1
+        self.rgb[number] = (min(red, 63), min(green, 63), min(blue, 63))
+        self.modes[number] = Emulator.STATIC
+
+    def _short(self, status, data1, data2):
+        if status == 248:
+            self.clock_ticks.append(time.perf_counter())
+        elif status >= 248:
+            pass
+        elif status & 0xf0 in (0x90, 0xb0):
+            # channel 1 static, 2 flashing, 3 pulsing
+            channel = status & 0x0f
+            if channel <= 2:
+                self._set_code(data1, data2, channel)
+        elif status & 0xf0 == 0x80:
+            self._set_code(data1, 0)
+        else:
+            self.unknown.append([status, data1, data2])
+
+    def _sysex(self, data):
+        if data[:1] == [126] and data[2:4] == [6, 1]:
+            self.reply([126, 0, 6, 2, 0, 32, 41] + self.IDENTITY[self.model] + [0, 0] + self.firmware)
+            return
+
+        header = self.HEADER[self.model]
+        if data[:5] != header or len(data) < 6:
+            self.unknown.append(data)
+            return
+
+        cmd = data[5]
+        args = data[6:]
+        if self.model == "pro":
+            self._sysex_pro(cmd, args)
+        else:
+            self._sysex_mk3(cmd, args)
+
+    def _sysex_pro(self, cmd, args):
+        if cmd == 10:
+            for i in range(0, len(args) - 1, 2):
+                self._set_code(args[i], args[i + 1])
+        elif cmd == 11:
+            for i in range(0, len(args) - 3, 4):
+                self._set_rgb(*args[i:i + 4])
+        elif cmd == 12 and args:
+            for row, code in enumerate(args[1:11]):
+                self._set_code(10 * row + args[0], code)
+        elif cmd == 13 and args:
+            for col, code in enumerate(args[1:11]):
+                self._set_code(10 * args[0] + col, code)
+        elif cmd == 14 and args:
+            for number in range(100):
+                self._set_code(number, args[0])
+        elif cmd == 33:
+            if args:
+                self.mode = args[0]
+        elif cmd == 34:
+            if args:
+                self.layout = args[0]
+        elif cmd == 35 and len(args) >= 2:
+            self._set_code(args[0], args[1], Emulator.FLASH)
+        elif cmd == 40 and len(args) >= 2:
+            self._set_code(args[0], args[1], Emulator.PULSE)
+        elif cmd == 45:
+            # Mode Status, e.g. [ 2, 16, 45, 0 ] in Ableton Live mode
+            self.reply(self.HEADER['pro'] + [45, self.mode])
+        elif cmd == 47:
+            # Layout Status
+            self.reply(self.HEADER['pro'] + [47, self.layout])
+        else:
+            self.unknown.append(self.HEADER['pro'] + [cmd] + args)
+
+    def _sysex_mk3(self, cmd, args):
+        if cmd == 3:
+            # LED specs: [ <type>, <number>, <data...> ], type 0 static, 1 flash, 2 pulse, 3 RGB
+            sizes = {0: 3, 1: 4, 2: 3, 3: 5}
+            i = 0
+            while i < len(args):
+                size = sizes.get(args[i])
+                if size is None or i + size > len(args):
+                    self.unknown.append(self.HEADER['promk3'] + [cmd] + args[i:])
+                    break
+                kind, number = args[i:i + 2]
+                spec = args[i + 2:i + size]
+                if kind == 0:
+                    self._set_code(number, spec[0])
+                elif kind == 1:
+                    self._set_code(number, spec[0])
+                    self._set_code(number, spec[1], Emulator.FLASH)
+                elif kind == 2:
+                    self._set_code(number, spec[0], Emulator.PULSE)
+                else:
+                    self._set_rgb(number, spec[0] >> 1, spec[1] >> 1, spec[2] >> 1)
+                i += size
+        elif cmd == 14:
+            if args:
+                self.mode = args[0]
+            else:
+                self.reply(self.HEADER['promk3'] + [14, self.mode])
+        elif cmd == 0:
+            if args:
+                self.layout = args[0]
+            else:
+                self.reply(self.HEADER['promk3'] + [0, self.layout])
+        else:
+            self.unknown.append(self.HEADER['promk3'] + [cmd] + args)
+
+    # -------------------------------------------------------------------------------------
+    # -- input side (device -> library)
+    # -------------------------------------------------------------------------------------
+    def poll(self):
+        return len(self._input) > 0
+
+    def read(self, count):
+        ret = []
+        with self._input_lock:
+            while self._input and len(ret) < count:
+                ret.append(self._input.popleft())
+        return ret
+
+    def send(self, status, data1=0, data2=0):
+        """
+        Queues a short message from the "device", e.g. send( 144, 11, 127 ).
+        """
+
+        with self._input_lock:
+            self._input.append([[status, data1, data2, 0], self.time_func()])
+
+    def reply(self, data):
+        """
+        Queues a SysEx message from the "device", <data> without F0/F7, in PortMidi's
+        four byte chunks.
+        """
+
+        stamp = self.time_func()
+        raw = [240] + list(data) + [247]
+        raw += [0] * (-len(raw) % 4)
+        with self._input_lock:
+            for i in range(0, len(raw), 4):
+                self._input.append([raw[i:i + 4], stamp])
+
+    def press(self, number, velocity=127):
+        # grid pads are notes, the outer buttons CCs
+        row, col = divmod(number, 10)
+        self.send(144 if 1 <= row <= 8 and 1 <= col <= 8 else 176, number, velocity)
+
+    def release(self, number):
+        self.press(number, 0)
+
+    def pressure(self, value, number=None):
+        """
+        Channel pressure, or polyphonic pressure for pad <number>.
+        """
+
+        if number is None:
+            self.send(208, value, 0)
+        else:
+            self.send(160, number, value)
+
+    def start_traffic(self, presses_per_s=10.0, pressure_per_s=100.0, hold_ms=200, seed=None):
+        """
+        Generates random grid presses (held for <hold_ms>, then released) at
+        <presses_per_s> and channel pressure events at <pressure_per_s> while any pad
+        is held, from a background thread. stop_traffic() ends it.
+        """
+
+        self.stop_traffic()
+        rng = random.Random(seed)
+        self._traffic_stop.clear()
+
+        def run():
+            held = {}  # <number>: <release time>
+            next_press = time.perf_counter()
+            next_pressure = next_press
+            while not self._traffic_stop.is_set():
+                now = time.perf_counter()
+                for number, until in list(held.items()):
+                    if now >= until:
+                        self.release(number)
+                        del held[number]
+                if presses_per_s > 0 and now >= next_press:
+                    number = 10 * rng.randint(1, 8) + rng.randint(1, 8)
+                    if number not in held:
+                        self.press(number, rng.randint(1, 127))
+                        held[number] = now + hold_ms / 1000.0
+                    next_press += 1.0 / presses_per_s
+                if pressure_per_s > 0 and held and now >= next_pressure:
+                    self.pressure(rng.randint(1, 127))
+                    next_pressure += 1.0 / pressure_per_s
+                elif not held:
+                    next_pressure = now
+                self._traffic_stop.wait(0.001)
+            for number in held:
+                self.release(number)
+
+        self._traffic = threading.Thread(target=run, name="EmulatorTraffic", daemon=True)
+        self._traffic.start()
+
+    def stop_traffic(self):
+        if self._traffic is not None:
+            self._traffic_stop.set()
+            self._traffic.join()
+            self._traffic = None
+
+    # -------------------------------------------------------------------------------------
+    # -- state
+    # -------------------------------------------------------------------------------------
+    def bpm(self):
+        """
+        Tempo of the received MIDI clock, 120 if there's none.
+        """
+
+        ticks = self.clock_ticks
+        if len(ticks) < 2 or ticks[-1] == ticks[0]:
+            return 120.0
+        return 60.0 / ((ticks[-1] - ticks[0]) / (len(ticks) - 1) * 24)
+
+    def render(self, now=None):
+        """
+        Returns what the LEDs show at time <now> (time.perf_counter(), default: now) as
+        ( 100, 3 ) RGB array: flashing LEDs alternate with each half beat, pulsing ones
+        fade in and out once per beat.
+        """
+
+        if now is None:
+            now = time.perf_counter()
+        phase = (now * self.bpm() / 60.0) % 1.0
+
+        ret = self.rgb.copy()
+        flashing = self.modes == Emulator.FLASH
+        if phase >= 0.5:
+            ret[flashing] = PALETTE[self.flash[flashing]]
+        pulsing = self.modes == Emulator.PULSE
+        level = 0.5 - 0.5 * math.cos(2.0 * math.pi * phase)
+        ret[pulsing] = (PALETTE[self.flash[pulsing]] * level + 0.5).astype(np.int16)
+
+        return ret
+
+    def grid(self):
+        """
+        The static colors of the 8x8 grid as frame, see FrameBuffer.
+        """
+
+        return self.rgb.reshape(10, 10, 3)[1:9, 1:9][::-1].astype(np.uint8)
+
+    def attach(self, device):
+        """
+        Replaces <device>'s MIDI ports with the emulator and puts it into its default
+        mode, like open() would. Returns <device>.
+        """
+
+        device.midi.devIn = self
+        device.midi.devOut = self
+        device.midi.lost = False
+        device.enter_default_mode()
+        return device
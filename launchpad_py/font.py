@@ -0,0 +1,278 @@
+import struct
+from collections import OrderedDict
+
+import numpy as np
+
+from launchpad_py import charset
+
+__all__ = ['BitmapFont', 'load_bdf', 'load_psf']
+
+
+def _resample_matrix(n_src, n_dst):
+    """
+    Returns an (n_dst, n_src) matrix with the fraction of each source pixel that is
+    covered by each destination pixel (box filter).
+    """
+
+    m = np.zeros((n_dst, n_src))
+    step = n_src / float(n_dst)
+    for i in range(n_dst):
+        lo = i * step
+        hi = lo + step
+        for j in range(int(lo), min(int(np.ceil(hi)), n_src)):
+            m[i, j] = min(hi, j + 1) - max(lo, j)
+
+    return m
+
+
+class BitmapFont(object):
+    """
+    A bitmap font for the grid, mapping (unicode) characters to boolean glyph bitmaps.
+
+    Glyphs larger than <max_height> x <max_width> are scaled down (box filter), all by the
+    same factor, so that the font's cell of <cell_height> x <cell_width> fits into it.
+    Scaled glyphs are kept in an LRU cache of <cache_size> entries.
+    Characters that are not part of the font are shown as <default_char>.
+
+    Use load_bdf(), load_psf() or BitmapFont.from_charset() to create one.
+    """
+
+    def __init__(self, glyphs, cell_height, cell_width, max_height=8, max_width=8,
+                 default_char='?', threshold=0.5, cache_size=512):
+        """
+        <glyphs> is a dict { <char>: <bitmap> } with 2D boolean NumPy arrays, all
+        <cell_height> rows high, but of individual widths.
+        """
+
+        self.glyphs = glyphs
+        self.default_char = default_char
+        self.threshold = threshold
+        self.scale = min(max_height / float(cell_height), max_width / float(cell_width), 1.0)
+        self.height = max(int(round(cell_height * self.scale)), 1)
+
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_charset(cls, proportional=False, space_width=3, **kwargs):
+        """
+        Returns the built in 8x8 font (charset.CHARTAB) with its characters mapped from
+        code page 437 to unicode. With <proportional>, glyphs are cropped to their used columns.
+        """
+
+        g = charset.glyphs()
+        left, width = charset.glyph_widths()
+
+        glyphs = {}
+        for code in range(256):
+            bitmap = g[code]
+            if proportional:
+                if width[code] == 0:
+                    bitmap = np.zeros((8, space_width), dtype=bool)
+                else:
+                    bitmap = bitmap[:, left[code]:left[code] + width[code]]
+            glyphs[bytes([code]).decode('cp437')] = bitmap
+
+        return cls(glyphs, 8, 8, **kwargs)
+
+    def _rasterize(self, bitmap):
+        if self.scale >= 1.0:
+            return bitmap
+
+        h, w = bitmap.shape
+        dh = self.height
+        dw = int(round(w * self.scale))
+        if w == 0 or dw == 0:
+            return np.zeros((dh, max(dw, 0)), dtype=bool)
+
+        ry = _resample_matrix(h, dh)
+        rx = _resample_matrix(w, dw)
+        area = (h / float(dh)) * (w / float(dw))
+        coverage = ry.dot(bitmap.astype(float)).dot(rx.T) / area
+
+        return coverage >= self.threshold
+
+    def glyph(self, char):
+        """
+        Returns the (scaled) glyph of <char> as a read-only boolean NumPy array.
+        """
+
+        ret = self._cache.get(char)
+        if ret is not None:
+            self.hits += 1
+            self._cache.move_to_end(char)
+            return ret
+
+        self.misses += 1
+        bitmap = self.glyphs.get(char)
+        if bitmap is None:
+            bitmap = self.glyphs.get(self.default_char)
+        if bitmap is None:
+            bitmap = np.zeros((self.height, 0), dtype=bool)
+
+        ret = self._rasterize(bitmap)
+        ret.flags.writeable = False
+
+        self._cache[char] = ret
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+        return ret
+
+    def render_text(self, text, spacing=1):
+        """
+        Renders string <text> into a boolean NumPy array, [ <row>, <column> ], with
+        <spacing> empty columns between the characters.
+        """
+
+        gap = np.zeros((self.height, spacing), dtype=bool)
+
+        parts = []
+        for char in text:
+            if parts and spacing > 0:
+                parts.append(gap)
+            parts.append(self.glyph(char))
+
+        if not parts:
+            return np.zeros((self.height, 0), dtype=bool)
+
+        return np.concatenate(parts, axis=1)
+
+
+def load_bdf(path, **kwargs):
+    """
+    Loads a BDF (Glyph Bitmap Distribution Format) font from file <path>.
+    ENCODING values are taken as unicode code points; glyphs without one are skipped.
+    Keyword arguments are passed to BitmapFont().
+    """
+
+    glyphs = {}
+    fbb = None
+    encoding = None
+    bbx = None
+    dwidth = None
+    rows = None
+
+    with open(path, 'r', encoding='latin-1') as f:
+        for line in f:
+            parts = line.split()
+            if not parts:
+                continue
+            key = parts[0]
+
+            if rows is not None:
+                if key == 'ENDCHAR':
+                    if encoding is not None and encoding >= 0:
+                        glyphs[chr(encoding)] = (bbx, dwidth, rows)
+                    rows = None
+                else:
+                    rows.append(int(parts[0], 16))
+            elif key == 'FONTBOUNDINGBOX':
+                fbb = [int(v) for v in parts[1:5]]
+            elif key == 'STARTCHAR':
+                encoding = None
+                bbx = None
+                dwidth = None
+            elif key == 'ENCODING':
+                encoding = int(parts[1])
+            elif key == 'DWIDTH':
+                dwidth = int(parts[1])
+            elif key == 'BBX':
+                bbx = [int(v) for v in parts[1:5]]
+            elif key == 'BITMAP':
+                rows = []
+
+    if fbb is None:
+        raise ValueError("not a BDF font: " + str(path))
+
+    fw, fh, fx, fy = fbb
+    baseline = fh + fy  # rows from the top of the font's cell
+
+    ret = {}
+    for char, (gbbx, gdwidth, grows) in glyphs.items():
+        if gbbx is None:
+            gbbx = fbb
+        gw, gh, gx, gy = gbbx
+        x0 = max(gx, 0)
+        width = max(gdwidth if gdwidth is not None else fw, x0 + gw)
+        bitmap = np.zeros((fh, width), dtype=bool)
+
+        top = baseline - (gy + gh)
+        nbits = ((gw + 7) // 8) * 8
+        for i, value in enumerate(grows[:gh]):
+            y = top + i
+            if not 0 <= y < fh:
+                continue
+            for x in range(gw):
+                if value & (1 << (nbits - 1 - x)):
+                    bitmap[y, x0 + x] = True
+
+        ret[char] = bitmap
+
+    return BitmapFont(ret, fh, fw, **kwargs)
+
+
+def load_psf(path, **kwargs):
+    """
+    Loads a PC Screen Font (PSF1 or PSF2, e.g. the Linux console fonts) from file <path>.
+    If the font has a unicode table, it is used for the mapping, otherwise the first 256
+    glyphs are taken as code page 437.
+    Keyword arguments are passed to BitmapFont().
+    """
+
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    if data[:2] == b'\x36\x04':
+        mode, height = data[2], data[3]
+        width = 8
+        count = 512 if mode & 0x01 else 256
+        has_table = bool(mode & 0x06)
+        offset = 4
+        size = height
+    elif data[:4] == b'\x72\xb5\x4a\x86':
+        _, offset, flags, count, size, height, width = struct.unpack('<7I', data[4:32])
+        has_table = bool(flags & 0x01)
+    else:
+        raise ValueError("not a PSF font: " + str(path))
+
+    row_bytes = (width + 7) // 8
+    raw = np.frombuffer(data, dtype=np.uint8, count=count * size, offset=offset)
+    bits = np.unpackbits(raw.reshape(count, size)[:, :height * row_bytes].reshape(count, height, row_bytes), axis=2)
+    bitmaps = bits[:, :, :width].astype(bool)
+
+    glyphs = {}
+    if not has_table:
+        for i in range(min(count, 256)):
+            glyphs[bytes([i]).decode('cp437')] = bitmaps[i]
+    elif data[:2] == b'\x36\x04':
+        # PSF1: little endian 16 bit entries, 0xFFFE starts sequences, 0xFFFF ends a glyph
+        start = offset + count * size
+        n = (len(data) - start) // 2
+        table = struct.unpack('<%dH' % n, data[start:start + 2 * n])
+        i = 0
+        in_seq = False
+        for value in table:
+            if i >= count:
+                break
+            if value == 0xFFFF:
+                i += 1
+                in_seq = False
+            elif value == 0xFFFE:
+                in_seq = True
+            elif not in_seq:
+                glyphs.setdefault(chr(value), bitmaps[i])
+    else:
+        # PSF2: UTF-8, 0xFE starts sequences, 0xFF ends a glyph
+        table = data[offset + count * size:]
+        i = 0
+        for entry in table.split(b'\xff'):
+            if i >= count:
+                break
+            for char in entry.split(b'\xfe')[0].decode('utf-8', 'replace'):
+                glyphs.setdefault(char, bitmaps[i])
+            i += 1
+
+    return BitmapFont(glyphs, height, width, **kwargs)
@@ -0,0 +1,80 @@
+import contextlib
+
+import numpy as np
+
+__all__ = ['FrameBuffer']
+
+
+class FrameBuffer(object):
+    """
+    Diffing framebuffer for the 8x8 grid of a Pro or Pro Mk3.
+
+    Frames are (8, 8, 3) arrays of RGB intensities 0..63, indexed [ <row>, <column>, <color> ],
+    with row 0 at the top. That's the same as LedCtrlXY() in "classic" mode with y=1..8,
+    or raw LED numbers 81 - 10 * <row> + <column>.
+    submit() only sends the pads that differ from the previously submitted frame.
+    With a running writer thread, frames are sent via output <lane>, e.g. Midi.BULK,
+    so they can't delay interactive feedback (see Midi.StartWriter()).
+    With a <planner> (see planner.Planner), the changes are sent with the fewest bytes
+    instead of one LedCtrlRaw() per pad; the outer LEDs are then kept dark.
+    """
+
+    HEIGHT = 8
+    WIDTH = 8
+
+    def __init__(self, device, lane=None, planner=None):
+        self.device = device
+        self.lane = lane
+        self.planner = planner
+        self.frame = None  # last submitted frame; None if unknown, the next submit sends all
+
+        self.frames = 0  # number of submitted frames
+        self.pads = 0  # number of pads sent
+
+    def _lane(self):
+        if self.lane is None:
+            return contextlib.nullcontext()
+        return self.device.midi.Lane(self.lane)
+
+    def invalidate(self):
+        """
+        Forgets the device's state, e.g. after something else wrote to the grid.
+        The next submit() sends all pads.
+        """
+
+        self.frame = None
+
+    def diff(self, frame):
+        """
+        Returns the ( <rows>, <columns> ) of all pads in <frame> that differ from the
+        last submitted one, as two arrays.
+        """
+
+        if self.frame is None:
+            return np.indices((self.HEIGHT, self.WIDTH)).reshape(2, -1)
+
+        return np.nonzero((frame != self.frame).any(axis=2))
+
+    def submit(self, frame):
+        """
+        Sends the changes from the previous frame to <frame> and returns the number of pads sent.
+        """
+
+        frame = np.clip(np.asarray(frame), 0, 63).astype(np.uint8)
+        rows, cols = self.diff(frame)
+
+        with self._lane():
+            if self.planner is not None:
+                if len(rows):
+                    commands, _ = self.planner.plan_grid(self.frame, frame)
+                    self.planner.execute(self.device, commands)
+            else:
+                for row, col in zip(rows.tolist(), cols.tolist()):
+                    red, green, blue = frame[row, col].tolist()
+                    self.device.LedCtrlRaw(81 - 10 * row + col, red, green, blue)
+
+        self.frame = frame
+        self.frames += 1
+        self.pads += len(rows)
+
+        return len(rows)
@@ -0,0 +1,178 @@
+import logging
+import time
+
+from launchpad_py import palette
+from launchpad_py.framebuffer import FrameBuffer
+from launchpad_py.midi import Midi
+from launchpad_py.planner import Planner
+
+__all__ = ['Governor']
+
+log = logging.getLogger(__name__)
+
+
+class Governor(object):
+    """
+    Adapts the quality of submitted frames to what the output path can take.
+
+    After every <window> frames, the governor compares the bytes its output lane sent
+    (the achieved throughput) with the bytes queued into it and not superseded by a
+    newer write (what the current level needs), see Midi.StartWriter(). It steps down
+    a level if the lane sent less than <keep_up> of that, or if the queue delay
+    (without a writer thread: the time submitting blocked) exceeds <high_ms>. It steps up again after <hold> windows in a
+    row below <low_ms>, unless the level above would need more than the throughput
+    measured the last time the output was saturated (<capacity>, bytes per second):
+      RGB       - frames as they are, RGB SysEx
+      PALETTE   - frames quantized to the nearest palette colors, which costs 3 bytes
+                  per pad instead of 12, sent via the planner (see planner.Planner)
+      THROTTLED - as PALETTE, and only every <divider>-th background frame is sent
+    Every change is logged via the "launchpad_py.governor" logger.
+    """
+
+    RGB = 0
+    PALETTE = 1
+    THROTTLED = 2
+
+    LEVELS = {RGB: 'rgb', PALETTE: 'palette', THROTTLED: 'throttled'}
+
+    def __init__(self, target, lane=Midi.BULK, high_ms=50.0, low_ms=10.0, window=15, hold=4, divider=4,
+                 keep_up=0.8):
+        """
+        <target> is a device, a FrameBuffer or a Canvas. Devices get a FrameBuffer on
+        output <lane>; the others are measured on the lane they send with.
+        """
+
+        if hasattr(target, 'tiles'):
+            buffers = [fb for _, _, _, fb in target.tiles]
+        elif isinstance(target, FrameBuffer):
+            buffers = [target]
+        elif hasattr(target, 'submit'):
+            raise TypeError("Governor needs a device, a FrameBuffer or a Canvas, not %s" % type(target).__name__)
+        else:
+            target = FrameBuffer(target, lane=lane)
+            buffers = [target]
+
+        self.fb = target
+        self.buffers = buffers
+        self.high_ms = high_ms
+        self.low_ms = low_ms
+        self.window = window
+        self.hold = hold
+        self.divider = divider
+        self.keep_up = keep_up
+
+        self.level = Governor.RGB
+        self.decisions = []  # ( <time>, <old level>, <new level>, <reason> )
+
+        colors = dict(enumerate(palette.PALETTE.tolist()))
+        self._rgb_planners = [fb.planner for fb in buffers]
+        self._palette_planners = [Planner.for_device(fb.device, colors) for fb in buffers]
+
+        self._frames = 0
+        self._background = 0
+        self._calm = 0
+        self._blocked_ms = 0.0
+        self._counters = self._lane_counters()
+        self._last = time.perf_counter()
+
+        self.throughput = 0.0  # bytes per second sent in the last window
+        self.demand = 0.0  # bytes per second queued (and not superseded) in the last window
+        self.capacity = None  # throughput the last time the output was saturated
+        self.delay_ms = 0.0  # worst queue delay (or submit time) in the last window
+
+    def _lane_stats(self):
+        for fb in self.buffers:
+            # writes outside of Lane() go to the normal lane
+            yield fb.device.midi.laneStats[Midi.NORMAL if fb.lane is None else fb.lane]
+
+    def _lane_counters(self):
+        """
+        Returns the ( <messages sent>, <bytes sent>, <bytes queued> ) of all lanes.
+        Superseded messages don't count as queued; they never had to be sent.
+        """
+
+        stats = list(self._lane_stats())
+        return (sum(s.sent for s in stats), sum(s.bytes for s in stats),
+                sum(s.queued_bytes - s.superseded_bytes for s in stats))
+
+    def submit(self, frame, background=False):
+        """
+        Submits <frame> at the current quality level. <background> frames are the ones
+        that may be skipped under pressure. Returns the number of pads sent.
+        """
+
+        if background and self.level >= Governor.THROTTLED:
+            self._background += 1
+            if self._background % self.divider:
+                return 0
+
+        if self.level >= Governor.PALETTE:
+            _, frame = palette.quantize(frame)
+
+        started = time.perf_counter()
+        sent = self.fb.submit(frame)
+        self._blocked_ms = max(self._blocked_ms, (time.perf_counter() - started) * 1000.0)
+
+        self._frames += 1
+        if self._frames % self.window == 0:
+            self._evaluate()
+
+        return sent
+
+    def _need_above(self):
+        """
+        Estimated bytes per second the next better level would need, at the current demand.
+        """
+
+        if self.level == Governor.PALETTE:
+            return self.demand * 4.0  # 12 instead of 3 bytes per pad
+        return self.demand * self.divider  # at most, if all frames were background frames
+
+    def _evaluate(self):
+        now = time.perf_counter()
+        elapsed = max(now - self._last, 1e-6)
+        counters = self._lane_counters()
+
+        new = counters[0] - self._counters[0]
+        delays = []
+        for stats in self._lane_stats():
+            delays += list(stats.recent)[-new:] if new > 0 else []
+        self.delay_ms = max(delays + [self._blocked_ms])
+        self.throughput = (counters[1] - self._counters[1]) / elapsed
+        self.demand = (counters[2] - self._counters[2]) / elapsed
+
+        self._counters = counters
+        self._last = now
+        self._blocked_ms = 0.0
+
+        # without a writer thread, nothing is queued and only the delay counts
+        behind = self.demand > 0 and self.throughput < self.keep_up * self.demand
+        if behind or self.delay_ms > self.high_ms:
+            self._calm = 0
+            if self.throughput > 0:
+                self.capacity = self.throughput
+            if behind:
+                reason = "sent %.0f of %.0f bytes/s" % (self.throughput, self.demand)
+            else:
+                reason = "delay %.1f ms > %.1f ms" % (self.delay_ms, self.high_ms)
+            if self.level < Governor.THROTTLED:
+                self._set_level(self.level + 1, reason)
+        elif self.delay_ms < self.low_ms:
+            self._calm += 1
+            if self._calm >= self.hold and self.level > Governor.RGB:
+                need = self._need_above()
+                if self.capacity is None or need <= self.capacity:
+                    self._calm = 0
+                    self._set_level(self.level - 1, "delay %.1f ms < %.1f ms for %d windows" % (self.delay_ms, self.low_ms, self.hold))
+        else:
+            self._calm = 0
+
+    def _set_level(self, level, reason):
+        old = self.level
+        self.level = level
+        planners = self._rgb_planners if level == Governor.RGB else self._palette_planners
+        for fb, planner in zip(self.buffers, planners):
+            fb.planner = planner
+        self.decisions.append((time.time(), old, level, reason))
+
+        log.info("%s -> %s: %s (%.0f bytes/s)", Governor.LEVELS[old], Governor.LEVELS[level], reason, self.throughput)
@@ -0,0 +1,166 @@
+import threading
+import time
+
+from launchpad_py.midi import Midi
+
+__all__ = ['HotplugWatcher']
+
+
+class HotplugWatcher(object):
+    """
+    Keeps an opened device usable across unplugging and re-plugging it.
+
+    A device counts as lost as soon as a read or a write fails (see Midi.lost). From then
+    on, all writes are silently dropped, so the render thread never blocks or crashes,
+    while the LED methods still record the latest state. Every <interval_s> seconds the
+    watcher looks for the device's MIDI port again, re-opens it, re-applies the mode via
+    enter_default_mode() and replays the last known LEDs via restore_leds().
+
+    A writer thread (Midi.StartWriter()) that ran before the loss is started again.
+
+    PortMidi only notices re-attached devices after a restart (Midi.Reinit()), which
+    invalidates the ports of all other devices of this process, too. So the watcher
+    restarts PortMidi only while no other device is connected, at most every
+    Midi.REINIT_MIN_S seconds for all watchers together, and backs off after each
+    attempt that didn't bring the device back, up to <max_backoff_s>. While another
+    device stays connected, a lost one therefore only comes back once the application
+    calls Midi().Reinit( force=True ). With <reinit> set to False, PortMidi is never
+    restarted and the device can't be found again until the application does so.
+    """
+
+    def __init__(self, device, interval_s=1.0, reinit=True, max_backoff_s=60.0, on_lost=None, on_reconnect=None):
+        """
+        <device>       an opened device
+        <on_lost>      optional callback( <device> ), when the device vanished
+        <on_reconnect> optional callback( <device> ), after it is back
+        """
+
+        self.device = device
+        self.interval_s = interval_s
+        self.reinit = reinit
+        self.max_backoff_s = max_backoff_s
+        self.on_lost = on_lost
+        self.on_reconnect = on_reconnect
+
+        self._backoff_s = interval_s
+        self._next_reinit = 0.0
+
+        self.connected = True
+        self.port = self._port_key(device.idIn)
+        self.writer = False  # a writer thread was running when the device was lost
+
+        self._stop = threading.Event()
+        self._thread = None
+
+    @staticmethod
+    def _port_key(id_in):
+        """
+        Returns ( <port name>, <n-th input of that name> ) for input <id_in>; unlike the
+        ids, that survives re-enumeration.
+        """
+
+        seen = {}
+        for i, name, is_input, _ in Midi().ListDevices():
+            if not is_input:
+                continue
+            if i == id_in:
+                return name, seen.get(name, 0)
+            seen[name] = seen.get(name, 0) + 1
+
+        return None
+
+    def _find(self):
+        """
+        Returns the current ( <id in>, <id out> ) of our port or None, if it's not there.
+        """
+
+        if self.port is None:
+            return None
+
+        name, n = self.port
+        ids_in = []
+        ids_out = []
+        for i, port_name, is_input, is_output in Midi().ListDevices():
+            if port_name == name:
+                if is_input:
+                    ids_in.append(i)
+                if is_output:
+                    ids_out.append(i)
+
+        if n < len(ids_in) and n < len(ids_out):
+            return ids_in[n], ids_out[n]
+
+        return None
+
+    def check(self):
+        """
+        Checks the device once and tries to re-open it, if it was lost.
+        Returns True if the device is (again) connected.
+        Called periodically by the watcher thread after start(), but can also be called
+        from the application's own loop instead.
+        """
+
+        midi = self.device.midi
+
+        if self.connected:
+            if not midi.lost:
+                return True
+
+            self.connected = False
+            self.writer = midi.WriterRunning()
+            midi.CloseOutput(close=True)
+            midi.CloseInput(close=True)
+
+            if self.on_lost is not None:
+                self.on_lost(self.device)
+
+        ids = self._find()
+        if ids is None and self.reinit and time.monotonic() >= self._next_reinit:
+            if Midi().Reinit():
+                ids = self._find()
+            if ids is None:
+                self._next_reinit = time.monotonic() + self._backoff_s
+                self._backoff_s = min(2 * self._backoff_s, self.max_backoff_s)
+        if ids is None:
+            return False
+
+        if not self.device.open_ids(ids[0], ids[1]):
+            midi.CloseInput()
+            midi.CloseOutput()
+            return False
+
+        if self.writer:
+            midi.StartWriter()
+        self.device.restore_leds()
+        self.connected = True
+        self._backoff_s = self.interval_s
+        self._next_reinit = 0.0
+
+        if self.on_reconnect is not None:
+            self.on_reconnect(self.device)
+
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.interval_s):
+            self.check()
+
+    def start(self):
+        """
+        Starts watching in a background thread.
+        """
+
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="HotplugWatcher", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """
+        Stops the background thread.
+        """
+
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
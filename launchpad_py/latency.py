@@ -0,0 +1,154 @@
+import time
+
+__all__ = ['LatencyProbe', 'percentiles']
+
+
+def percentiles(values, ps=(50, 90, 99)):
+    """
+    Returns a dict { <p>: <value> } with the nearest-rank percentiles <ps> of <values>,
+    plus 'max'. Empty dict if there are no values.
+    """
+
+    if not values:
+        return {}
+
+    ordered = sorted(values)
+    ret = {}
+    for p in ps:
+        rank = max(int(round(p / 100.0 * len(ordered) + 0.5)) - 1, 0)
+        ret[p] = ordered[min(rank, len(ordered) - 1)]
+    ret['max'] = ordered[-1]
+
+    return ret
+
+
+class LatencyProbe(object):
+    """
+    Measures the time from a pad press until the LED update that reacts to it has left
+    the host, split into the stages
+      input    - press until the event is decoded by ButtonStateRaw()
+      callback - the user's reaction to it
+      write    - the LED write, RGB SysEx via LedCtrlRaw() or palette via LedCtrlRawByCode()
+      total    - all of the above
+
+    Two ways to create the "press":
+      loopback=True   The device is opened on a MIDI loopback port (output wired back
+                      to its input, e.g. "Midi Through", IAC or the emulator backend).
+                      The probe sends a note-on itself and waits for it to come back.
+      loopback=False  A real device. Presses can't be faked, so the device's reply to a
+                      universal SysEx identity request serves as the press; the input
+                      stage then is the full wire round trip.
+
+    Works with LaunchpadPro and LaunchpadProMk3 (and everything else providing
+    LedCtrlRaw() and LedCtrlRawByCode()).
+    """
+
+    STAGES = ('input', 'callback', 'write', 'total')
+
+    def __init__(self, device, path="rgb", loopback=True, callback=None, pad=11):
+        """
+        <device>   an opened Launchpad instance
+        <path>     "rgb" or "palette", the LED write method to measure
+        <callback> called with the decoded event, returns a color: [<r>,<g>,<b>] for the RGB,
+                   a colorcode for the palette path. A fixed color is used if omitted.
+        <pad>      the raw button/LED number used for the test
+        """
+
+        self.device = device
+        self.path = path.lower()
+        self.loopback = loopback
+        self.callback = callback
+        self.pad = pad
+
+        self.samples = dict((stage, []) for stage in self.STAGES)
+        self.timeouts = 0
+
+    def _wait_press(self, timeout_ms):
+        if not self.loopback:
+            if self.device.query_identity(timeout_ms) is None:
+                return None
+            return [self.pad, 127]
+
+        self.device.midi.RawWrite(144, self.pad, 127)
+        deadline = time.perf_counter() + timeout_ms / 1000.0
+        while time.perf_counter() < deadline:
+            but = self.device.ButtonStateRaw()
+            if but != [] and but[0] == self.pad:
+                return but
+        return None
+
+    def _write(self, color):
+        if self.path == "palette":
+            self.device.LedCtrlRawByCode(self.pad, color)
+        else:
+            self.device.LedCtrlRaw(self.pad, color[0], color[1], color[2])
+
+    def measure(self, timeout_ms=500):
+        """
+        Runs a single measurement. Returns a dict with the duration of each stage in ms,
+        or None if the press did not arrive within <timeout_ms>.
+        """
+
+        t_press = time.perf_counter()
+        event = self._wait_press(timeout_ms)
+        if event is None:
+            self.timeouts += 1
+            return None
+        t_decoded = time.perf_counter()
+
+        if self.callback is not None:
+            color = self.callback(event)
+        elif self.path == "palette":
+            color = 5
+        else:
+            color = [63, 0, 0]
+        t_reacted = time.perf_counter()
+
+        self._write(color)
+        t_written = time.perf_counter()
+
+        ret = {
+            'input': (t_decoded - t_press) * 1000.0,
+            'callback': (t_reacted - t_decoded) * 1000.0,
+            'write': (t_written - t_reacted) * 1000.0,
+            'total': (t_written - t_press) * 1000.0,
+        }
+        for stage in self.STAGES:
+            self.samples[stage].append(ret[stage])
+
+        return ret
+
+    def run(self, count=200, interval_ms=20, timeout_ms=500):
+        """
+        Runs <count> measurements, <interval_ms> apart, and returns the report().
+        In loopback mode, the LED writes come back in as well; they are flushed in between.
+        """
+
+        self.device.flush_buttons()
+        for _ in range(count):
+            self.measure(timeout_ms)
+            time.sleep(interval_ms / 1000.0)
+            self.device.flush_buttons()
+
+        return self.report()
+
+    def report(self, ps=(50, 90, 99)):
+        """
+        Returns { <stage>: { <p>: <ms>, ..., 'max': <ms> } } for all stages.
+        """
+
+        return dict((stage, percentiles(self.samples[stage], ps)) for stage in self.STAGES)
+
+    def format_report(self, ps=(50, 90, 99)):
+        """
+        Returns the report() as a printable table.
+        """
+
+        lines = ["%-9s" % (self.path,) + "".join("%9s" % ("p%d" % p) for p in ps) + "%9s" % "max"]
+        for stage, values in self.report(ps).items():
+            if not values:
+                continue
+            lines.append("%-9s" % stage + "".join("%9.3f" % values[p] for p in ps) + "%9.3f" % values['max'])
+        lines.append("samples: %d, timeouts: %d" % (len(self.samples['total']), self.timeouts))
+
+        return "\n".join(lines)
@@ -1,3 +1,6 @@
+import threading
+from collections import deque
+
 from pygame import time
 
 from launchpad_py.midi import Midi
@@ -6,15 +9,28 @@ __all__ = ['LaunchpadBase']
 
 
 class LaunchpadBase(object):
+    # universal SysEx identity request; F0 and F7 are added by RawWriteSysEx()
+    IDENTITY_REQUEST = [126, 127, 6, 1]
+
     def __init__(self):
         self.midi = Midi()  # midi interface instance (singleton)
         self.idOut = None  # midi id for output
         self.idIn = None  # midi id for input
+        self.firmware = None  # firmware version, if known (see detect.detect())
+        self.clock = None  # optional ClockFollower, fed with system real-time messages
+        self._pending = deque()  # events put back for the next read, see flush_buttons()
+
+        # last known LED state, for restore_leds()
+        self.led_fill = None  # colorcode of the last LedAllOn()
+        self.led_state = {}  # <number>: ( <method name>, <args> ), in order of the writes
+        self._led_lock = threading.Lock()
 
         # scroll directions
         self.SCROLL_NONE = 0
         self.SCROLL_LEFT = -1
         self.SCROLL_RIGHT = 1
+        self.SCROLL_UP = -2
+        self.SCROLL_DOWN = 2
 
     def __del__(self):
         self.close()
@@ -35,6 +51,32 @@ class LaunchpadBase(object):
 
         return self.midi.OpenInput(self.idIn)
 
+    def open_ids(self, idIn, idOut):
+        """
+        Opens a device by its MIDI input and output ids (see Midi.ListDevices() or
+        detect.detect()) and puts it into the mode the class needs.
+        """
+
+        self.idIn = idIn
+        self.idOut = idOut
+
+        if not self.midi.OpenOutput(self.idOut):
+            return False
+
+        if not self.midi.OpenInput(self.idIn):
+            return False
+
+        self.enter_default_mode()
+        return True
+
+    def enter_default_mode(self):
+        """
+        Puts a freshly opened device into the mode this class works with.
+        Nothing to do here; overridden by the device classes.
+        """
+
+        pass
+
     def check(self, number=0, name="Launchpad"):
         """
         Checks if a device exists, but does not open it.
@@ -49,6 +91,45 @@ class LaunchpadBase(object):
 
         return True
 
+    def _remember(self, number, method, *args):
+        """
+        Records the last write to LED <number> as a call of <method> with <args>
+        (including <number>), for restore_leds(). Flashing is kept on top of the
+        LED's static color, which is its first color.
+        """
+
+        with self._led_lock:
+            if method == 'LedCtrlFlashByCode':
+                key = ('flash', number)
+            else:
+                key = number
+                self.led_state.pop(('flash', number), None)
+
+            self.led_state.pop(key, None)
+            self.led_state[key] = (method, (number,) + args)
+
+    def _remember_fill(self, colorcode):
+        with self._led_lock:
+            self.led_fill = colorcode
+            self.led_state = {}
+
+    def restore_leds(self):
+        """
+        Sends the last known state of all LEDs again, e.g. after the device was
+        re-attached. Only writes via the LED methods are known, not raw MIDI messages.
+        """
+
+        # a snapshot; other threads may keep drawing meanwhile
+        with self._led_lock:
+            fill = self.led_fill
+            state = list(self.led_state.values())
+
+        if fill is not None:
+            self.LedAllOn(fill)
+
+        for method, args in state:
+            getattr(self, method)(*args)
+
     def close(self):
         """
         Closes this device
@@ -64,29 +145,175 @@ class LaunchpadBase(object):
 
         self.midi.SearchDevices(searchString, True, True, False)
 
-    def flush_buttons(self):
+    def flush_buttons(self, timeout_ms=None, keep_latest=False):
         """
         Clears the button buffer (The Launchpads remember everything...)
-        Because of empty reads (timeouts), there's nothing more we can do here, but
-        repeat the polls and wait a little...
+        Drains the input in bulk reads until it is empty or, if given, <timeout_ms>
+        have passed. Returns the number of discarded events.
+        With <keep_latest>, only the most recent event per button (and the most recent
+        pressure value) survives and will be returned by the next button state calls,
+        in the order they arrived. Everything else is discarded.
+        MIDI clock messages are still passed to an attached clock follower.
         """
 
-        n_attempts = 0
-        n_retries = 3
-        while n_attempts < n_retries:
-            if self.midi.ReadCheck():
-                n_attempts = 0
-                self.midi.ReadRaw()
+        deadline = None
+        if timeout_ms is not None:
+            deadline = self.midi.GetTime() + timeout_ms
+
+        events = [a[0] for a in self._pending]
+        self._pending.clear()
+
+        n_events = 0
+        latest = {}
+        while True:
+            for e in events:
+                status = e[0][0]
+                if status >= 248:
+                    if self.clock is not None:
+                        self.clock.feed(status, e[1])
+                    continue
+
+                n_events += 1
+                if keep_latest and 128 <= status < 240:
+                    if status == 208:
+                        key = (status,)
+                    else:
+                        key = (status, e[0][1])
+                    # move it to the end, so the order of the last events is preserved
+                    latest.pop(key, None)
+                    latest[key] = e
+
+            if deadline is not None and self.midi.GetTime() >= deadline:
+                break
+            if not self.midi.ReadCheck():
+                break
+            events = self.midi.ReadRaw(256)
+
+        for e in latest.values():
+            self._pending.append([e])
+
+        return n_events - len(latest)
+
+    def attach_clock(self, follower):
+        """
+        Attaches a ClockFollower to the input path. From now on, MIDI clock, start, stop
+        and continue messages are fed to it, instead of being discarded by the button
+        state methods.
+        """
+
+        if follower.time_func is None:
+            follower.time_func = self.midi.GetTime
+        self.clock = follower
+
+    def _read_raw(self):
+        """
+        Returns the next event like ReadRaw() does, or [] if nothing is left.
+        System real-time messages (status >= 248, clock, start, stop...) are skipped
+        and passed to the attached clock follower.
+        """
+
+        while self._pending or self.midi.ReadCheck():
+            if self._pending:
+                a = self._pending.popleft()
             else:
-                n_attempts += 1
-                time.wait(5)
+                a = self.midi.ReadRaw()
+            if a == []:
+                return []
+            if a[0][0][0] < 248:
+                return a
+            if self.clock is not None:
+                self.clock.feed(a[0][0][0], a[0][1])
+
+        return []
+
+    @staticmethod
+    def _stamped(ret, a, returnTimestamp):
+        """
+        Appends the PortMidi timestamp (ms, see Midi.GetTime()) of event <a> to the
+        button state list <ret>, if requested.
+        """
+
+        if returnTimestamp:
+            ret.append(a[0][1])
+        return ret
+
+    def read_sysex(self, timeout_ms=500):
+        """
+        Waits up to <timeout_ms> for a system-exclusive message and returns its data
+        bytes as a list, without the leading 240 (F0) and the trailing 247 (F7).
+        Returns None if nothing (complete) arrived in time.
+        PortMidi delivers SysEx messages in chunks of four bytes; other events that show
+        up meanwhile are kept for the button state methods, real-time messages go to
+        the clock follower.
+        """
+
+        deadline = self.midi.GetTime() + timeout_ms
+        data = None
+
+        while True:
+            if not self.midi.ReadCheck():
+                if self.midi.GetTime() >= deadline:
+                    return None
+                time.wait(1)
+                continue
+
+            events = self.midi.ReadRaw(64)
+            for i, e in enumerate(events):
+                chunk = e[0]
+                if chunk[0] >= 248:
+                    if self.clock is not None:
+                        self.clock.feed(chunk[0], e[1])
+                    continue
+
+                if chunk[0] == 240:
+                    data = []
+                    chunk = chunk[1:]
+                elif data is None or (chunk[0] >= 128 and chunk[0] != 247):
+                    # not part of a SysEx message (or a broken one)
+                    data = None
+                    self._pending.append([e])
+                    continue
+
+                for b in chunk:
+                    if b == 247:
+                        # whatever came after it in this batch is for the next reads
+                        self._pending.extend([a] for a in events[i + 1:])
+                        return data
+                    data.append(b)
+
+    @staticmethod
+    def is_identity_reply(data):
+        """
+        True if SysEx <data> (as returned by read_sysex()) is a universal identity reply.
+        """
+
+        return len(data) >= 4 and data[0] == 126 and data[2] == 6 and data[3] == 2
+
+    def query_identity(self, timeout_ms=500):
+        """
+        Sends a universal SysEx identity request and returns the device's reply, e.g.
+        [ 126, <id>, 6, 2, 0, 32, 41, <family>, <family>, <model>, <model>, <version x4> ]
+        Returns None if there was no (valid) answer within <timeout_ms>.
+        """
+
+        self.midi.RawWriteSysEx(self.IDENTITY_REQUEST)
+
+        deadline = self.midi.GetTime() + timeout_ms
+        while True:
+            data = self.read_sysex(max(deadline - self.midi.GetTime(), 0))
+            if data is None:
+                return None
+            if self.is_identity_reply(data):
+                return data
 
     def read_raw_events(self):
         """
         Returns a list of all MIDI events, empty list if nothing happened.
         Useful for debugging or checking new devices.
         """
-        if self.midi.ReadCheck():
+        if self._pending:
+            return self._pending.popleft()
+        elif self.midi.ReadCheck():
             return self.midi.ReadRaw()
         else:
             return []
@@ -1,6 +1,6 @@
 from pygame import time
 
-from launchpad_py.charset import CHARTAB
+from launchpad_py.charset import render_text
 from launchpad_py.launchpad_base import LaunchpadBase
 
 __all__ = ['LaunchpadPro']
@@ -113,6 +113,10 @@ class LaunchpadPro(LaunchpadBase):
         'green': 17,
     }
 
+    def __init__(self):
+        super(LaunchpadPro, self).__init__()
+        self._bitmap_shown = None  # grid colors as last sent by LedCtrlBitmap(), None if unknown
+
     def open(self, number=0, name="Pro"):
         """
         Opens one of the attached Launchpad MIDI devices.
@@ -122,10 +126,17 @@ class LaunchpadPro(LaunchpadBase):
         if retval:
             # avoid sending this to an Mk2
             if name.lower() == "pro":
-                self.set_mode(0)
+                self.enter_default_mode()
 
         return retval
 
+    def enter_default_mode(self):
+        """
+        Selects "Ableton Live mode", which the raw and XY numbering relies on.
+        """
+
+        self.set_mode(0)
+
     def check(self, number=0, name="Launchpad Pro"):
         """
         Checks if a device exists, but does not open it.
@@ -229,7 +240,8 @@ class LaunchpadPro(LaunchpadBase):
         green = limit(green, 0, 63)
         blue = limit(blue, 0, 63)
 
-        self.midi.RawWriteSysEx([0, 32, 41, 2, 16, 11, number, red, green, blue])
+        self._remember(number, 'LedCtrlRaw', red, green, blue)
+        self.midi.RawWriteSysEx([0, 32, 41, 2, 16, 11, number, red, green, blue], key=number)
 
     def LedCtrlRawByCode(self, number, colorcode=None):
         """
@@ -247,7 +259,8 @@ class LaunchpadPro(LaunchpadBase):
         if colorcode is None:
             colorcode = LaunchpadPro.COLORS['white']
 
-        self.midi.RawWrite(144, number, colorcode)
+        self._remember(number, 'LedCtrlRawByCode', colorcode)
+        self.midi.RawWrite(144, number, colorcode, key=number)
 
     def LedCtrlPulseByCode(self, number, colorcode=None):
         """
@@ -263,7 +276,8 @@ class LaunchpadPro(LaunchpadBase):
             colorcode = LaunchpadPro.COLORS['white']
 
         # for Mk2: [ 0, 32, 41, 2, *24*, 40, *0*, number, colorcode ] (also an error in the docs)
-        self.midi.RawWriteSysEx([0, 32, 41, 2, 16, 40, number, colorcode])
+        self._remember(number, 'LedCtrlPulseByCode', colorcode)
+        self.midi.RawWriteSysEx([0, 32, 41, 2, 16, 40, number, colorcode], key=number)
 
     def LedCtrlFlashByCode(self, number, colorcode=None):
         """
@@ -281,7 +295,78 @@ class LaunchpadPro(LaunchpadBase):
             colorcode = LaunchpadPro.COLORS['white']
 
         # for Mk2: [ 0, 32, 41, 2, *24*, *35*, *0*, number, colorcode ] (also an error in the docs)
-        self.midi.RawWriteSysEx([0, 32, 41, 2, 16, 35, number, colorcode])
+        self._remember(number, 'LedCtrlFlashByCode', colorcode)
+        self.midi.RawWriteSysEx([0, 32, 41, 2, 16, 35, number, colorcode], key=number)
+
+    def LedCtrlRawMulti(self, leds):
+        """
+        Sets several LEDs at once. <leds> is a list of ( <number>, <red>, <green>, <blue> ),
+        with intensities 0..63. Sent as one SysEx message per 78 LEDs, which costs 4 bytes
+        per LED instead of the 10 bytes of LedCtrlRaw().
+        """
+
+        limit = lambda n: max(min(63, n), 0)
+
+        data = []
+        for number, red, green, blue in leds:
+            if number < 0 or number > 99:
+                continue
+            red, green, blue = limit(red), limit(green), limit(blue)
+            self._remember(number, 'LedCtrlRaw', red, green, blue)
+            data.append([number, red, green, blue])
+
+        for i in range(0, len(data), 78):
+            self.midi.RawWriteSysEx([0, 32, 41, 2, 16, 11] + [v for led in data[i:i + 78] for v in led])
+
+    def LedCtrlRawByCodeMulti(self, leds):
+        """
+        Sets several LEDs at once. <leds> is a list of ( <number>, <colorcode> ).
+        Sent as one SysEx message per 97 LEDs, 2 bytes per LED plus 8 per message,
+        instead of the 3 bytes per LED of LedCtrlRawByCode().
+        """
+
+        data = []
+        for number, colorcode in leds:
+            if number < 0 or number > 99:
+                continue
+            colorcode = min(127, max(0, colorcode))
+            self._remember(number, 'LedCtrlRawByCode', colorcode)
+            data.append([number, colorcode])
+
+        for i in range(0, len(data), 97):
+            self.midi.RawWriteSysEx([0, 32, 41, 2, 16, 10] + [v for led in data[i:i + 97] for v in led])
+
+    def LedCtrlRow(self, row, colorcodes):
+        """
+        Sets the LEDs of raw row <row> (0..9, bottom to top; LED numbers 10 * <row> + 0..9)
+        to <colorcodes>, from left to right, starting with the left outer button.
+        Up to 10 codes; LEDs beyond the given codes are left alone.
+        """
+
+        if row < 0 or row > 9:
+            return
+
+        colorcodes = [min(127, max(0, c)) for c in colorcodes[:10]]
+        for col, colorcode in enumerate(colorcodes):
+            self._remember(10 * row + col, 'LedCtrlRawByCode', colorcode)
+
+        self.midi.RawWriteSysEx([0, 32, 41, 2, 16, 13, row] + colorcodes)
+
+    def LedCtrlColumn(self, column, colorcodes):
+        """
+        Sets the LEDs of raw column <column> (0..9, left to right; LED numbers <column> + 10 * 0..9)
+        to <colorcodes>, from bottom to top, starting with the bottom outer button.
+        Up to 10 codes; LEDs beyond the given codes are left alone.
+        """
+
+        if column < 0 or column > 9:
+            return
+
+        colorcodes = [min(127, max(0, c)) for c in colorcodes[:10]]
+        for row, colorcode in enumerate(colorcodes):
+            self._remember(10 * row + column, 'LedCtrlRawByCode', colorcode)
+
+        self.midi.RawWriteSysEx([0, 32, 41, 2, 16, 12, column] + colorcodes)
 
     def LedCtrlXY(self, x, y, red, green, blue=None, mode="classic"):
         """
@@ -388,43 +473,95 @@ class LaunchpadPro(LaunchpadBase):
 
         self.LedCtrlRaw(led, lstColor[0], lstColor[1], lstColor[2])
 
-    def LedCtrlChar(self, char, red, green, blue=None, offsx=0, offsy=0):
-        """
-        Sends character <char> in colors <red/green/blue> and lateral offset <offsx> (-8..8)
-        to the Launchpad. <offsy> does not have yet any function.
-        If <blue> is omitted, this method runs in "Classic" compatibility mode and the
-        old 0..3 <red/green> values are multiplied with 21, to match the "Pro" 0..63 range.
+    def _remember(self, number, method, *args):
+        # any other write makes LedCtrlBitmap()'s record of that LED stale
+        shown = self._bitmap_shown
+        if shown is not None:
+            shown.pop(number, None)
+        super(LaunchpadPro, self)._remember(number, method, *args)
+
+    def LedCtrlBitmap(self, bitmap, red, green, blue=None, offsx=0, offsy=0, full=False, clear=True):
+        """
+        Shows a boolean <bitmap> (a list of rows or a 2D array of any size, e.g. from
+        charset.render_text()) in colors <red/green/blue> on the 8x8 grid. The top left
+        pixel of the bitmap is placed at grid column <offsx> and row <offsy>; both may be
+        negative or beyond 7 to move it partly or completely out of sight.
+        All grid LEDs not covered by a set pixel are turned off. Without <clear>, only the
+        LEDs within the bitmap's area are (set or turned off); the others stay as they are.
+        Only the LEDs whose color changed since the last call are sent; LEDs set by the
+        other LED methods in between are sent again, too. If the grid was changed by raw
+        MIDI messages, <full> sends all 64 again.
+        If <blue> is omitted, "Classic" compatibility mode is turned on and the old
+        0..3 color intensity range is streched by 21 to 0..63.
         """
 
-        char = ord(char)
-        char = min(char, 255)
-        char = max(char, 0) * 8
-
         # compatibility mode
         if blue is None:
             red *= 21
             green *= 21
             blue = 0
 
-        for i in range(81, 1, -10):
-            for j in range(8):
-                sum = i + j + offsx
-                if sum >= i and sum < i + 8:
-                    if CHARTAB[char] & 0x80 >> j:
-                        self.LedCtrlRaw(sum, red, green, blue)
-                    else:
-                        self.LedCtrlRaw(sum, 0, 0, 0)
-            char += 1
+        height = len(bitmap)
 
-    def LedCtrlString(self, text, red, green, blue=None, direction=None, waitms=150):
+        shown = self._bitmap_shown
+        if full or shown is None:
+            shown = {}
+
+        color = (red, green, blue)
+        off = (0, 0, 0)
+
+        for row in range(8):
+            y = row - offsy
+            for col in range(8):
+                x = col - offsx
+                inside = 0 <= y < height and 0 <= x < len(bitmap[y])
+                if inside and bitmap[y][x]:
+                    c = color
+                elif inside or clear:
+                    c = off
+                else:
+                    continue
+
+                led = 81 - 10 * row + col
+                if shown.get(led) != c:
+                    self.LedCtrlRaw(led, c[0], c[1], c[2])
+                    shown[led] = c
+
+        self._bitmap_shown = shown
+
+    def LedCtrlChar(self, char, red, green, blue=None, offsx=0, offsy=0, font=None, clear=False):
+        """
+        Sends character <char> in colors <red/green/blue> with a lateral offset <offsx>
+        and a vertical offset <offsy> (both -8..8, positive is right/down) to the Launchpad.
+        Only the LEDs within the character's cell are set or turned off, so it can be drawn
+        over a background; with <clear>, all other grid LEDs are turned off, too.
+        Only LEDs that change are sent, see LedCtrlBitmap().
+        <font> is an optional font.BitmapFont, for characters beyond the built in code page 437.
+        If <blue> is omitted, this method runs in "Classic" compatibility mode and the
+        old 0..3 <red/green> values are multiplied with 21, to match the "Pro" 0..63 range.
+        """
+
+        if font is None:
+            bitmap = render_text(char)
+        else:
+            bitmap = font.glyph(char)
+
+        self.LedCtrlBitmap(bitmap, red, green, blue, offsx, offsy, clear=clear)
+
+    def LedCtrlString(self, text, red, green, blue=None, direction=None, waitms=150, spacing=1, font=None):
         """
         Scroll <text>, with color specified by <red/green/blue>, as fast as we can.
-        <direction> specifies: -1 to left, 0 no scroll, 1 to right
+        <direction> specifies: -1 to left, 0 no scroll, 1 to right, -2 up, 2 down
+        (SCROLL_LEFT, SCROLL_NONE, SCROLL_RIGHT, SCROLL_UP, SCROLL_DOWN)
         If <blue> is omitted, "Classic" compatibility mode is turned on and the old
         0..3 color intensity range is streched by 21 to 0..63.
+        When scrolling sideways, the text is rendered once with proportional character
+        widths, separated by <spacing> empty columns, and moved over the grid column by
+        column. When scrolling up or down, the characters are stacked like a vertical
+        ticker, separated by <spacing> empty rows. Only changing LEDs are sent.
+        <font> is an optional font.BitmapFont, for characters beyond the built in code page 437.
 
         NEW   12/2016: More than one char on display \o/
-        IDEA: variable spacing for seamless scrolling, e.g.: "__/\_"
         TODO: That <blue> compatibility thing sucks... Should be removed.
         """
 
@@ -434,34 +571,40 @@ class LaunchpadPro(LaunchpadBase):
             green *= 21
             blue = 0
 
-        limit = lambda n, mini, maxi: max(min(maxi, n), mini)
-
-        if direction == self.SCROLL_LEFT:
-            text += " "  # just to avoid artifacts on full width characters
-            for n in range((len(text) + 1) * 8):
-                if n <= len(text) * 8:
-                    self.LedCtrlChar(text[limit((n // 16) * 2, 0, len(text) - 1)], red, green, blue, 8 - n % 16)
-                if n > 7:
-                    self.LedCtrlChar(text[limit((((n - 8) // 16) * 2) + 1, 0, len(text) - 1)], red, green, blue,
-                                     8 - (n - 8) % 16)
+        if direction == self.SCROLL_LEFT or direction == self.SCROLL_RIGHT:
+            if font is None:
+                strip = render_text(text, proportional=True, spacing=spacing)
+            else:
+                strip = font.render_text(text, spacing=spacing)
+            # from an empty grid, text entering from one side, to an empty grid again
+            offsets = range(8, -len(strip[0]) - 1, -1)
+            if direction == self.SCROLL_RIGHT:
+                offsets = reversed(offsets)
+
+            for offsx in offsets:
+                self.LedCtrlBitmap(strip, red, green, blue, offsx=offsx)
                 time.wait(waitms)
-        elif direction == self.SCROLL_RIGHT:
-            # TODO: Just a quick hack (screen is erased before scrolling begins).
-            #       Characters at odd positions from the right (1, 3, 5), with pixels at the left,
-            #       e.g. 'C' will have artifacts at the left (pixel repeated).
-            text = " " + text + " "  # just to avoid artifacts on full width characters
-            #			for n in range( (len(text) + 1) * 8 - 1, 0, -1 ):
-            for n in range((len(text) + 1) * 8 - 7, 0, -1):
-                if n <= len(text) * 8:
-                    self.LedCtrlChar(text[limit((n // 16) * 2, 0, len(text) - 1)], red, green, blue, 8 - n % 16)
-                if n > 7:
-                    self.LedCtrlChar(text[limit((((n - 8) // 16) * 2) + 1, 0, len(text) - 1)], red, green, blue,
-                                     8 - (n - 8) % 16)
+        elif direction == self.SCROLL_UP or direction == self.SCROLL_DOWN:
+            strip = []
+            for i in text:
+                if strip:
+                    strip.extend([[False] * 8] * spacing)
+                if font is None:
+                    strip.extend(render_text(i))
+                else:
+                    strip.extend(font.glyph(i))
+
+            offsets = range(8, -len(strip) - 1, -1)
+            if direction == self.SCROLL_DOWN:
+                offsets = reversed(offsets)
+
+            for offsy in offsets:
+                self.LedCtrlBitmap(strip, red, green, blue, offsy=offsy)
                 time.wait(waitms)
         else:
             for i in text:
                 for n in range(4):  # pseudo repetitions to compensate the timing a bit
-                    self.LedCtrlChar(i, red, green, blue)
+                    self.LedCtrlChar(i, red, green, blue, font=font)
                     time.wait(waitms)
 
     def LedAllOn(self, colorcode=None):
@@ -476,6 +619,8 @@ class LaunchpadPro(LaunchpadBase):
             colorcode = min(colorcode, 127)
             colorcode = max(colorcode, 0)
 
+        self._bitmap_shown = None
+        self._remember_fill(colorcode)
         self.midi.RawWriteSysEx([0, 32, 41, 2, 16, 14, colorcode])
 
     def reset(self):
@@ -486,7 +631,7 @@ class LaunchpadPro(LaunchpadBase):
 
         self.LedAllOn(0)
 
-    def ButtonStateRaw(self, returnPressure=False):
+    def ButtonStateRaw(self, returnPressure=False, returnTimestamp=False):
         """
         Returns the raw value of the last button change (pressed/unpressed) as a list
         [ <button>, <value> ], in which <button> is the raw number of the button and
@@ -498,10 +643,13 @@ class LaunchpadPro(LaunchpadBase):
         Pressure events are returned if enabled via "returnPressure".
         To distinguish pressure events from buttons, a fake button code of "255" is used,
         so the list looks like [ 255, <value> ].
+        MIDI clock messages never show up here; see attach_clock().
+        With <returnTimestamp>, the PortMidi timestamp (ms) of the event is appended,
+        e.g. [ <button>, <value>, <timestamp> ].
         """
 
-        if self.midi.ReadCheck():
-            a = self.midi.ReadRaw()
+        a = self._read_raw()
+        if a != []:
 
             # Note:
             #  Beside "144" (Note On, grid buttons), "208" (Pressure Value, grid buttons) and
@@ -537,16 +685,16 @@ class LaunchpadPro(LaunchpadBase):
             # Try to avoid getting flooded with pressure events
             if returnPressure == False:
                 while a[0][0][0] == 208:
-                    a = self.midi.ReadRaw()
+                    a = self._read_raw()
                     if a == []:
                         return []
 
             if a[0][0][0] == 144 or a[0][0][0] == 176:
-                return [a[0][0][1], a[0][0][2]]
+                return self._stamped([a[0][0][1], a[0][0][2]], a, returnTimestamp)
             else:
                 if returnPressure:
                     if a[0][0][0] == 208:
-                        return [255, a[0][0][1]]
+                        return self._stamped([255, a[0][0][1]], a, returnTimestamp)
                     else:
                         return []
                 else:
@@ -554,7 +702,7 @@ class LaunchpadPro(LaunchpadBase):
         else:
             return []
 
-    def ButtonStateXY(self, mode="classic", returnPressure=False):
+    def ButtonStateXY(self, mode="classic", returnPressure=False, returnTimestamp=False):
         """
         Returns the raw value of the last button change (pressed/unpressed) as a list
         [ <x>, <y>, <value> ], in which <x> and <y> are the buttons coordinates and
@@ -563,13 +711,15 @@ class LaunchpadPro(LaunchpadBase):
         Notice that this is not (directly) compatible with the original ButtonStateRaw()
         method in the "Classic" Launchpad, which only returned [ <button>, <True/False> ].
         Compatibility would require checking via "== True" and not "is True".
+        With <returnTimestamp>, the PortMidi timestamp (ms) of the event is appended,
+        e.g. [ <x>, <y>, <value>, <timestamp> ].
         """
-        if self.midi.ReadCheck():
-            a = self.midi.ReadRaw()
+        a = self._read_raw()
+        if a != []:
 
             if returnPressure == False:
                 while a[0][0][0] == 208:
-                    a = self.midi.ReadRaw()
+                    a = self._read_raw()
                     if a == []:
                         return []
 
@@ -581,10 +731,10 @@ class LaunchpadPro(LaunchpadBase):
                     x = a[0][0][1] % 10
                 y = (99 - a[0][0][1]) // 10
 
-                return [x, y, a[0][0][2]]
+                return self._stamped([x, y, a[0][0][2]], a, returnTimestamp)
             else:
                 if a[0][0][0] == 208:
-                    return [255, 255, a[0][0][1]]
+                    return self._stamped([255, 255, a[0][0][1]], a, returnTimestamp)
                 else:
                     return []
         else:
@@ -1,6 +1,6 @@
 from pygame import time
 
-from launchpad_py import LaunchpadPro
+from launchpad_py.launchpad_pro import LaunchpadPro
 
 __all__ = ['LaunchpadProMk3']
 
@@ -112,11 +112,17 @@ class LaunchpadProMk3(LaunchpadPro):
 
         retval = super(LaunchpadProMk3, self).open(number=number, name=name)
         if retval:
-            # enable Programmer's mode
-            self.set_mode(1)
+            self.enter_default_mode()
 
         return retval
 
+    def enter_default_mode(self):
+        """
+        Enables Programmer's mode.
+        """
+
+        self.set_mode(1)
+
     def check(self, number=0, name="ProMk3"):
         """
         Checks if a device exists, but does not open it.
@@ -161,11 +167,70 @@ class LaunchpadProMk3(LaunchpadPro):
 
         limit = lambda n, mini, maxi: max(min(maxi, n), mini)
 
-        red = limit(red, 0, 63) << 1
-        green = limit(green, 0, 63) << 1
-        blue = limit(blue, 0, 63) << 1
+        red = limit(red, 0, 63)
+        green = limit(green, 0, 63)
+        blue = limit(blue, 0, 63)
+        self._remember(number, 'LedCtrlRaw', red, green, blue)
 
-        self.midi.RawWriteSysEx([0, 32, 41, 2, 14, 3, 3, number, red, green, blue])
+        self.midi.RawWriteSysEx([0, 32, 41, 2, 14, 3, 3, number, red << 1, green << 1, blue << 1], key=number)
+
+    def _led_specs(self, specs):
+        # LED lighting SysEx with a list of [ <type>, <number>, <data...> ] specs
+        for i in range(0, len(specs), 80):
+            self.midi.RawWriteSysEx([0, 32, 41, 2, 14, 3] + [v for spec in specs[i:i + 80] for v in spec])
+
+    def LedCtrlRawMulti(self, leds):
+        """
+        Sets several LEDs at once. <leds> is a list of ( <number>, <red>, <green>, <blue> ),
+        with intensities 0..63. Sent as one SysEx message per 80 LEDs, which costs 5 bytes
+        per LED instead of one full message per LED with LedCtrlRaw().
+        """
+
+        limit = lambda n: max(min(63, n), 0)
+
+        specs = []
+        for number, red, green, blue in leds:
+            if number < 0 or number > 99:
+                continue
+            red, green, blue = limit(red), limit(green), limit(blue)
+            self._remember(number, 'LedCtrlRaw', red, green, blue)
+            specs.append([3, number, red << 1, green << 1, blue << 1])
+
+        self._led_specs(specs)
+
+    def LedCtrlRawByCodeMulti(self, leds):
+        """
+        Sets several LEDs at once. <leds> is a list of ( <number>, <colorcode> ).
+        Sent as one SysEx message per 80 LEDs, with 3 bytes per LED.
+        """
+
+        specs = []
+        for number, colorcode in leds:
+            if number < 0 or number > 99:
+                continue
+            colorcode = min(127, max(0, colorcode))
+            self._remember(number, 'LedCtrlRawByCode', colorcode)
+            specs.append([0, number, colorcode])
+
+        self._led_specs(specs)
+
+    def LedCtrlRow(self, row, colorcodes):
+        """
+        Same as the Pro's LedCtrlRow(); the Mk3 has no row message, so this is
+        sent via LedCtrlRawByCodeMulti().
+        """
+
+        if 0 <= row <= 9:
+            self.LedCtrlRawByCodeMulti([(10 * row + col, c) for col, c in enumerate(colorcodes[:10])])
+
+    def LedCtrlColumn(self, column, colorcodes):
+        """
+        Same as the Pro's LedCtrlColumn(); the Mk3 has no column message, so this is
+        sent via LedCtrlRawByCodeMulti().
+        """
+
+        if 0 <= column <= 9:
+            self.LedCtrlRawByCodeMulti([(10 * row + column, c) for row, c in enumerate(colorcodes[:10])])
 
     def LedCtrlPulseByCode(self, number, colorcode=None):
         """
@@ -181,7 +246,8 @@ class LaunchpadProMk3(LaunchpadPro):
 
         colorcode = min(127, max(0, colorcode))
 
-        self.midi.RawWrite(146, number, colorcode)
+        self._remember(number, 'LedCtrlPulseByCode', colorcode)
+        self.midi.RawWrite(146, number, colorcode, key=number)
 
     def LedCtrlFlashByCode(self, number, colorcode=None):
         """
@@ -199,7 +265,8 @@ class LaunchpadProMk3(LaunchpadPro):
 
         colorcode = min(127, max(0, colorcode))
 
-        self.midi.RawWrite(145, number, colorcode)
+        self._remember(number, 'LedCtrlFlashByCode', colorcode)
+        self.midi.RawWrite(145, number, colorcode, key=number)
 
     def LedAllOn(self, colorcode=None):
         """
@@ -212,6 +279,9 @@ class LaunchpadProMk3(LaunchpadPro):
 
         colorcode = min(127, max(0, colorcode))
 
+        self._bitmap_shown = None
+        self._remember_fill(colorcode)
+
         # TODO: Maybe the SysEx was indeed a better idea :)
         #       Did some tests:
         #         MacOS:   doesn't matter;
@@ -222,7 +292,7 @@ class LaunchpadProMk3(LaunchpadPro):
                 # TODO
                 self.midi.RawWrite(144, (x + 1) + ((y + 1) * 10), colorcode)
 
-    def ButtonStateXY(self, mode="classic", returnPressure=False):
+    def ButtonStateXY(self, mode="classic", returnPressure=False, returnTimestamp=False):
         """
         Returns the raw value of the last button change (pressed/unpressed) as a list
         [ <x>, <y>, <value> ], in which <x> and <y> are the buttons coordinates and
@@ -231,16 +301,18 @@ class LaunchpadProMk3(LaunchpadPro):
         Notice that this is not (directly) compatible with the original ButtonStateRaw()
         method in the "Classic" Launchpad, which only returned [ <button>, <True/False> ].
         Compatibility would require checking via "== True" and not "is True".
+        With <returnTimestamp>, the PortMidi timestamp (ms) of the event is appended,
+        e.g. [ <x>, <y>, <value>, <timestamp> ].
         """
 
-        if self.midi.ReadCheck():
-            a = self.midi.ReadRaw()
+        a = self._read_raw()
+        if a != []:
 
             # 8/2020: Try to mitigate too many pressure events that a bit (yep, seems to work fine!)
             # 9/2020: XY now also with pressure event functionality
             if returnPressure == False:
                 while a[0][0][0] == 208:
-                    a = self.midi.ReadRaw()
+                    a = self._read_raw()
                     if a == []:
                         return []
 
@@ -257,11 +329,11 @@ class LaunchpadProMk3(LaunchpadPro):
                 else:
                     y = (99 - a[0][0][1]) // 10
 
-                return [x, y, a[0][0][2]]
+                return self._stamped([x, y, a[0][0][2]], a, returnTimestamp)
             else:
                 # TOCHK: this should be safe without checking "returnPressure"
                 if a[0][0][0] == 208:
-                    return [255, 255, a[0][0][1]]
+                    return self._stamped([255, 255, a[0][0][1]], a, returnTimestamp)
                 else:
                     return []
         else:
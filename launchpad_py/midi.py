@@ -1,9 +1,63 @@
 import sys
 import array
+import contextlib
+import itertools
+import logging
+import queue
+import threading
+import time
+import weakref
+from collections import deque
 
 from pygame import midi
 
-__all__ = ['Midi']
+from launchpad_py.latency import percentiles
+
+__all__ = ['Midi', 'LaneStats']
+
+log = logging.getLogger(__name__)
+
+
+class LaneStats(object):
+    """
+    Queue latency statistics of one output lane, see Midi.StartWriter().
+    """
+
+    def __init__(self, history=1000):
+        self.sent = 0  # messages sent
+        self.superseded = 0  # messages replaced by a newer one before they were sent
+        self.queued_bytes = 0  # bytes of all messages queued, including superseded ones
+        self.superseded_bytes = 0  # bytes of the superseded messages
+        self.bytes = 0  # bytes sent
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.recent = deque(maxlen=history)  # delays of the last messages, in ms
+
+    def record(self, delay_ms, size=0):
+        self.sent += 1
+        self.bytes += size
+        self.total_ms += delay_ms
+        self.max_ms = max(self.max_ms, delay_ms)
+        self.recent.append(delay_ms)
+
+    def summary(self):
+        """
+        Returns a dict with the counters, mean and max delay and the percentiles
+        (50, 90, 99) of the recent delays, in ms.
+        """
+
+        ret = {
+            'sent': self.sent,
+            'superseded': self.superseded,
+            'bytes': self.bytes,
+            'mean_ms': self.total_ms / self.sent if self.sent else 0.0,
+            'max_ms': self.max_ms,
+        }
+        for p, value in percentiles(list(self.recent)).items():
+            if p != 'max':
+                ret['p%d_ms' % p] = value
+
+        return ret
 
 
 class Midi:
@@ -14,6 +68,20 @@ class Midi:
     # instance created
     instanceMidi = None
 
+    # all wrappers, so their ports can be dropped if PortMidi is restarted
+    instances = weakref.WeakSet()
+
+    # minimum time between two PortMidi restarts, see Reinit()
+    REINIT_MIN_S = 5.0
+    _reinit_lock = threading.Lock()
+    _reinit_last = None
+
+    # output lanes, by priority; see StartWriter() and Lane()
+    INTERACTIVE = 0
+    NORMAL = 1
+    BULK = 2
+    LANES = {INTERACTIVE: 'interactive', NORMAL: 'normal', BULK: 'bulk'}
+
     def __init__(self):
         """
         Allow only one instance to be created
@@ -29,6 +97,26 @@ class Midi:
 
         self.devIn = None
         self.devOut = None
+        # set if reading or writing failed, e.g. because the device was unplugged;
+        # reads return nothing and writes are dropped, see hotplug.HotplugWatcher
+        self.lost = False
+
+        # Output is safe to use from several threads. Each wrapper (device) has its own
+        # lock, so devices never wait for each other. Optionally, a writer thread per
+        # device takes the messages from prioritized queues, see StartWriter().
+        self._lock = threading.Lock()
+        self._in_lock = threading.Lock()  # input; only contended by Reinit()
+        self._queues = None  # interactive and normal lane
+        self._bulk = None  # bulk lane, <key>: ( <func>, <args>, <time queued>, <bytes> )
+        self._queue_lock = threading.Lock()  # enqueueing vs. stopping the writer
+        self._seq = itertools.count()
+        self._wake = threading.Event()
+        self._writer = None
+        self._local = threading.local()  # the lane of the current thread
+
+        self.laneStats = dict((lane, LaneStats()) for lane in Midi.LANES)
+
+        Midi.instances.add(self)
 
     def __getattr__(self, name):
         """
@@ -45,13 +133,24 @@ class Midi:
             except:
                 self.devOut = None
                 return False
+            self.lost = False
         return True
 
-    def CloseOutput(self):
-        if self.devOut is not None:
-            # self.devOut.close()
-            del self.devOut
-            self.devOut = None
+    def CloseOutput(self, close=False):
+        """
+        Stops the writer thread, if any, after it sent everything queued, and drops the
+        output port. With <close>, PortMidi's port is closed, too, e.g. after it failed.
+        """
+        self.StopWriter()
+        with self._lock:
+            if self.devOut is not None:
+                if close:
+                    try:
+                        self.devOut.close()
+                    except Exception:
+                        pass
+                del self.devOut
+                self.devOut = None
 
     def OpenInput(self, midi_id, bufferSize=None):
         if self.devIn is None:
@@ -65,43 +164,134 @@ class Midi:
             except:
                 self.devIn = None
                 return False
+            self.lost = False
         return True
 
-    def CloseInput(self):
-        if self.devIn is not None:
-            # self.devIn.close()
-            del self.devIn
-            self.devIn = None
+    def CloseInput(self, close=False):
+        with self._in_lock:
+            if self.devIn is not None:
+                if close:
+                    try:
+                        self.devIn.close()
+                    except Exception:
+                        pass
+                del self.devIn
+                self.devIn = None
+
+    def Connected(self):
+        """
+        True if this wrapper has an open port that didn't fail.
+        """
+        return not self.lost and (self.devIn is not None or self.devOut is not None)
 
     def ReadCheck(self):
-        return self.devIn.poll()
+        with self._in_lock:
+            dev = self.devIn
+            if dev is None:
+                return False
+            try:
+                return dev.poll()
+            except midi.MidiException:
+                self.lost = True
+                return False
+
+    def ReadRaw(self, count=1):
+        """
+        Reads up to <count> events in one go; a single one by default.
+        """
+        with self._in_lock:
+            dev = self.devIn
+            if dev is None:
+                return []
+            try:
+                return dev.read(count)
+            except midi.MidiException:
+                self.lost = True
+                return []
+
+    def _send(self, func, args, key=None, size=0):
+        """
+        Sends right away (under the device's lock) or via the writer's queues, if running.
+        <size> is the message's length in bytes, for the lane statistics.
+        """
 
-    def ReadRaw(self):
-        return self.devIn.read(1)
+        lane = getattr(self._local, 'lane', Midi.NORMAL)
+        now = time.perf_counter()
 
-    def RawWrite(self, stat, dat1, dat2):
+        with self._queue_lock:
+            queues = self._queues
+            if queues is not None and lane == Midi.BULK:
+                if key is None:
+                    key = ('seq', next(self._seq))
+                elif key in self._bulk:
+                    # superseded; the newer message goes to the end, so it can't overtake
+                    # writes queued in between (e.g. a fill), but keeps the older one's
+                    # time for the stats
+                    _, _, now, old_size = self._bulk.pop(key)
+                    self.laneStats[Midi.BULK].superseded += 1
+                    self.laneStats[Midi.BULK].superseded_bytes += old_size
+                self._bulk[key] = (func, args, now, size)
+            elif queues is not None:
+                queues[lane].put((func, args, now, size))
+            if queues is not None:
+                self.laneStats[lane].queued_bytes += size
+
+        if queues is None:
+            with self._lock:
+                func(*args)
+        else:
+            self._wake.set()
+
+    def _write_short(self, stat, dat1, dat2):
+        if self.devOut is None or self.lost:
+            return
+        try:
+            self.devOut.write_short(stat, dat1, dat2)
+        except midi.MidiException:
+            self.lost = True
+
+    def _write(self, lstMessages):
+        if self.devOut is None or self.lost:
+            return
+        try:
+            self.devOut.write(lstMessages)
+        except midi.MidiException:
+            self.lost = True
+
+    def _write_sys_ex(self, timeStamp, data):
+        if self.devOut is None or self.lost:
+            return
+        try:
+            self.devOut.write_sys_ex(timeStamp, data)
+        except midi.MidiException:
+            self.lost = True
+
+    def RawWrite(self, stat, dat1, dat2, key=None):
         """
         sends a single, short message
+        <key> identifies what the message controls, e.g. the LED number; in the bulk lane,
+        a newer message with the same key replaces a queued one (see StartWriter()).
         """
-        self.devOut.write_short(stat, dat1, dat2)
+        self._send(self._write_short, (stat, dat1, dat2), key, 1 if stat >= 248 else 3)
 
-    def RawWriteMulti(self, lstMessages):
+    def RawWriteMulti(self, lstMessages, key=None):
         """
         Sends a list of messages. If timestamp is 0, it is ignored.
         Amount of <dat> bytes is arbitrary.
         [ [ [stat, <dat1>, <dat2>, <dat3>], timestamp ],  [...], ... ]
         <datN> fields are optional
         """
-        self.devOut.write(lstMessages)
+        self._send(self._write, (lstMessages,), key, sum(len(m[0]) for m in lstMessages))
 
     # -------------------------------------------------------------------------------------
     # -------------------------------------------------------------------------------------
-    def RawWriteSysEx(self, lstMessage, timeStamp=0):
+    def RawWriteSysEx(self, lstMessage, timeStamp=0, key=None):
         """
         Sends a single system-exclusive message, given by list <lstMessage>
         The start (0xF0) and end bytes (0xF7) are added automatically.
         [ <dat1>, <dat2>, ..., <datN> ]
         Timestamp is not supported and will be sent as '0' (for now)
+        The message is always sent as a whole, even if several threads write at once.
         """
 
         # There's a bug in PyGame's (Python 3) list-type message handling, so as a workaround,
@@ -109,10 +299,149 @@ class Midi:
         # self.devOut.write_sys_ex( timeStamp, [0xf0] + lstMessage + [0xf7] ) # old Python 2
 
         # array.tostring() deprecated in 3.9; quickfix ahead
+        data = array.array('B', [0xf0] + lstMessage + [0xf7])
+        try:
+            data = data.tobytes()
+        except AttributeError:
+            data = data.tostring()
+
+        self._send(self._write_sys_ex, (timeStamp, data), key, len(data))
+
+    # -------------------------------------------------------------------------------------
+    # -------------------------------------------------------------------------------------
+    def StartWriter(self):
+        """
+        Starts a writer thread for this device. From now on, all Raw*() write methods
+        only put their message into a queue and return immediately; the writer sends
+        them. Any number of threads can produce messages concurrently, without waiting
+        for the device or for each other.
+        There are three lanes, selected per thread with Lane():
+          INTERACTIVE  feedback to the user, e.g. a pressed pad; always sent first
+          NORMAL       everything else (default)
+          BULK         animation frames; only sent if the other lanes are empty.
+                       A message with the same <key> (LED) as a queued one replaces it
+                       and moves to the end of the lane, so stale frames are superseded
+                       instead of sent late.
+        Messages within a lane keep their order. laneStats holds the queue latencies.
+        """
+
+        if self._writer is None:
+            self._bulk = {}
+            self._queues = (queue.SimpleQueue(), queue.SimpleQueue())
+            self._writer = threading.Thread(target=self._run_writer, args=(self._queues,),
+                                            name="MidiWriter", daemon=True)
+            self._writer.start()
+
+    def WriterRunning(self):
+        return self._writer is not None
+
+    def StopWriter(self):
+        """
+        Sends everything that's still queued and stops the writer thread.
+        Writes are sent directly again afterwards.
+        """
+
+        if self._writer is not None:
+            # under the lock, so nothing can be queued behind the stop marker
+            with self._queue_lock:
+                self._put_marker(None)
+                self._queues = None
+            self._wake.set()
+            self._writer.join()
+            self._writer = None
+
+    def _put_marker(self, func):
+        # the bulk lane comes last, so everything queued before is sent by then;
+        # called with the queue lock held
+        self._bulk[('seq', next(self._seq))] = (func, (), None, 0)
+
+    def Flush(self, timeout=None):
+        """
+        Waits until all messages queued so far were sent; returns False on timeout (s).
+        Returns immediately if no writer is running.
+        """
+
+        done = threading.Event()
+        with self._queue_lock:
+            if self._queues is None:
+                return True
+            self._put_marker(done.set)
+        self._wake.set()
+        return done.wait(timeout)
+
+    @contextlib.contextmanager
+    def Lane(self, lane):
+        """
+        Context manager that sends all writes of the current thread via output <lane>:
+          with lp.midi.Lane(Midi.INTERACTIVE):
+              lp.LedCtrlXYByCode(x, y, 5)
+        Only matters while the writer thread is running.
+        """
+
+        prev = getattr(self._local, 'lane', Midi.NORMAL)
+        self._local.lane = lane
         try:
-            self.devOut.write_sys_ex(timeStamp, array.array('B', [0xf0] + lstMessage + [0xf7]).tostring())
-        except:
-            self.devOut.write_sys_ex(timeStamp, array.array('B', [0xf0] + lstMessage + [0xf7]).tobytes())
+            yield
+        finally:
+            self._local.lane = prev
+
+    def LaneMetrics(self):
+        """
+        Returns { <lane name>: <LaneStats.summary() + number of queued messages> }.
+        """
+
+        ret = {}
+        for lane, name in Midi.LANES.items():
+            ret[name] = self.laneStats[lane].summary()
+            queues = self._queues
+            if queues is None:
+                ret[name]['queued'] = 0
+            elif lane == Midi.BULK:
+                ret[name]['queued'] = len(self._bulk)
+            else:
+                ret[name]['queued'] = queues[lane].qsize()
+
+        return ret
+
+    def _next_item(self, queues):
+        # all lanes under the queue lock, so nothing queued before a marker can be
+        # overlooked when the marker is taken
+        with self._queue_lock:
+            for lane in (Midi.INTERACTIVE, Midi.NORMAL):
+                try:
+                    return queues[lane].get_nowait() + (lane,)
+                except queue.Empty:
+                    pass
+
+            if self._bulk:
+                key = next(iter(self._bulk))
+                return self._bulk.pop(key) + (Midi.BULK,)
+
+        return None
+
+    def _run_writer(self, queues):
+        while True:
+            item = self._next_item(queues)
+            if item is None:
+                self._wake.wait()
+                self._wake.clear()
+                continue
+
+            func, args, queued, size, lane = item
+            if queued is None:
+                # marker
+                if func is None:
+                    return
+                func()
+                continue
+
+            try:
+                with self._lock:
+                    func(*args)
+            except Exception:
+                # one bad message must not stop the writer; everything behind it would wait forever
+                log.exception("sending a queued MIDI message failed")
+            self.laneStats[lane].record((time.perf_counter() - queued) * 1000.0, size)
 
     class __Midi:
         """
@@ -133,6 +462,42 @@ class Midi:
             # midi.quit()
             pass
 
+        def Reinit(self, force=False):
+            """
+            Restarts PortMidi, which is the only way to see devices that were attached
+            (or re-attached) after the start. All open ports, of all devices, become invalid.
+            Unless <force> is set, nothing happens while any device is still connected
+            (see Midi.Connected()) or if the last restart was less than Midi.REINIT_MIN_S
+            seconds ago. Otherwise the ports of all devices are dropped and marked as lost;
+            that happens while holding their locks, so no reader or writer thread is inside
+            PortMidi meanwhile. Returns True if PortMidi was restarted.
+            """
+
+            with Midi._reinit_lock:
+                if not force:
+                    last = Midi._reinit_last
+                    if last is not None and time.monotonic() - last < Midi.REINIT_MIN_S:
+                        return False
+                    if any(instance.Connected() for instance in list(Midi.instances)):
+                        return False
+
+                with contextlib.ExitStack() as stack:
+                    instances = sorted(Midi.instances, key=id)
+                    for instance in instances:
+                        stack.enter_context(instance._lock)
+                        stack.enter_context(instance._in_lock)
+                    for instance in instances:
+                        instance.devIn = None
+                        instance.devOut = None
+                        instance.lost = True
+
+                    midi.quit()
+                    midi.init()
+
+                Midi._reinit_last = time.monotonic()
+
+            return True
+
         def SearchDevices(self, name, output=True, input=True, quiet=True):
             """
             Returns a list of devices that matches the string 'name' and has in- or outputs.
@@ -153,6 +518,20 @@ class Midi:
 
             return ret
 
+        def ListDevices(self):
+            """
+            Returns a list of all MIDI ports as tuples ( <id>, <name>, <is input>, <is output> ).
+            """
+
+            ret = []
+
+            for i in range(midi.get_count()):
+                md = midi.get_device_info(i)
+                name = md[1].decode('utf-8', 'replace') if isinstance(md[1], bytes) else str(md[1])
+                ret.append((i, name, md[2] > 0, md[3] > 0))
+
+            return ret
+
         def SearchDevice(self, name, output=True, input=True, number=0):
             """
             Returns the first device that matches the string 'name'.
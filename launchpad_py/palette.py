@@ -0,0 +1,45 @@
+import numpy as np
+
+__all__ = ['PALETTE', 'nearest_code', 'quantize']
+
+# Approximate RGB intensities (0..63) of the 128 palette colorcodes, sampled from
+# images/lppro_colorcodes.png. Good enough to pick the closest code for an RGB color,
+# not to reproduce the LEDs exactly. The Pro Mk3 uses (nearly) the same palette.
+PALETTE = np.array([
+    (0, 0, 0), (9, 9, 9), (35, 35, 35), (63, 63, 63), (63, 25, 22), (63, 10, 0), (27, 2, 0), (8, 0, 0),
+    (63, 49, 29), (63, 27, 0), (27, 10, 0), (12, 8, 0), (63, 62, 10), (63, 62, 0), (26, 26, 0), (8, 8, 0),
+    (35, 61, 13), (17, 61, 0), (6, 26, 0), (6, 13, 0), (12, 61, 14), (0, 61, 0), (0, 26, 0), (0, 8, 0),
+    (12, 61, 21), (0, 61, 0), (0, 26, 0), (0, 8, 0), (12, 62, 36), (0, 61, 18), (0, 26, 6), (0, 9, 4),
+    (10, 62, 47), (0, 61, 40), (0, 26, 16), (0, 8, 4), (16, 50, 63), (0, 45, 63), (0, 20, 25), (0, 5, 8),
+    (20, 39, 63), (0, 27, 63), (0, 10, 27), (0, 1, 8), (22, 25, 63), (1, 13, 63), (0, 4, 27), (0, 0, 8),
+    (37, 25, 63), (25, 13, 63), (7, 5, 30), (3, 1, 16), (63, 27, 63), (63, 16, 63), (27, 5, 27), (8, 1, 8),
+    (63, 26, 37), (63, 11, 25), (27, 3, 9), (11, 0, 5), (63, 13, 0), (43, 18, 0), (35, 24, 0), (19, 29, 0),
+    (0, 17, 0), (0, 25, 16), (0, 25, 36), (1, 13, 63), (0, 21, 24), (9, 10, 54), (35, 35, 35), (11, 11, 11),
+    (63, 10, 0), (48, 62, 0), (45, 58, 0), (24, 61, 0), (0, 37, 0), (0, 61, 35), (0, 45, 63), (1, 16, 63),
+    (17, 13, 63), (35, 13, 63), (48, 12, 36), (21, 11, 0), (63, 24, 0), (36, 56, 0), (28, 61, 0), (0, 61, 0),
+    (0, 61, 0), (19, 61, 29), (0, 62, 52), (24, 39, 63), (13, 25, 52), (37, 36, 60), (55, 16, 63), (63, 11, 27),
+    (63, 36, 0), (49, 46, 0), (38, 61, 0), (37, 27, 0), (18, 13, 0), (1, 23, 0), (0, 24, 18), (6, 6, 13),
+    (5, 11, 27), (31, 19, 7), (46, 6, 0), (58, 26, 17), (57, 31, 0), (63, 56, 0), (41, 56, 0), (27, 47, 0),
+    (9, 9, 16), (56, 62, 25), (33, 62, 49), (41, 42, 63), (39, 31, 63), (20, 20, 20), (33, 33, 33), (56, 62, 63),
+    (45, 6, 0), (17, 1, 0), (0, 53, 0), (0, 20, 0), (49, 46, 0), (19, 15, 0), (48, 28, 0), (23, 7, 0),
+], dtype=np.int16)
+
+
+def nearest_code(red, green, blue):
+    """
+    Returns the colorcode whose palette color is closest to <red>, <green>, <blue> (0..63).
+    """
+
+    return int(np.argmin(((PALETTE - (red, green, blue)) ** 2).sum(axis=1)))
+
+
+def quantize(frame):
+    """
+    Maps every pixel of an RGB <frame> (..., 3) to its nearest palette color.
+    Returns ( <codes>, <rgb> ): the colorcodes and the frame as it looks in palette colors.
+    """
+
+    frame = np.asarray(frame, dtype=np.int16)
+    dist = ((frame[..., np.newaxis, :] - PALETTE) ** 2).sum(axis=-1)
+    codes = np.argmin(dist, axis=-1)
+    return codes, PALETTE[codes].astype(np.uint8)
@@ -0,0 +1,184 @@
+import numpy as np
+
+__all__ = ['Planner', 'grid_to_leds']
+
+
+def grid_to_leds(frame, outer=(0, 0, 0)):
+    """
+    Converts a grid frame (see FrameBuffer) into a (10, 10, 3) LED array, indexed
+    [ <number> // 10, <number> % 10 ], so row 0 is the bottom row of outer buttons.
+    All outer LEDs get the color <outer>.
+    """
+
+    leds = np.empty((10, 10, 3), dtype=np.int16)
+    leds[:] = outer
+    leds[1:9, 1:9] = np.asarray(frame)[::-1]
+    return leds
+
+
+class Planner(object):
+    """
+    Finds the cheapest way, in bytes on the wire, to get from one LED state to another.
+
+    LED states are (10, 10, 3) arrays of RGB intensities 0..63, see grid_to_leds().
+    For a "pro", the plan may start with LedAllOn(), then set whole rows or columns
+    (LedCtrlRow()/LedCtrlColumn()) and finally patch the remaining LEDs, palette ones
+    as note-ons or with LedCtrlRawByCodeMulti(), whatever is cheaper, and all others with
+    LedCtrlRawMulti(). The "promk3" has no fill, row and column messages; its palette
+    LEDs are always sent as note-ons.
+
+    Palette messages can only be used for colors in <palette>, a dict { <colorcode>:
+    ( <r>, <g>, <b> ) } of palette entries that look exactly like those RGB values;
+    by default only black (0). Notice that fill, row and column messages also set the
+    outer buttons, which therefore are part of the LED state.
+    """
+
+    # header F0 00 20 29 02 <model> <command> ... F7, without any data
+    SYSEX = 8
+    MAX_RGB = {'pro': 78, 'promk3': 80}
+    MAX_CODES = {'pro': 97, 'promk3': 80}
+
+    def __init__(self, model="pro", palette=None, fills=2):
+        """
+        <fills> is the number of most frequent palette colors tried as background fill.
+        """
+
+        self.model = model.lower()
+        self.fills = fills
+        self.palette = {0: (0, 0, 0)} if palette is None else dict(palette)
+
+        self._lookup = {tuple(int(v) for v in rgb): code for code, rgb in self.palette.items()}
+
+        # LEDs that don't exist; written for free by rows or columns, never patched
+        self.valid = np.ones((10, 10), dtype=bool)
+        self.valid[0, 0] = self.valid[9, 9] = self.valid[0, 9] = False
+        if self.model == "pro":
+            self.valid[9, 0] = False
+
+    @classmethod
+    def for_device(cls, device, palette=None):
+        """
+        Returns a planner for the model of <device>.
+        """
+
+        from launchpad_py.launchpad_pro_mk3 import LaunchpadProMk3
+
+        return cls("promk3" if isinstance(device, LaunchpadProMk3) else "pro", palette)
+
+    def _codes(self, leds):
+        # palette code of each LED, -1 if its color isn't in the palette
+        codes = np.full((10, 10), -1, dtype=np.int16)
+        for rgb, code in self._lookup.items():
+            codes[(leds == rgb).all(axis=2)] = code
+        return codes
+
+    def _patch_cost(self, n_codes, n_rgb):
+        # note-ons or palette SysEx, RGB SysEx; the Mk3's palette specs are no cheaper than note-ons
+        cost = 3 * n_codes
+        if self.model == "pro" and n_codes:
+            cost = min(cost, self.SYSEX * -(-n_codes // self.MAX_CODES['pro']) + 2 * n_codes)
+        if n_rgb:
+            cost += self.SYSEX * -(-n_rgb // self.MAX_RGB[self.model]) + (4 if self.model == "pro" else 5) * n_rgb
+        return cost
+
+    def _lines(self, need, codes, transpose):
+        """
+        Greedily picks rows (or columns, with <transpose>) whose message is cheaper than
+        patching its LEDs. Updates <need> and returns [ ( <index>, <colorcodes> ) ].
+        """
+
+        if transpose:
+            need, codes, valid = need.T, codes.T, self.valid.T
+        else:
+            valid = self.valid
+
+        ret = []
+        for i in range(10):
+            # bytes saved by including LEDs 0..m-1 of the line, per m
+            saved = np.where(valid[i] & (codes[i] >= 0) & need[i], 2, 0)
+            saved = saved - np.where(valid[i] & (codes[i] < 0) & ~need[i], 4, 0)
+            gain = np.cumsum(saved) - (self.SYSEX + 1 + np.arange(1, 11))
+            m = int(np.argmax(gain)) + 1
+            if gain[m - 1] <= 0:
+                continue
+
+            line = codes[i, :m]
+            ret.append((i, np.maximum(line, 0).tolist()))
+            need[i, :m] = valid[i, :m] & (line < 0)
+
+        return ret
+
+    def plan(self, old, new):
+        """
+        Returns ( <commands>, <bytes> ) to get from LED state <old> to <new>, with
+        <commands> being a list of ( <method name>, <args> ) to call on the device,
+        see execute(). <old> may be None, if the current state is unknown.
+        """
+
+        new = np.asarray(new, dtype=np.int16)
+        codes = self._codes(new)
+
+        if old is None:
+            need = self.valid.copy()
+        else:
+            need = self.valid & (np.asarray(old) != new).any(axis=2)
+
+        bases = [None]
+        if self.model == "pro":
+            used = codes[self.valid]
+            values, counts = np.unique(used[used >= 0], return_counts=True)
+            bases += values[np.argsort(-counts)][:self.fills].tolist()
+
+        best = None
+        for fill in bases:
+            commands = []
+            cost = 0
+            if fill is None:
+                n = need.copy()
+            else:
+                commands.append(('LedAllOn', (fill,)))
+                cost += self.SYSEX + 1
+                n = self.valid & (codes != fill)
+
+            if self.model == "pro":
+                for row, line in self._lines(n, codes, False):
+                    commands.append(('LedCtrlRow', (row, line)))
+                    cost += self.SYSEX + 1 + len(line)
+                for col, line in self._lines(n, codes, True):
+                    commands.append(('LedCtrlColumn', (col, line)))
+                    cost += self.SYSEX + 1 + len(line)
+
+            rows, cols = np.nonzero(n)
+            leds = list(zip(rows.tolist(), cols.tolist()))
+            palette = [(10 * r + c, int(codes[r, c])) for r, c in leds if codes[r, c] >= 0]
+            rgb = [(10 * r + c,) + tuple(new[r, c].tolist()) for r, c in leds if codes[r, c] < 0]
+            cost += self._patch_cost(len(palette), len(rgb))
+
+            if palette:
+                if 3 * len(palette) > self._patch_cost(len(palette), 0):
+                    commands.append(('LedCtrlRawByCodeMulti', (palette,)))
+                else:
+                    commands += [('LedCtrlRawByCode', led) for led in palette]
+            if rgb:
+                commands.append(('LedCtrlRawMulti', (rgb,)))
+
+            if best is None or cost < best[1]:
+                best = (commands, cost)
+
+        return best
+
+    def plan_grid(self, old, new):
+        """
+        Same as plan(), but for grid frames (see FrameBuffer), with all outer LEDs off.
+        """
+
+        return self.plan(None if old is None else grid_to_leds(old), grid_to_leds(new))
+
+    @staticmethod
+    def execute(device, commands):
+        """
+        Sends a plan's <commands> to <device>.
+        """
+
+        for method, args in commands:
+            getattr(device, method)(*args)
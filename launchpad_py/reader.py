@@ -0,0 +1,183 @@
+import queue
+import threading
+
+from pygame import time
+
+from launchpad_py.midi import Midi
+
+__all__ = ['InputReader', 'PressFeedback']
+
+
+class PressFeedback(object):
+    """
+    Declarative press feedback: what a pad shows while it is held down.
+
+    <colors> maps raw button numbers to either a colorcode or a pressure-to-color curve,
+    a callable( <value 0..127> ) -> <colorcode>, which is evaluated with the velocity
+    on the press and again for every pressure event while the pad is held.
+    <default> is used for all buttons not in <colors>; None means no feedback.
+    """
+
+    def __init__(self, colors=None, default=None):
+        self.colors = dict(colors) if colors is not None else {}
+        self.default = default
+
+    def color(self, number, value):
+        """
+        Returns the colorcode for button <number> at velocity/pressure <value> or None.
+        """
+
+        color = self.colors.get(number, self.default)
+        if callable(color):
+            color = color(value)
+
+        return color
+
+    def is_curve(self, number):
+        """
+        True if button <number> follows the pressure.
+        """
+
+        return callable(self.colors.get(number, self.default))
+
+
+class InputReader(object):
+    """
+    Reads a device's input in a background thread.
+
+    Button events are queued for the application (see ButtonStateRaw()) and, optionally,
+    passed to the <on_event> callback. MIDI clock messages go to the device's clock follower.
+    With a PressFeedback map, pressed pads are lit right from the reader thread, via the
+    interactive output lane, without a round trip through the application's loop. On
+    release, the LED's last state as set by the application is restored (see restore_leds()).
+    """
+
+    def __init__(self, device, feedback=None, interval_ms=1):
+        """
+        <device>      an opened device; nothing else should read from it meanwhile
+        <feedback>    optional PressFeedback
+        <interval_ms> pause when there's nothing to read
+        """
+
+        self.device = device
+        self.feedback = feedback
+        self.interval_ms = interval_ms
+
+        self.on_event = None  # optional callback( <event> ), called from the reader thread
+        self.events = queue.SimpleQueue()  # [ <button>, <value>, <timestamp> ], [ 255, <pressure>, <timestamp> ]
+
+        self._held = set()  # pads currently lit by the feedback
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _light(self, number, colorcode):
+        # directly, not via LedCtrlRawByCode(), so the application's LED state stays untouched
+        with self.device.midi.Lane(Midi.INTERACTIVE):
+            self.device.midi.RawWrite(144, number, colorcode, key=number)
+
+    def _restore(self, number):
+        entry = self.device.led_state.get(number)
+        with self.device.midi.Lane(Midi.INTERACTIVE):
+            if entry is not None:
+                method, args = entry
+                getattr(self.device, method)(*args)
+            else:
+                fill = self.device.led_fill
+                self.device.midi.RawWrite(144, number, fill if fill is not None else 0, key=number)
+
+    def _apply_feedback(self, status, number, value):
+        fb = self.feedback
+
+        if status == 144 or status == 176:
+            if value > 0:
+                color = fb.color(number, value)
+                if color is not None:
+                    self._held.add(number)
+                    self._light(number, color)
+            elif number in self._held:
+                self._held.discard(number)
+                self._restore(number)
+
+        elif status == 160:
+            # polyphonic pressure, per pad
+            if number in self._held and fb.is_curve(number):
+                self._light(number, fb.color(number, value))
+
+        elif status == 208:
+            # channel pressure; no idea which pad, so all held pads with a curve follow
+            for n in list(self._held):
+                if fb.is_curve(n):
+                    self._light(n, fb.color(n, number))
+
+    def poll(self):
+        """
+        Processes everything that's waiting in the input. Returns the number of events.
+        Called by the reader thread, but can be called manually instead of start().
+        """
+
+        n = 0
+        while True:
+            a = self.device._read_raw()
+            if a == []:
+                return n
+
+            data, timestamp = a[0]
+            status = data[0]
+
+            if self.feedback is not None:
+                self._apply_feedback(status, data[1], data[2])
+
+            if status == 144 or status == 176:
+                event = [data[1], data[2], timestamp]
+            elif status == 160 or status == 208:
+                event = [255, data[2] if status == 160 else data[1], timestamp]
+            else:
+                continue
+
+            n += 1
+            self.events.put(event)
+            if self.on_event is not None:
+                self.on_event(event)
+
+    def _run(self):
+        while not self._stop.is_set():
+            if self.poll() == 0:
+                time.wait(self.interval_ms)
+
+    def start(self):
+        """
+        Starts the reader thread.
+        """
+
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="InputReader", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """
+        Stops the reader thread.
+        """
+
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def ButtonStateRaw(self, returnPressure=False, returnTimestamp=False):
+        """
+        Returns the next queued event like the device's ButtonStateRaw() does:
+        [ <button>, <value> ] or [ 255, <pressure> ], with <returnTimestamp> extended
+        by the PortMidi timestamp. [] if nothing is waiting.
+        """
+
+        while True:
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                return []
+
+            if event[0] == 255 and not returnPressure:
+                continue
+
+            return event if returnTimestamp else event[:2]
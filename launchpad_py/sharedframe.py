@@ -0,0 +1,174 @@
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+__all__ = ['SharedFrameBuffer']
+
+
+class SharedFrameBuffer(object):
+    """
+    A double-buffered frame in shared memory, for renderers in other processes.
+
+    One renderer process writes frames, the process that owns the device flushes the
+    latest complete one to a FrameBuffer (or Canvas); frames are never pickled or piped.
+    The block holds a sequence counter and two frames. The counter is odd while the
+    writer fills the back frame and becomes even again when it's published, so
+    <seq> // 2 is the number of published frames and the front frame is
+    ( <seq> // 2 ) % 2. A reader that sees the counter move on by more than one frame
+    during its read may have seen a half written frame and reads again (a seqlock).
+    There must be only one writer.
+
+      # device process
+      shared = SharedFrameBuffer.create()
+      ...start the renderer with shared.name...
+      while True:
+          shared.flush(fb)
+
+      # renderer process
+      shared = SharedFrameBuffer.attach(name)
+      frame = shared.begin()        # NumPy view of the back frame
+      frame[:] = ...
+      shared.publish()
+    """
+
+    HEADER = 64  # seq (uint64), height, width (uint32), padded to a cache line
+
+    # names of the blocks created by this process, see attach()
+    _created = set()
+
+    def __init__(self, shm, owner=False):
+        self.shm = shm
+        self.owner = owner
+
+        self._seq = np.ndarray((1,), dtype=np.uint64, buffer=shm.buf, offset=0)
+        height, width = np.ndarray((2,), dtype=np.uint32, buffer=shm.buf, offset=8).tolist()
+        self.shape = (height, width, 3)
+
+        size = height * width * 3
+        self.frames = [np.ndarray(self.shape, dtype=np.uint8, buffer=shm.buf, offset=self.HEADER + i * size)
+                       for i in range(2)]
+
+        self.flushed = None  # seq of the last frame flush() sent
+
+    @classmethod
+    def create(cls, shape=(8, 8), name=None):
+        """
+        Creates a new block for frames of ( <height>, <width> ), e.g. a Canvas' size.
+        """
+
+        height, width = shape
+        shm = shared_memory.SharedMemory(name=name, create=True, size=cls.HEADER + 2 * height * width * 3)
+        np.ndarray((2,), dtype=np.uint32, buffer=shm.buf, offset=8)[:] = (height, width)
+        np.ndarray((1,), dtype=np.uint64, buffer=shm.buf, offset=0)[0] = 0
+        cls._created.add(shm.name)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        """
+        Attaches to an existing block by its <name>.
+        """
+
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # before Python 3.13, attaching registers the block with this process'
+            # resource tracker, which would unlink it when this process exits
+            shm = shared_memory.SharedMemory(name=name)
+            # unless it's the creator's own registration, in this process
+            if shm.name not in cls._created:
+                try:
+                    resource_tracker.unregister(shm._name, 'shared_memory')
+                except Exception:
+                    pass
+        return cls(shm)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def seq(self):
+        return int(self._seq[0])
+
+    # -------------------------------------------------------------------------------------
+    # -- writer
+    # -------------------------------------------------------------------------------------
+    def begin(self):
+        """
+        Starts a new frame and returns the back frame to draw into, as a writable view.
+        It still holds the frame before the current one.
+        """
+
+        seq = self.seq
+        if seq % 2 == 0:
+            self._seq[0] = seq + 1
+        return self.frames[(seq // 2 + 1) % 2]
+
+    def publish(self):
+        """
+        Makes the frame started with begin() the front frame.
+        """
+
+        seq = self.seq
+        if seq % 2:
+            self._seq[0] = seq + 1
+
+    def write(self, frame):
+        """
+        Copies <frame> into the back frame and publishes it.
+        """
+
+        self.begin()[:] = frame
+        self.publish()
+
+    # -------------------------------------------------------------------------------------
+    # -- reader
+    # -------------------------------------------------------------------------------------
+    def read(self):
+        """
+        Returns ( <seq>, <view> ) of the latest published frame. The view is not a copy;
+        check it with valid( <seq> ) after using it.
+        """
+
+        seq = self.seq & ~1
+        return seq, self.frames[(seq // 2) % 2]
+
+    def valid(self, seq):
+        """
+        True if the frame read() returned with <seq> wasn't touched since then.
+        """
+
+        return self.seq <= seq + 2
+
+    def flush(self, fb, retries=3):
+        """
+        Submits the latest published frame to <fb> (anything with submit(), e.g. a
+        FrameBuffer), if it's new. Returns the number of pads sent.
+        The frame is copied and only submitted if the copy is complete; if all <retries>
+        read a torn frame, nothing is sent and the next flush() tries again.
+        """
+
+        for _ in range(retries):
+            seq, frame = self.read()
+            if seq == 0 or seq == self.flushed:
+                # nothing published yet, or nothing new
+                return 0
+            frame = frame.copy()
+            if self.valid(seq):
+                self.flushed = seq
+                return fb.submit(frame)
+
+        return 0
+
+    def close(self):
+        """
+        Detaches; the creator also frees the block.
+        """
+
+        self._seq = None
+        self.frames = None
+        self.shm.close()
+        if self.owner:
+            self._created.discard(self.shm.name)
+            self.shm.unlink()
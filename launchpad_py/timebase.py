@@ -0,0 +1,128 @@
+import heapq
+import time
+from collections import deque
+
+from launchpad_py.midi import Midi
+
+__all__ = ['ClockAligner', 'merge_events']
+
+
+class ClockAligner(object):
+    """
+    Maps PortMidi time (ms; Midi.GetTime() and the timestamps of all input events)
+    onto the host's time.monotonic_ns() and back.
+
+    Both clocks run independently, so next to their offset, the drift between them is
+    estimated by a linear fit over the last <window> pairs of readings. Samples are
+    taken automatically, every <interval_s> seconds, whenever a time is converted,
+    or manually via sample().
+    """
+
+    # no drift estimation below that; PortMidi's 1ms resolution would dominate it
+    MIN_DRIFT_SPAN_MS = 10000
+
+    def __init__(self, time_func=None, window=32, interval_s=1.0):
+        """
+        <time_func> returns the PortMidi time in ms; Midi.GetTime(), if omitted.
+        """
+
+        if time_func is None:
+            time_func = Midi().GetTime
+
+        self.time_func = time_func
+        self.interval_ns = int(interval_s * 1e9)
+
+        self._samples = deque(maxlen=max(int(window), 2))  # (midi ms, host ns)
+        self._last_sample = None  # host time of the last attempt
+        self._best_spread = None  # shortest time a reading ever took
+        self._fit = None  # (midi ms, host ns, ns per ms)
+
+    def sample(self):
+        """
+        Reads both clocks once and updates the estimate.
+        Returns False if the sample was rejected, because reading the MIDI time took
+        way longer than usual (the thread was most likely preempted in between).
+        """
+
+        t0 = time.monotonic_ns()
+        m = self.time_func()
+        t1 = time.monotonic_ns()
+        self._last_sample = t1
+
+        spread = t1 - t0
+        if self._best_spread is None or spread < self._best_spread:
+            self._best_spread = spread
+        if spread > 4 * self._best_spread + 20000:
+            return False
+
+        # PortMidi truncates to full ms, so on average the real time is half a ms later
+        self._samples.append((m + 0.5, (t0 + t1) / 2.0))
+
+        n = len(self._samples)
+        mean_m = sum(s[0] for s in self._samples) / n
+        mean_h = sum(s[1] for s in self._samples) / n
+
+        slope = 1e6
+        if self._samples[-1][0] - self._samples[0][0] >= self.MIN_DRIFT_SPAN_MS:
+            smm = sum((s[0] - mean_m) ** 2 for s in self._samples)
+            smh = sum((s[0] - mean_m) * (s[1] - mean_h) for s in self._samples)
+            slope = smh / smm
+
+        self._fit = (mean_m, mean_h, slope)
+        return True
+
+    def _current_fit(self):
+        if self._fit is None or time.monotonic_ns() - self._last_sample >= self.interval_ns:
+            self.sample()
+        # very first sample rejected? Can't happen, but anyway...
+        while self._fit is None:
+            self.sample()
+        return self._fit
+
+    def to_host_ns(self, midi_ms):
+        """
+        Converts a PortMidi time or event timestamp <midi_ms> to time.monotonic_ns().
+        """
+
+        mean_m, mean_h, slope = self._current_fit()
+        return int(mean_h + (midi_ms - mean_m) * slope)
+
+    def to_midi_ms(self, host_ns):
+        """
+        Converts a time.monotonic_ns() value <host_ns> to PortMidi time (ms, float).
+        """
+
+        mean_m, mean_h, slope = self._current_fit()
+        return mean_m + (host_ns - mean_h) / slope
+
+    def offset_ns(self):
+        """
+        Returns the current offset time.monotonic_ns() - PortMidi time, in ns.
+        """
+
+        mean_m, mean_h, _ = self._current_fit()
+        return int(mean_h - mean_m * 1e6)
+
+    def drift_ppm(self):
+        """
+        Returns the estimated drift of the PortMidi clock against the host clock in ppm;
+        positive if PortMidi runs slower. 0.0 until enough samples were taken.
+        """
+
+        return (self._current_fit()[2] / 1e6 - 1.0) * 1e6
+
+
+def merge_events(*streams, key=None):
+    """
+    Merges several event lists or iterables, each sorted by time, into one list in true order.
+    By default, the timestamp is expected as the last element of each event, which
+    matches the raw events ( [ [<data>], <timestamp> ] ) as well as the lists returned
+    by the button state methods with "returnTimestamp=True".
+    Events from different processes or machines should be converted to a common
+    time base (see ClockAligner.to_host_ns()) and passed with an appropriate <key>.
+    """
+
+    if key is None:
+        key = lambda e: e[-1]
+
+    return list(heapq.merge(*streams, key=key))
@@ -0,0 +1,167 @@
+import time
+
+import numpy as np
+
+from launchpad_py.framebuffer import FrameBuffer
+
+__all__ = ['Transition', 'crossfade', 'wipe', 'dissolve']
+
+
+def crossfade(a, b, p):
+    """
+    Linear blend of frames <a> and <b>, <p> = 0.0 (all <a>) .. 1.0 (all <b>).
+    """
+
+    a = np.asarray(a, dtype=np.float32)
+    return a + (np.asarray(b, dtype=np.float32) - a) * p
+
+
+def wipe(a, b, p, direction="left"):
+    """
+    <b> pushes <a> out, column by column (or row by row), coming in from the
+    <direction> "left", "right", "top" or "bottom".
+    """
+
+    a = np.asarray(a, dtype=np.float32)
+    b = np.asarray(b, dtype=np.float32)
+    height, width = a.shape[:2]
+
+    if direction in ("left", "right"):
+        pos = np.arange(width)[np.newaxis, :] + 0.5
+        size = width
+    else:
+        pos = np.arange(height)[:, np.newaxis] + 0.5
+        size = height
+    if direction in ("right", "bottom"):
+        pos = size - pos
+
+    mask = np.broadcast_to(pos <= p * size, (height, width))
+    return np.where(mask[..., np.newaxis], b, a)
+
+
+def dissolve(a, b, p, order):
+    """
+    Switches pads from <a> to <b> in random <order>, an array of the frames' height and
+    width with values 0.0..1.0 (e.g. numpy.random.random()); pads below <p> show <b>.
+    """
+
+    return np.where((np.asarray(order) < p)[..., np.newaxis], np.asarray(b, dtype=np.float32),
+                    np.asarray(a, dtype=np.float32))
+
+
+class Transition(object):
+    """
+    Plays a transition from one frame to another on a FrameBuffer, without exceeding a
+    byte <budget> per frame interval (1 / <fps>).
+
+    A transition is planned as <duration_ms> * <fps> steps first. If a step costs more
+    than the budget, the intensities of the intermediate frames are quantized more
+    coarsely (steps of 2, 4, 8), so fewer pads change per step, and if that isn't
+    enough, the number of steps is reduced, which gives each step the budget of several
+    frame intervals. Either way, the last frame is exactly the target frame, and it's
+    shown after <duration_ms>.
+
+    Costs are estimated with the FrameBuffer's planner, if it has one, or as
+    <bytes_per_pad> (one LedCtrlRaw()) per changed pad.
+    """
+
+    QUANTIZATION = (1, 2, 4, 8)
+
+    def __init__(self, target, budget=None, fps=30, bytes_per_pad=12, seed=None):
+        """
+        <target> is a device or a FrameBuffer. Without a <budget>, all steps are sent.
+        """
+
+        if hasattr(target, 'submit'):
+            self.target = target
+        else:
+            self.target = FrameBuffer(target)
+
+        self.budget = budget
+        self.fps = fps
+        self.bytes_per_pad = bytes_per_pad
+        self.rng = np.random.default_rng(seed)
+
+        self.steps = 0  # of the last plan()
+        self.quantization = 1
+
+    def _cost(self, old, new):
+        planner = getattr(self.target, 'planner', None)
+        if planner is not None:
+            return planner.plan_grid(old, new)[1]
+        if old is None:
+            return new.shape[0] * new.shape[1] * self.bytes_per_pad
+        return int((old != new).any(axis=2).sum()) * self.bytes_per_pad
+
+    def _frames(self, func, steps, q, b):
+        frames = []
+        for i in range(1, steps):
+            frame = func(i / float(steps))
+            if q > 1:
+                frame = np.round(frame / q) * q
+            frames.append(np.clip(frame + 0.5, 0, 63).astype(np.uint8))
+        frames.append(np.clip(np.asarray(b), 0, 63).astype(np.uint8))
+        return frames
+
+    def plan(self, a, b, kind="crossfade", duration_ms=200, direction="left"):
+        """
+        Returns the list of frames for a transition from <a> to <b>, <kind> being
+        "crossfade", "wipe" or "dissolve"; the first is shown after one step,
+        the last one is <b>.
+        """
+
+        if kind == "crossfade":
+            func = lambda p: crossfade(a, b, p)
+        elif kind == "wipe":
+            func = lambda p: wipe(a, b, p, direction)
+        elif kind == "dissolve":
+            order = self.rng.random(np.asarray(a).shape[:2])
+            func = lambda p: dissolve(a, b, p, order)
+        else:
+            raise ValueError("unknown transition " + repr(kind))
+
+        intervals = max(int(duration_ms * self.fps / 1000.0), 1)
+        start = self.target.frame if getattr(self.target, 'frame', None) is not None else \
+            np.clip(np.asarray(a), 0, 63).astype(np.uint8)
+
+        frames = None
+        for steps in range(intervals, 0, -1):
+            allowed = None if self.budget is None else self.budget * intervals / float(steps)
+            for q in self.QUANTIZATION:
+                frames = self._frames(func, steps, q, b)
+                if allowed is None:
+                    break
+
+                prev = start
+                for frame in frames:
+                    if self._cost(prev, frame) > allowed:
+                        break
+                    prev = frame
+                else:
+                    break
+            else:
+                continue
+
+            self.steps = steps
+            self.quantization = q
+            return frames
+
+        # even a single step is too much; nothing left to trade, just switch
+        self.steps = 1
+        self.quantization = 1
+        return frames
+
+    def run(self, a, b, kind="crossfade", duration_ms=200, direction="left"):
+        """
+        Plans and plays a transition, see plan(). Blocks for <duration_ms>.
+        """
+
+        frames = self.plan(a, b, kind, duration_ms, direction)
+
+        period = duration_ms / 1000.0 / len(frames)
+        start = time.perf_counter()
+        for i, frame in enumerate(frames):
+            left = start + (i + 1) * period - time.perf_counter()
+            if left > 0:
+                time.sleep(left)
+            self.target.submit(frame)
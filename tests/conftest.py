@@ -0,0 +1,34 @@
+import pytest
+
+from launchpad_py.emulator import Emulator
+from launchpad_py.launchpad_pro import LaunchpadPro
+from launchpad_py.launchpad_pro_mk3 import LaunchpadProMk3
+
+MODELS = {'pro': LaunchpadPro, 'promk3': LaunchpadProMk3}
+
+
+@pytest.fixture(params=sorted(MODELS))
+def model(request):
+    return request.param
+
+
+@pytest.fixture
+def emulated(model):
+    """
+    ( <device>, <emulator> ) of the parametrized model; the writer thread is stopped afterwards.
+    """
+
+    emulator = Emulator(model)
+    device = emulator.attach(MODELS[model]())
+    yield device, emulator
+    device.midi.StopWriter()
+    emulator.close()
+
+
+@pytest.fixture
+def pro():
+    emulator = Emulator("pro")
+    device = emulator.attach(LaunchpadPro())
+    yield device, emulator
+    device.midi.StopWriter()
+    emulator.close()
@@ -0,0 +1,58 @@
+import time
+
+import numpy as np
+
+from launchpad_py.daemon import Client, Daemon
+
+
+def _wait(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+def test_frame_and_event_round_trip(pro, tmp_path):
+    device, emulator = pro
+    daemon = Daemon(device, str(tmp_path / "launchpad.sock"), fps=200)
+    daemon.start()
+    client = Client(daemon.path)
+    try:
+        frame = np.zeros((8, 8, 3), dtype=np.uint8)
+        frame[2, 5] = (63, 10, 0)
+        client.frame(frame)
+        assert _wait(lambda: (emulator.grid() == frame).all())
+
+        client.subscribe()
+        assert _wait(lambda: any(c.mask for c in list(daemon.clients.values())))
+        emulator.press(11, 100)
+
+        events = []
+        assert _wait(lambda: events.extend(client.events(0.01)) or events)
+        assert events[0][:2] == (11, 100)
+    finally:
+        client.close()
+        daemon.stop()
+
+
+def test_two_clients_are_composited(pro, tmp_path):
+    device, emulator = pro
+    daemon = Daemon(device, str(tmp_path / "launchpad.sock"), fps=200)
+    daemon.start()
+    below = Client(daemon.path)
+    above = Client(daemon.path)
+    try:
+        below.frame(np.full((8, 8, 3), 20), z=0)
+        pixels = np.zeros((1, 1, 4))
+        pixels[0, 0] = (63, 0, 0, 255)
+        above.frame(pixels, z=1, x=3, y=4)
+
+        expected = np.full((8, 8, 3), 20, dtype=np.uint8)
+        expected[4, 3] = (63, 0, 0)
+        assert _wait(lambda: (emulator.grid() == expected).all())
+    finally:
+        below.close()
+        above.close()
+        daemon.stop()
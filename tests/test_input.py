@@ -0,0 +1,21 @@
+def test_read_sysex_keeps_events_after_f7(pro):
+    device, emulator = pro
+    device.midi.RawWriteSysEx(device.IDENTITY_REQUEST)
+    emulator.press(11)
+    emulator.press(12, 64)
+
+    reply = device.read_sysex(100)
+
+    assert device.is_identity_reply(reply)
+    assert device.ButtonStateRaw() == [11, 127]
+    assert device.ButtonStateRaw() == [12, 64]
+    assert device.ButtonStateRaw() == []
+
+
+def test_events_before_the_reply_are_kept(pro):
+    device, emulator = pro
+    emulator.press(11)
+    device.midi.RawWriteSysEx(device.IDENTITY_REQUEST)
+
+    assert device.read_sysex(100) is not None
+    assert device.ButtonStateRaw() == [11, 127]
@@ -0,0 +1,83 @@
+import threading
+
+from launchpad_py.midi import Midi
+
+
+def _record(emulator):
+    sent = []
+    write_short = emulator.write_short
+
+    def record(status, data1=0, data2=0):
+        sent.append((status, data1, data2))
+        write_short(status, data1, data2)
+
+    emulator.write_short = record
+    return sent
+
+
+def _block_writer(midi):
+    # the writer sends this first and waits in it, so everything after it piles up
+    release = threading.Event()
+    midi._send(release.wait, ())
+    return release
+
+
+def test_interactive_overtakes_bulk(pro):
+    device, emulator = pro
+    sent = _record(emulator)
+    midi = device.midi
+    midi.StartWriter()
+
+    release = _block_writer(midi)
+    with midi.Lane(Midi.BULK):
+        midi.RawWrite(144, 11, 1, key=11)
+    midi.RawWrite(144, 12, 2)
+    with midi.Lane(Midi.INTERACTIVE):
+        midi.RawWrite(144, 13, 3)
+    release.set()
+
+    assert midi.Flush(2)
+    assert sent == [(144, 13, 3), (144, 12, 2), (144, 11, 1)]
+
+
+def test_bulk_supersede_keeps_order(pro):
+    device, emulator = pro
+    midi = device.midi
+    midi.StartWriter()
+
+    release = _block_writer(midi)
+    with midi.Lane(Midi.BULK):
+        device.LedCtrlRaw(11, 63, 0, 0)
+        device.LedAllOn(0)
+        device.LedCtrlRaw(11, 0, 63, 0)
+    release.set()
+
+    assert midi.Flush(2)
+    assert emulator.rgb[11].tolist() == [0, 63, 0]
+    assert midi.laneStats[Midi.BULK].superseded == 1
+
+
+def test_stop_writer_sends_everything(pro):
+    device, emulator = pro
+    midi = device.midi
+    midi.StartWriter()
+
+    for i in range(200):
+        midi.RawWrite(144, 11, i % 128)
+    messages = emulator.messages
+    midi.StopWriter()
+
+    assert emulator.messages >= messages
+    assert emulator.codes[11] == 199 % 128
+
+
+def test_writer_survives_errors(pro):
+    device, emulator = pro
+    midi = device.midi
+    midi.StartWriter()
+
+    midi._send(lambda: 1 / 0, ())
+    device.LedCtrlRaw(11, 1, 2, 3)
+
+    assert midi.Flush(2)
+    assert emulator.rgb[11].tolist() == [1, 2, 3]
@@ -0,0 +1,60 @@
+import numpy as np
+
+from launchpad_py import palette
+from launchpad_py.framebuffer import FrameBuffer
+from launchpad_py.planner import Planner
+
+
+def test_rgb_frames_arrive_exactly(emulated):
+    device, emulator = emulated
+    fb = FrameBuffer(device, planner=Planner.for_device(device))
+    rng = np.random.default_rng(1)
+
+    frame = rng.integers(0, 64, (8, 8, 3), dtype=np.uint8)
+    for _ in range(5):
+        fb.submit(frame)
+        assert (emulator.grid() == frame).all()
+        # change a few pads
+        frame = frame.copy()
+        frame[rng.integers(0, 8, 6), rng.integers(0, 8, 6)] = rng.integers(0, 64, 3)
+
+
+def test_palette_frames_arrive_exactly(emulated):
+    device, emulator = emulated
+    planner = Planner.for_device(device, dict(enumerate(palette.PALETTE.tolist())))
+    fb = FrameBuffer(device, planner=planner)
+    rng = np.random.default_rng(2)
+
+    # mostly one color, plus stripes and specks, so fills, rows and columns get used
+    frame = np.empty((8, 8, 3), dtype=np.uint8)
+    frame[:] = palette.PALETTE[5]
+    frame[2] = palette.PALETTE[21]
+    frame[:, 6] = palette.PALETTE[45]
+    frame[rng.integers(0, 8, 5), rng.integers(0, 8, 5)] = palette.PALETTE[13]
+    frame[0, 0] = (1, 2, 3)
+
+    fb.submit(frame)
+    assert (emulator.grid() == frame).all()
+
+    leds = emulator.rgb.reshape(10, 10, 3)
+    outer = np.ones((10, 10), dtype=bool)
+    outer[1:9, 1:9] = False
+    # the corners that have no LED may get the fill color
+    outer &= planner.valid
+    assert (leds[outer] == 0).all()
+
+
+def test_plan_cost_matches_bytes_sent(emulated):
+    device, emulator = emulated
+    planner = Planner.for_device(device)
+    rng = np.random.default_rng(3)
+    old = rng.integers(0, 64, (8, 8, 3))
+    new = old.copy()
+    new[3] = 0
+
+    planner.execute(device, planner.plan_grid(None, old)[0])
+    sent = emulator.bytes
+    commands, cost = planner.plan_grid(old, new)
+    planner.execute(device, commands)
+
+    assert emulator.bytes - sent == cost
@@ -0,0 +1,85 @@
+import numpy as np
+
+from launchpad_py.sharedframe import SharedFrameBuffer
+
+
+class Target(object):
+
+    def __init__(self):
+        self.frames = []
+
+    def submit(self, frame):
+        self.frames.append(frame.copy())
+        return 1
+
+
+def test_write_read_valid():
+    owner = SharedFrameBuffer.create()
+    renderer = SharedFrameBuffer.attach(owner.name)
+    try:
+        assert owner.read()[0] == 0
+
+        renderer.write(np.full((8, 8, 3), 5, dtype=np.uint8))
+        seq, frame = owner.read()
+        assert seq == 2
+        assert (frame == 5).all()
+        assert owner.valid(seq)
+
+        # a frame being drawn doesn't touch the front frame
+        back = renderer.begin()
+        back[:] = 9
+        assert owner.read()[0] == 2
+        assert owner.valid(seq)
+        renderer.publish()
+        assert owner.valid(seq)
+
+        # the next one is drawn into the frame read before
+        renderer.begin()
+        assert not owner.valid(seq)
+        renderer.publish()
+        seq, frame = owner.read()
+        assert seq == 6
+    finally:
+        renderer.close()
+        owner.close()
+
+
+def test_flush_sends_new_frames_once():
+    owner = SharedFrameBuffer.create((8, 16))
+    renderer = SharedFrameBuffer.attach(owner.name)
+    target = Target()
+    try:
+        assert owner.flush(target) == 0
+
+        renderer.write(np.full((8, 16, 3), 7, dtype=np.uint8))
+        assert owner.flush(target) == 1
+        assert owner.flush(target) == 0
+        assert len(target.frames) == 1
+        assert target.frames[0].shape == (8, 16, 3)
+        assert (target.frames[0] == 7).all()
+    finally:
+        renderer.close()
+        owner.close()
+
+
+def test_flush_never_submits_torn_frames():
+    owner = SharedFrameBuffer.create()
+    renderer = SharedFrameBuffer.attach(owner.name)
+    target = Target()
+    try:
+        renderer.write(np.zeros((8, 8, 3), dtype=np.uint8))
+        # the writer overtakes the reader on every read
+        read = owner.read
+
+        def racing_read():
+            ret = read()
+            renderer.write(np.ones((8, 8, 3), dtype=np.uint8))
+            renderer.begin()
+            return ret
+
+        owner.read = racing_read
+        assert owner.flush(target, retries=3) == 0
+        assert target.frames == []
+    finally:
+        renderer.close()
+        owner.close()